@@ -0,0 +1,216 @@
+# backend/admission.py
+
+"""
+Admission control for CPU-heavy endpoints.
+
+Under a burst of `/match` uploads, starting every parse and TF-IDF fit at
+once makes them all slow down together. `AdmissionController` lets at most
+`max_concurrent` requests run; up to `max_queue` more wait in FIFO order for
+at most `queue_timeout` seconds (or the request deadline, if sooner). The
+rest are turned away straight away, so the requests that are admitted keep
+running at full speed:
+
+- queue full: HTTP 429 with `Retry-After`
+- waited too long: HTTP 503 with `Retry-After`
+
+`Retry-After` is estimated from the recent average service time and the
+queue ahead. Work that outlives the request (a parse thread abandoned at the
+deadline) keeps its slot through `Admission.hold_until`, so abandoned
+threads cannot pile up beyond `max_concurrent`. The controller is per
+process (one per gunicorn worker) and must be used from the event loop.
+
+Metrics: `admission_in_flight`, `admission_queue_depth`,
+`admission_wait_seconds` and `admission_rejections_total{reason}`, all
+labelled by endpoint.
+"""
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Deque, Optional
+
+from .metrics import REGISTRY
+
+# Default: split the cores between the gunicorn workers sharing this host
+MATCH_CONCURRENCY = int(os.getenv(
+    "MATCH_CONCURRENCY",
+    str(max(1, (os.cpu_count() or 2) // max(1, int(os.getenv("WEB_CONCURRENCY", "1"))))),
+))
+MATCH_QUEUE_SIZE = int(os.getenv("MATCH_QUEUE_SIZE", "16"))
+MATCH_QUEUE_TIMEOUT_SECONDS = float(os.getenv("MATCH_QUEUE_TIMEOUT_SECONDS", "10"))
+
+# Bounds for the Retry-After hint, in seconds
+RETRY_AFTER_MIN = 1
+RETRY_AFTER_MAX = 60
+# Weight of the newest sample in the service-time moving average
+SERVICE_TIME_ALPHA = 0.2
+
+ADMISSION_IN_FLIGHT = REGISTRY.gauge(
+    "admission_in_flight", "Requests currently admitted, by endpoint."
+)
+ADMISSION_QUEUE_DEPTH = REGISTRY.gauge(
+    "admission_queue_depth", "Requests waiting for admission, by endpoint."
+)
+ADMISSION_WAIT_SECONDS = REGISTRY.histogram(
+    "admission_wait_seconds", "Time admitted requests spent queued, by endpoint."
+)
+ADMISSION_REJECTIONS = REGISTRY.counter(
+    "admission_rejections_total",
+    "Requests turned away by admission control, by endpoint and reason (queue_full/timeout).",
+)
+
+
+class AdmissionRejected(Exception):
+    """The request was not admitted; answer with `status_code` and `Retry-After`."""
+
+    def __init__(self, status_code: int, reason: str, retry_after: int):
+        super().__init__(f"{reason}; retry after {retry_after}s")
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Admission:
+    """An admitted request's slot, yielded by `AdmissionController.admit`."""
+
+    def __init__(self):
+        self.pending: Optional[asyncio.Future] = None
+
+    def hold_until(self, future: asyncio.Future) -> None:
+        """Keep the slot past the end of the block until `future` is done."""
+        self.pending = future
+
+
+class AdmissionController:
+    """
+    Bounded concurrency with a bounded, timed FIFO wait queue.
+
+    Args:
+        name: Endpoint label for metrics
+        max_concurrent: Requests allowed to run at once
+        max_queue: Requests allowed to wait; further ones get 429
+        queue_timeout: Longest wait before a 503
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int = MATCH_CONCURRENCY,
+        max_queue: int = MATCH_QUEUE_SIZE,
+        queue_timeout: float = MATCH_QUEUE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self.clock = clock
+        self.service_time = 1.0
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up for a new request."""
+        ahead = self.queued + 1
+        estimate = math.ceil(self.service_time * ahead / self.max_concurrent)
+        return max(RETRY_AFTER_MIN, min(RETRY_AFTER_MAX, estimate))
+
+    @asynccontextmanager
+    async def admit(self, timeout: Optional[float] = None) -> AsyncIterator[Admission]:
+        """
+        Hold a slot for the duration of the block (or longer, see `Admission.hold_until`).
+
+        Args:
+            timeout: Longest wait, if shorter than `queue_timeout` (e.g. the
+                time left on the request deadline)
+
+        Raises:
+            AdmissionRejected: 429 if the queue is full, 503 on timeout
+        """
+        await self._acquire(timeout)
+        started = self.clock()
+        admission = Admission()
+        try:
+            yield admission
+        finally:
+            pending = admission.pending
+            if pending is not None and not pending.done():
+                pending.add_done_callback(lambda future: self._finish(started, future))
+            else:
+                self._finish(started)
+
+    def _finish(self, started: float, future: Optional[asyncio.Future] = None) -> None:
+        if future is not None and not future.cancelled():
+            # Nobody awaits held work any more; retrieve its outcome so it is not logged
+            future.exception()
+        elapsed = self.clock() - started
+        self.service_time += SERVICE_TIME_ALPHA * (elapsed - self.service_time)
+        self._release()
+
+    async def _acquire(self, timeout: Optional[float]) -> None:
+        if self._active < self.max_concurrent and not self.queued:
+            self._active += 1
+            ADMISSION_WAIT_SECONDS.observe(0.0, endpoint=self.name)
+            self._report()
+            return
+        if self.queued >= self.max_queue:
+            self._reject(429, "queue_full")
+
+        limit = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._report()
+        queued_at = self.clock()
+        try:
+            await asyncio.wait_for(waiter, timeout=max(0.0, limit))
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as the wait timed out
+                self._release()
+            self._discard(waiter)
+            self._reject(503, "timeout")
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            self._discard(waiter)
+            raise
+        ADMISSION_WAIT_SECONDS.observe(self.clock() - queued_at, endpoint=self.name)
+        self._discard(waiter)
+
+    def _release(self) -> None:
+        # Hand the slot straight to the oldest live waiter, if any
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._report()
+                return
+        self._active -= 1
+        self._report()
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._report()
+
+    def _reject(self, status_code: int, reason: str) -> None:
+        ADMISSION_REJECTIONS.inc(endpoint=self.name, reason=reason)
+        raise AdmissionRejected(status_code, reason, self.retry_after())
+
+    def _report(self) -> None:
+        ADMISSION_IN_FLIGHT.set(self._active, endpoint=self.name)
+        ADMISSION_QUEUE_DEPTH.set(self.queued, endpoint=self.name)
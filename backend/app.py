@@ -1,26 +1,66 @@
 # backend/app.py
-import json
+import asyncio
 import logging
 import os
-import shutil
-import tempfile
+import time
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, BinaryIO, Optional, Union
 
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import FastAPI, File, Form, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 
-from .job_fetcher import fetch_jobs_from_api, fetch_random_jobs
+from .admission import AdmissionController, AdmissionRejected
+from .deadline import Deadline
+from .harvester import get_harvester
+from .job_fetcher import fetch_jobs_cached, fetch_random_jobs
+from .job_store import get_job_store
+from .match_store import MatchStore
+from .metrics import (
+    REQUEST_SECONDS,
+    REQUESTS_TOTAL,
+    record_cache_lookup,
+    render_prometheus,
+    span,
+)
+from .mlflow_exporter import get_exporter
 from .nlp_model.resume_parser import ResumeParser
-from .nlp_model_stub import recommend_jobs
+from .nlp_model_stub import rescore, score_jobs
+from .payloads import compact, hydrate, parse_fields, project_all
+from .scoring_profiles import get_profile
+from .state_store import get_state_store
+from .warmup import readiness, start_warm_up
+
+# Optional fast JSON serialization
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
+# Optional brotli compression (falls back to gzip for clients without "br")
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
 UploadedResume = Annotated[UploadFile, File(...)]
+FieldsParam = Annotated[
+    Optional[str],
+    Query(description="Comma-separated result fields, or 'full' for complete job objects"),
+]
 
 BASE_DIR = Path(__file__).resolve().parent
-CACHE_PATH = BASE_DIR / "cache.json"
 STATIC_DIR = BASE_DIR / "static"
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK_BYTES = 64 * 1024
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+# State-store slot holding the latest compact result list for /match/more
+RESULTS_NAMESPACE = "results"
+LATEST_RESULTS_KEY = "latest"
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +68,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+app = FastAPI(default_response_class=DefaultResponse)
+match_store = MatchStore()
+match_admission = AdmissionController("match")
 
 app.add_middleware(
     CORSMiddleware,
@@ -38,19 +80,104 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESS_MIN_BYTES)
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count requests and record latency per route template."""
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or "unmatched"
+        REQUESTS_TOTAL.inc(route=path, method=request.method, status=str(status))
+        REQUEST_SECONDS.observe(time.perf_counter() - start, route=path)
+
+def open_upload(stream: BinaryIO, limit: int) -> Optional[Union[BinaryIO, memoryview]]:
+    """
+    Return a parser-ready view of an upload, or None if it exceeds `limit` bytes.
+
+    Seekable spooled uploads are size-checked in place and handed over as-is,
+    so the bytes are never copied. Other streams are read in chunks and
+    rejected as soon as the limit is crossed.
+    """
+    if stream.seekable():
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        return stream if size <= limit else None
+
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return memoryview(buffer)
+        buffer += chunk
+        if len(buffer) > limit:
+            return None
+
+@app.on_event("startup")
+def begin_warm_up():
+    """Warm up in the background (a no-op in workers forked from a warmed gunicorn master)."""
+    start_warm_up()
+
+@app.on_event("startup")
+def start_harvester():
+    """Start prefetching popular searches, if HARVEST_INTERVAL_SECONDS is set."""
+    get_harvester().start()
+
+@app.on_event("shutdown")
+def flush_telemetry():
+    """Give queued MLflow runs a chance to export before the process exits."""
+    get_exporter().shutdown()
+
+@app.on_event("shutdown")
+def stop_harvester():
+    """Stop the harvest loop with the process."""
+    get_harvester().stop()
+
+def bad_request(err: Exception) -> JSONResponse:
+    """Uniform 400 body for invalid parameters."""
+    return JSONResponse(status_code=400, content={"error": str(err), "results": []})
+
 @app.get("/jobs/random")
-def get_random_jobs():
+def get_random_jobs(fields: FieldsParam = None):
     """Return a random job feed for the landing page."""
+    try:
+        projection = parse_fields(fields)
+    except ValueError as err:
+        return bad_request(err)
     logger.info("Fetching random jobs for homepage feed.")
     results = fetch_random_jobs()
-    return {"results": results}
+    return {"results": project_all(results, projection)}
 
 @app.get("/jobs/search")
-def search_jobs(title: str, location: str):
+def search_jobs(title: str, location: str, fields: FieldsParam = None):
     """Search jobs from the external API."""
+    try:
+        projection = parse_fields(fields)
+    except ValueError as err:
+        return bad_request(err)
     logger.info("Searching jobs for title=%s, location=%s", title, location)
-    results = fetch_jobs_from_api(title, location)
-    return {"results": results}
+    get_harvester().record(title, location)
+    deadline = Deadline()
+    results = fetch_jobs_cached(title, location, deadline)
+    return {"results": project_all(results, projection), "degraded": deadline.degraded}
+
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """Return the full posting (description, extracted skills) for a job ID."""
+    job = get_job_store().get(job_id)
+    record_cache_lookup("job_store", hit=job is not None)
+    if job is None:
+        return JSONResponse(status_code=404, content={"error": "Unknown job id"})
+    return job
 
 @app.post("/match")
 async def match_resume(
@@ -58,65 +185,192 @@ async def match_resume(
     title: str = Form(...),
     location: Optional[str] = Form(None),
     experience: Optional[str] = Form(None),
+    profile: Optional[str] = Form(None),
+    fields: FieldsParam = None,
 ):
     """Match a resume to jobs and return scored recommendations."""
+    deadline = Deadline()
     logger.info(
-        "Received match request title=%s, location=%s, experience=%s",
+        "Received match request title=%s, location=%s, experience=%s, profile=%s",
         title,
         location or "",
         experience or "",
+        profile or "",
     )
-    # --- Step 1: safely handle file upload ---
-    suffix = os.path.splitext(file.filename)[1]
-    
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        shutil.copyfileobj(file.file, tmp)
-        tmp_path = tmp.name
+    try:
+        scoring_profile = get_profile(profile)
+        projection = parse_fields(fields)
+    except ValueError as err:
+        return bad_request(err)
+    get_harvester().record(title, location or "")
+
+    # --- Step 1: read the upload from its spooled buffer (size-limited) ---
+    with span("upload"):
+        upload = open_upload(file.file, MAX_UPLOAD_BYTES)
+    if upload is None:
+        logger.warning("Rejected upload %s: larger than %d bytes", file.filename, MAX_UPLOAD_BYTES)
+        return JSONResponse(
+            status_code=413,
+            content={
+                "error": f"Resume exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit",
+                "results": [],
+            },
+        )
 
+    # --- Steps 2-5 run only once admitted, so a burst queues instead of thrashing ---
     try:
-        # --- Step 2: extract text from resume ---
-        parser = ResumeParser()
-        try:
-            resume_text = parser.load_resume(tmp_path)
-        except Exception as err:
-            logger.exception("Failed to parse resume: %s", err)
-            return {"error": f"Failed to parse resume: {str(err)}", "results": []}
-    finally:
-        if os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        async with match_admission.admit(timeout=deadline.timeout()) as admission:
+            return await run_match(
+                upload, file.filename, title, location or "", experience or "",
+                scoring_profile, projection, deadline, admission,
+            )
+    except AdmissionRejected as rejected:
+        logger.warning("Match not admitted (%s); retry after %ds",
+                       rejected.reason, rejected.retry_after)
+        return JSONResponse(
+            status_code=rejected.status_code,
+            headers={"Retry-After": str(rejected.retry_after)},
+            content={"error": "Too many match requests in progress; retry later", "results": []},
+        )
+
+async def run_match(upload, file_name, title, location, experience, scoring_profile,
+                    projection, deadline, admission):
+    """Parse, fetch, score and cache one admitted /match request."""
+    # --- Step 2: extract text from resume (in memory, no temp file) ---
+    # Parsed off the event loop; the parser stops at its next deadline check
+    parser = ResumeParser()
+    parse = asyncio.ensure_future(run_in_threadpool(
+        parser.load_resume, upload, file_name=file_name, deadline=deadline,
+    ))
+    # A thread cannot be cancelled: one that outlives the response keeps the slot
+    admission.hold_until(parse)
+    try:
+        with span("load_resume"):
+            resume_text = await asyncio.wait_for(
+                asyncio.shield(parse), timeout=deadline.timeout()
+            )
+    except (asyncio.TimeoutError, TimeoutError):
+        logger.warning("Parsing %s exceeded the request deadline", file_name)
+        deadline.degrade("parse", "timeout")
+        return JSONResponse(
+            status_code=504,
+            content={
+                "error": "Resume parsing exceeded the request deadline",
+                "results": [],
+                "degraded": deadline.degraded,
+            },
+        )
+    except Exception as err:
+        logger.exception("Failed to parse resume: %s", err)
+        return {"error": f"Failed to parse resume: {str(err)}", "results": []}
 
     # --- Step 3: fetch job postings ---
-    job_list = fetch_jobs_from_api(title, location or "")
+    job_list = await run_in_threadpool(fetch_jobs_cached, title, location, deadline)
 
     # --- Step 4: score jobs across five dimensions ---
-    results = recommend_jobs(
+    state = await run_in_threadpool(
+        score_jobs,
         resume_text,
         job_list,
         title,
-        location or "",
-        experience or "",
+        location,
+        experience,
+        scoring_profile.name,
+        deadline=deadline,
     )
+    results = state.results
+    match_id = match_store.put(state)
+    # Keep the extracted skills with the stored postings for /jobs/{id}
+    # (one disk transaction, off the event loop)
+    await run_in_threadpool(get_job_store().attach_many, [
+        (job["id"], {"skills": job["skills"]}) for job in state.jobs if job.get("id")
+    ])
 
-    # --- Step 5: cache results and return ---
-    with CACHE_PATH.open("w", encoding="utf-8") as f:
-        json.dump(results, f)
+    # --- Step 5: cache results in the shared state store and return ---
+    with span("cache_write"):
+        get_state_store().set(RESULTS_NAMESPACE, LATEST_RESULTS_KEY, compact(results))
 
     logger.info("Returning %d recommendations", min(len(results), 10))
-    return {"results": results[:10]}
+    if deadline.degraded:
+        logger.warning("Match degraded to meet the deadline: %s", deadline.degraded)
+    return {
+        "match_id": match_id,
+        "profile": state.profile.name,
+        "results": project_all(results[:10], projection),
+        "degraded": deadline.degraded,
+    }
+
+@app.post("/match/{match_id}/rescore")
+def rescore_match(
+    match_id: str,
+    location: Optional[str] = Form(None),
+    experience: Optional[str] = Form(None),
+    profile: Optional[str] = Form(None),
+    fields: FieldsParam = None,
+):
+    """Re-rank a stored match for new preferences or another scoring profile."""
+    try:
+        projection = parse_fields(fields)
+    except ValueError as err:
+        return bad_request(err)
+
+    state = match_store.get(match_id)
+    record_cache_lookup("match_state", hit=state is not None)
+    if state is None:
+        logger.info("Rescore requested for unknown or expired match %s", match_id)
+        return JSONResponse(
+            status_code=404,
+            content={"error": "Unknown or expired match_id", "results": []},
+        )
+
+    try:
+        state = rescore(state, location=location, experience=experience, profile=profile or None)
+    except ValueError as err:
+        return bad_request(err)
+    match_store.put(state, match_id)
+    results = state.results
+
+    with span("cache_write"):
+        get_state_store().set(RESULTS_NAMESPACE, LATEST_RESULTS_KEY, compact(results))
+
+    logger.info("Rescored match %s: returning %d recommendations", match_id, min(len(results), 10))
+    return {
+        "match_id": match_id,
+        "profile": state.profile.name,
+        "results": project_all(results[:10], projection),
+    }
 
 @app.get("/match/more")
-def load_more_matches():
+def load_more_matches(fields: FieldsParam = None):
     """Return cached recommendations from the last match request."""
-    if not CACHE_PATH.exists():
-        logger.warning("Cache file not found when requesting /match/more.")
-        return {"results": []}
     try:
-        with CACHE_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        logger.exception("Failed to load cache.json for /match/more.")
+        projection = parse_fields(fields)
+    except ValueError as err:
+        return bad_request(err)
+    data = get_state_store().get(RESULTS_NAMESPACE, LATEST_RESULTS_KEY)
+    record_cache_lookup("match_results", hit=data is not None)
+    if data is None:
+        logger.warning("No cached results when requesting /match/more.")
         return {"results": []}
-    return {"results": data}
+    # The cached list holds job IDs plus per-result fields; details come from the job store
+    results = hydrate(data, get_job_store().get)
+    return {"results": project_all(results, projection)}
+
+@app.get("/ready")
+def ready():
+    """Readiness probe: 200 once warm-up has finished, 503 before."""
+    status = readiness()
+    if not status["ready"]:
+        return JSONResponse(status_code=503, content=status)
+    return status
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Expose request, stage, upstream and cache metrics in Prometheus text format."""
+    return PlainTextResponse(
+        render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
 
 if STATIC_DIR.is_dir():
     app.mount("/", StaticFiles(directory=str(STATIC_DIR), html=True), name="static")
@@ -0,0 +1,92 @@
+# backend/deadline.py
+
+"""
+Per-request time budget.
+
+`/match` creates one `Deadline` (`REQUEST_DEADLINE_SECONDS`, default 20)
+and passes it through parsing, fetching and scoring. Each stage checks the
+remaining budget and, instead of overrunning, degrades in a defined way:
+
+| Stage       | Degradation                                                   |
+|-------------|---------------------------------------------------------------|
+| `parse`     | Give up on the upload (HTTP 504); there is no partial resume. |
+|             | The parse thread stops at its next check (between PDF pages)  |
+|             | and keeps its admission slot until it has stopped             |
+| `fetch`     | Stop paging and score the pages fetched so far. A page's      |
+|             | upstream call (attempts, backoff, token wait) is bounded by   |
+|             | the budget left after the scoring reserve                     |
+| `tfidf`     | Skip the TF-IDF dimension (scored as 0 for every job)         |
+| `telemetry` | Do not queue the MLflow run                                   |
+
+Every degradation is recorded on the deadline with a short reason
+(`timeout`, `partial_pages`, `skipped`), counted in
+`request_degradations_total`, and returned to the client as
+`"degraded": {stage: reason}`.
+"""
+
+import math
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .metrics import DEGRADATIONS
+
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "20"))
+# Budget kept back for scoring when deciding whether to fetch another page
+DEADLINE_SCORING_RESERVE_SECONDS = float(os.getenv("DEADLINE_SCORING_RESERVE_SECONDS", "1.0"))
+# Minimum budget left to still run the TF-IDF dimension
+DEADLINE_TFIDF_MIN_SECONDS = float(os.getenv("DEADLINE_TFIDF_MIN_SECONDS", "0.25"))
+
+
+class Deadline:
+    """
+    A point in time a request must finish by, plus what was degraded to meet it.
+
+    Args:
+        budget: Seconds from now; None (or <= 0) means unbounded
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(
+        self,
+        budget: Optional[float] = REQUEST_DEADLINE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.clock = clock
+        self.expires_at = clock() + budget if budget and budget > 0 else math.inf
+        self._degraded: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """Seconds left (never negative; `inf` when unbounded)."""
+        return max(0.0, self.expires_at - self.clock())
+
+    def timeout(self) -> Optional[float]:
+        """`remaining()` for APIs taking a timeout, where None means wait forever."""
+        return None if math.isinf(self.expires_at) else self.remaining()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def allows(self, seconds: float) -> bool:
+        """Whether at least `seconds` of budget are left."""
+        return self.remaining() >= seconds
+
+    def degrade(self, stage: str, reason: str) -> None:
+        """Record that `stage` was cut short or skipped (first reason wins)."""
+        with self._lock:
+            if stage in self._degraded:
+                return
+            self._degraded[stage] = reason
+        DEGRADATIONS.inc(stage=stage, reason=reason)
+
+    @property
+    def degraded(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._degraded)
+
+
+def unbounded() -> Deadline:
+    """A deadline that never expires (callers without a budget)."""
+    return Deadline(None)
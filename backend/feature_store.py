@@ -0,0 +1,149 @@
+# backend/feature_store.py
+
+"""
+Memory-mapped on-disk feature store.
+
+Feature matrices are written once as plain `.npy` files: CSR matrices as
+their `data`/`indices`/`indptr` components, dense arrays as float32. Every
+worker opens them with `numpy.load(mmap_mode="r")`, so all uvicorn workers
+share the same pages through the OS page cache instead of each holding a
+private copy on the Python heap, and reads are zero-copy.
+
+Each rebuild is published as a new generation directory. The `CURRENT`
+file names the live generation and is replaced atomically (`os.replace`),
+so readers see either the old or the new generation, never a mix. Readers
+notice the swap on their next `current()` call. Old generations are removed
+after `keep` newer ones exist; on POSIX, workers still mapping a removed
+generation keep reading it until they switch.
+
+Layout:
+
+    <root>/CURRENT                 -> "gen-000002"
+    <root>/gen-000002/meta.json    shapes, dtypes, caller metadata
+    <root>/gen-000002/tfidf.data.npy, tfidf.indices.npy, tfidf.indptr.npy
+    <root>/gen-000002/idf.npy
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "CURRENT"
+META_FILE = "meta.json"
+GENERATION_PREFIX = "gen-"
+KEEP_GENERATIONS = 2
+
+
+class FeatureGeneration:
+    """One published, read-only generation of memory-mapped arrays."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.name = path.name
+        with (path / META_FILE).open("r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        self.meta: Dict[str, Any] = manifest.get("meta", {})
+        self.dense: Dict[str, np.ndarray] = {
+            name: np.load(path / f"{name}.npy", mmap_mode="r") for name in manifest["dense"]
+        }
+        self.sparse: Dict[str, sparse.csr_matrix] = {}
+        for name, shape in manifest["sparse"].items():
+            data, indices, indptr = (
+                np.load(path / f"{name}.{part}.npy", mmap_mode="r")
+                for part in ("data", "indices", "indptr")
+            )
+            self.sparse[name] = sparse.csr_matrix(
+                (data, indices, indptr), shape=tuple(shape), copy=False
+            )
+
+
+class FeatureStore:
+    """Publishes generations under `root` and serves the current one."""
+
+    def __init__(self, root: str, keep: int = KEEP_GENERATIONS):
+        self.root = Path(root)
+        self.keep = max(1, keep)
+        self._current: Optional[FeatureGeneration] = None
+        self._lock = threading.Lock()
+
+    def publish(
+        self,
+        sparse_arrays: Optional[Dict[str, sparse.spmatrix]] = None,
+        dense_arrays: Optional[Dict[str, np.ndarray]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Write a new generation and make it current.
+
+        Returns:
+            The generation name
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        name = f"{GENERATION_PREFIX}{self._next_number():06d}"
+        # Build in a temp dir, then rename: a half-written generation is never visible
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.root))
+        manifest: Dict[str, Any] = {"sparse": {}, "dense": [], "meta": meta or {}}
+        for key, matrix in (sparse_arrays or {}).items():
+            csr = sparse.csr_matrix(matrix)
+            np.save(staging / f"{key}.data.npy", csr.data)
+            np.save(staging / f"{key}.indices.npy", csr.indices)
+            np.save(staging / f"{key}.indptr.npy", csr.indptr)
+            manifest["sparse"][key] = list(csr.shape)
+        for key, array in (dense_arrays or {}).items():
+            np.save(staging / f"{key}.npy", np.asarray(array, dtype=np.float32))
+            manifest["dense"].append(key)
+        with (staging / META_FILE).open("w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(staging, self.root / name)
+
+        pointer = self.root / f".{CURRENT_FILE}.tmp"
+        pointer.write_text(name, encoding="utf-8")
+        os.replace(pointer, self.root / CURRENT_FILE)
+        logger.info("Published feature generation %s in %s", name, self.root)
+        self._collect_garbage(name)
+        return name
+
+    def current_name(self) -> Optional[str]:
+        try:
+            return (self.root / CURRENT_FILE).read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+
+    def current(self) -> Optional[FeatureGeneration]:
+        """Return the live generation, reopening it if a newer one was published."""
+        name = self.current_name()
+        if name is None:
+            return None
+        with self._lock:
+            if self._current is None or self._current.name != name:
+                try:
+                    self._current = FeatureGeneration(self.root / name)
+                except (OSError, ValueError, KeyError) as exc:
+                    logger.warning("Cannot open feature generation %s: %s", name, exc)
+                    return self._current
+            return self._current
+
+    def _generations(self):
+        return sorted(
+            p for p in self.root.glob(f"{GENERATION_PREFIX}*") if p.is_dir()
+        )
+
+    def _next_number(self) -> int:
+        numbers = [int(p.name[len(GENERATION_PREFIX):]) for p in self._generations()
+                   if p.name[len(GENERATION_PREFIX):].isdigit()]
+        return max(numbers, default=0) + 1
+
+    def _collect_garbage(self, current: str) -> None:
+        for path in self._generations()[:-self.keep]:
+            if path.name != current:
+                shutil.rmtree(path, ignore_errors=True)
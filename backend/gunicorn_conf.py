@@ -0,0 +1,59 @@
+# backend/gunicorn_conf.py
+
+"""
+Gunicorn settings for running several uvicorn workers behind one port.
+
+    gunicorn -c backend/gunicorn_conf.py backend.app:app
+
+The app is imported once in the master (`preload_app`) and warmed up there
+(`backend.warmup`: matchers, scoring profiles, scipy via one TF-IDF
+comparison, the memory-mapped job index and, with `SEMANTIC_SCORER=bm25`,
+the BM25 index) before the workers are forked, so every worker shares those pages
+copy-on-write instead of loading its own copy. `gc.freeze()` moves the
+preloaded objects out of the collector's view, so the first collections in
+each worker do not touch (and copy) them.
+
+Nothing that must not cross a fork is opened during warm-up: the job store,
+state store and upstream sessions connect lazily inside each worker.
+
+Cross-request state (match states, the latest result list) must be shared
+between workers. When more than one worker is configured and `STATE_STORE`
+is unset, it defaults to a SQLite file next to the app.
+"""
+
+import gc
+import os
+from pathlib import Path
+
+PORT = os.getenv("PORT", "7860")
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "2"))
+
+bind = os.getenv("BIND", f"0.0.0.0:{PORT}")
+workers = max(1, WEB_CONCURRENCY)
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# Recycle workers now and then to bound heap growth; jitter avoids restarting them together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+
+# Read when backend.app is preloaded, which happens after this file is loaded:
+# per-process limits (upstream rate, harvest quota, admission) divide by it
+os.environ.setdefault("WEB_CONCURRENCY", str(workers))
+
+if workers > 1:
+    os.environ.setdefault(
+        "STATE_STORE", f"sqlite:///{Path(__file__).resolve().parent / 'state.sqlite3'}"
+    )
+
+
+def when_ready(server):
+    """Warm the preloaded app in the master, then freeze it for copy-on-write sharing."""
+    from backend.warmup import warm_up
+
+    warm_up()
+    gc.collect()
+    gc.freeze()
+    server.log.info("Preloaded app warmed up; forking %d workers", workers)
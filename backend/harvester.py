@@ -0,0 +1,300 @@
+# backend/harvester.py
+
+"""
+Background harvesting of popular searches.
+
+A cache miss on a popular title/location pair makes its next user wait for
+the slowest path: up to `MAX_PAGES` upstream calls, then skill extraction.
+`/jobs/search` and `/match` record every query in `QueryStats`. Every
+`HARVEST_INTERVAL_SECONDS`, a daemon thread takes the `HARVEST_TOP_N` most
+popular queries and prefetches each one whose search-cache entry is missing
+or will expire before the next cycle. Each prefetched query is:
+
+- fetched with `fetch_jobs_from_api`, which stores the postings with their
+  location and parsed experience requirement in the job store
+- featurized: extracted skills are attached to the stored postings, and
+  with `HARVEST_REBUILD_INDEX=1` (and `FEATURE_STORE_DIR` set) the
+  TF-IDF/skill job index is rebuilt once per cycle
+- put into the search cache, so the next request is served warm
+
+Upstream calls are limited by a token bucket of `HARVEST_QUOTA_PER_HOUR`
+pages. Each query is charged `MAX_PAGES` up front, the worst case. Query
+counts decay by `HARVEST_DECAY` each cycle, so yesterday's spike stops being
+harvested. Counts, cache and quota are per process, and the default quota is
+split across `WEB_CONCURRENCY` workers. The harvester is off unless
+`HARVEST_INTERVAL_SECONDS` is set.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .job_fetcher import MAX_PAGES, fetch_jobs_from_api, search_cache, search_key
+from .job_store import get_job_store
+from .metrics import REGISTRY, span
+from .swr_cache import SWRCache
+
+logger = logging.getLogger(__name__)
+
+# 0 disables the harvester
+HARVEST_INTERVAL_SECONDS = float(os.getenv("HARVEST_INTERVAL_SECONDS", "0"))
+HARVEST_TOP_N = int(os.getenv("HARVEST_TOP_N", "10"))
+HARVEST_QUOTA_PER_HOUR = int(os.getenv(
+    "HARVEST_QUOTA_PER_HOUR",
+    str(max(1, 60 // max(1, int(os.getenv("WEB_CONCURRENCY", "1"))))),
+))
+HARVEST_DECAY = float(os.getenv("HARVEST_DECAY", "0.5"))
+HARVEST_TRACKED_QUERIES = int(os.getenv("HARVEST_TRACKED_QUERIES", "1000"))
+HARVEST_REBUILD_INDEX = os.getenv("HARVEST_REBUILD_INDEX", "0") == "1"
+HARVEST_INDEX_LIMIT = int(os.getenv("HARVEST_INDEX_LIMIT", "50000"))
+# Queries seen fewer times than this (after decay) are not worth the quota
+HARVEST_MIN_COUNT = float(os.getenv("HARVEST_MIN_COUNT", "2"))
+
+HARVESTED_QUERIES = REGISTRY.counter(
+    "harvest_queries_total",
+    "Popular queries considered by the harvester, by result (ok/empty/fresh/quota/error).",
+)
+TRACKED_QUERIES = REGISTRY.gauge(
+    "harvest_tracked_queries", "Distinct queries with a popularity count."
+)
+
+QueryKey = Tuple[str, str]
+
+
+class QueryStats:
+    """
+    Thread-safe, decaying popularity counts per normalized (title, location).
+
+    Args:
+        max_queries: Bound on tracked queries; the least popular are dropped
+    """
+
+    def __init__(self, max_queries: int = HARVEST_TRACKED_QUERIES):
+        self.max_queries = max(1, max_queries)
+        self._counts: Dict[QueryKey, float] = {}
+        # Original spelling of each query, as passed to the upstream
+        self._queries: Dict[QueryKey, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, title: str, location: str) -> None:
+        key = search_key(title, location)
+        if not key[0]:
+            return
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0.0) + 1.0
+            self._queries[key] = (title, location or "")
+            if len(self._counts) > self.max_queries:
+                # Drop the bottom tenth at once so this does not run on every record
+                drop = sorted(self._counts, key=self._counts.get)[: max(1, self.max_queries // 10)]
+                for stale in drop:
+                    del self._counts[stale]
+                    del self._queries[stale]
+            TRACKED_QUERIES.set(len(self._counts))
+
+    def top(self, n: int, min_count: float = 0.0) -> List[Tuple[QueryKey, str, str, float]]:
+        """The `n` most popular queries as (key, title, location, count)."""
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+            return [
+                (key, *self._queries[key], count)
+                for key, count in ranked[:n]
+                if count >= min_count
+            ]
+
+    def decay(self, factor: float) -> None:
+        """Scale every count by `factor`, forgetting queries that fall below 0.1."""
+        with self._lock:
+            for key in list(self._counts):
+                self._counts[key] *= factor
+                if self._counts[key] < 0.1:
+                    del self._counts[key]
+                    del self._queries[key]
+            TRACKED_QUERIES.set(len(self._counts))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
+
+
+class QuotaBudget:
+    """
+    Token bucket of upstream pages, refilled continuously over an hour.
+
+    Args:
+        per_hour: Bucket capacity and hourly refill
+        clock: Monotonic clock, injectable for tests
+    """
+
+    def __init__(self, per_hour: int = HARVEST_QUOTA_PER_HOUR,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(max(0, per_hour))
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def take(self, cost: float) -> bool:
+        """Spend `cost` pages if the bucket holds them."""
+        with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                return False
+            self._tokens -= cost
+            return True
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.capacity,
+                           self._tokens + (now - self._updated) * self.capacity / 3600.0)
+        self._updated = now
+
+
+class Harvester:
+    """
+    Periodically prefetches and featurizes the most popular queries.
+
+    Args:
+        stats: Popularity counts fed by the endpoints
+        interval: Seconds between cycles
+        top_n: Queries considered per cycle
+        budget: Upstream page quota
+        cache: Search cache to warm
+        fetch: `(title, location) -> jobs` upstream fetch
+    """
+
+    def __init__(
+        self,
+        stats: Optional[QueryStats] = None,
+        interval: float = HARVEST_INTERVAL_SECONDS,
+        top_n: int = HARVEST_TOP_N,
+        budget: Optional[QuotaBudget] = None,
+        cache: SWRCache = search_cache,
+        fetch: Callable[[str, str], List[Dict[str, Any]]] = fetch_jobs_from_api,
+    ):
+        self.stats = stats if stats is not None else QueryStats()
+        self.interval = interval
+        self.top_n = top_n
+        self.budget = budget if budget is not None else QuotaBudget()
+        self.cache = cache
+        self.fetch = fetch
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def record(self, title: str, location: str) -> None:
+        """Count one search for `title` in `location`."""
+        self.stats.record(title, location)
+
+    def run_once(self) -> Dict[str, int]:
+        """Run one harvest cycle and return how many queries ended in each result."""
+        summary: Dict[str, int] = {}
+        harvested = 0
+        for key, title, location, _count in self.stats.top(self.top_n, HARVEST_MIN_COUNT):
+            result = self._harvest(key, title, location)
+            summary[result] = summary.get(result, 0) + 1
+            HARVESTED_QUERIES.inc(result=result)
+            harvested += result == "ok"
+        if harvested and HARVEST_REBUILD_INDEX:
+            self._rebuild_index()
+        self.stats.decay(HARVEST_DECAY)
+        if summary:
+            logger.info("Harvest cycle: %s", summary)
+        return summary
+
+    def _harvest(self, key: QueryKey, title: str, location: str) -> str:
+        age = self.cache.age(key)
+        # Still fresh when the next cycle comes round: nothing to do
+        if age is not None and age + self.interval < self.cache.ttl:
+            return "fresh"
+        if not self.budget.take(MAX_PAGES):
+            return "quota"
+        try:
+            with span("harvest_fetch"):
+                jobs = self.fetch(title, location)
+            if not jobs:
+                return "empty"
+            with span("harvest_featurize"):
+                featurize(jobs)
+        except Exception:
+            logger.exception("Harvesting %r failed", key)
+            return "error"
+        self.cache.put(key, jobs)
+        return "ok"
+
+    def _rebuild_index(self) -> None:
+        from .job_index import FEATURE_STORE_DIR, build_job_index
+
+        if not FEATURE_STORE_DIR:
+            return
+        from .feature_store import FeatureStore
+
+        try:
+            with span("harvest_index"):
+                jobs = get_job_store().recent(HARVEST_INDEX_LIMIT)
+                name = build_job_index(jobs, FeatureStore(FEATURE_STORE_DIR))
+            logger.info("Rebuilt job index %s over %d jobs", name, len(jobs))
+        except Exception:
+            logger.exception("Rebuilding the job index failed")
+
+    # ========================================
+    # Background thread
+    # ========================================
+
+    def start(self) -> Optional[threading.Thread]:
+        """Start the harvest loop unless it is disabled or already running."""
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="harvester", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 1.0) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Harvest cycle failed")
+
+
+def featurize(jobs: List[Dict[str, Any]]) -> None:
+    """Attach extracted skills to stored postings, as `/match` does after scoring."""
+    from .nlp_model.extract_job_skills_from_list import extract_job_skills_from_list
+
+    get_job_store().attach_many([
+        (raw_job["id"], {"skills": job["skills"]})
+        for raw_job, job in zip(jobs, extract_job_skills_from_list(jobs), strict=True)
+        if raw_job.get("id")
+    ])
+
+
+_harvester: Optional[Harvester] = None
+_harvester_lock = threading.Lock()
+
+
+def get_harvester() -> Harvester:
+    """Return the process-wide harvester."""
+    global _harvester
+    if _harvester is None:
+        with _harvester_lock:
+            if _harvester is None:
+                _harvester = Harvester()
+    return _harvester
@@ -3,40 +3,84 @@
 """
 Job fetching utilities with environment variable support.
 Loads RAPID_API_KEY from .env using python-dotenv.
+
+The HTTP call itself goes through the pluggable job source in
+`job_sources.py` (live RapidAPI by default, recorded replay via JOB_SOURCE).
+Searches are served through a stale-while-revalidate cache keyed by
+`(title, location)` (see `fetch_jobs_cached`).
 """
 
 import logging
 import os
 import random
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
-import requests
 from dotenv import load_dotenv
 
+from .deadline import DEADLINE_SCORING_RESERVE_SECONDS, unbounded
+from .job_index import index_jobs
+from .job_sources import JobSourceError, JobSourceTimeout, get_job_source
+from .job_store import get_job_store, job_id
+from .metrics import JOBS_DEDUPLICATED, UPSTREAM_SECONDS, timed
+from .near_duplicates import NearDuplicateIndex
+from .nlp_model.experience_extractor import extract_experience_requirement
+from .swr_cache import SWRCache
+
 # Load environment variables from .env
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-RAPID_API_KEY = os.getenv("RAPID_API_KEY")
-RAPID_API_HOST = os.getenv("RAPID_API_HOST")
 MIN_RESULTS = 10  
 MAX_PAGES = 3    
 
+JOB_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("JOB_SEARCH_CACHE_TTL_SECONDS", "600"))
+JOB_SEARCH_CACHE_GRACE_SECONDS = float(os.getenv("JOB_SEARCH_CACHE_GRACE_SECONDS", "3600"))
+JOB_SEARCH_CACHE_SIZE = int(os.getenv("JOB_SEARCH_CACHE_SIZE", "256"))
+
+
+
+class PartialJobList(list):
+    """Jobs from the pages fetched before a request deadline ran out."""
+
+
+# Empty results (no matches, or the upstream was down) and deadline-truncated
+# ones are never cached, so they cannot replace a good stale entry
+search_cache = SWRCache(
+    "job_search",
+    ttl=JOB_SEARCH_CACHE_TTL_SECONDS,
+    grace=JOB_SEARCH_CACHE_GRACE_SECONDS,
+    max_entries=JOB_SEARCH_CACHE_SIZE,
+    should_cache=lambda jobs: bool(jobs) and not isinstance(jobs, PartialJobList),
+)
+
+
+def search_key(title, location):
+    """Cache and popularity key for a search: whitespace- and case-normalized."""
+    return (" ".join((title or "").lower().split()), " ".join((location or "").lower().split()))
+
 
-def fetch_jobs_from_api(title, location):
+def _experience_required(description):
+    """Parsed (min, max, preferred) years for a posting, as stored with the job."""
+    requirement = extract_experience_requirement(description)
+    return requirement.as_dict() if requirement is not None else None
+
+
+@timed("fetch_jobs")
+def fetch_jobs_from_api(title, location, deadline=None):
     """
     Fetch job data from the JSearch API.
     
     IMPROVEMENT: Removed strict Python-side filtering. 
     We rely on the API's search query ("Title in Location") to do the filtering logic.
     This prevents issues like "va" not matching "Virginia".
-    """
-    url = "https://jsearch.p.rapidapi.com/search"
-
-    headers = {
-        "X-RapidAPI-Key": RAPID_API_KEY,
-        "X-RapidAPI-Host": RAPID_API_HOST
-    }
 
+    With a `deadline`, another page is only requested while the remaining
+    budget covers the slowest page so far plus the scoring reserve, and each
+    page request (retries and backoff included) is bounded by that budget.
+    Otherwise the jobs collected so far are returned as a `PartialJobList`.
+    """
+    deadline = deadline or unbounded()
     effective_location = (location or "").strip()
     
     # Build a query so the API handles precise matching (e.g., "Data Scientist in Virginia").
@@ -55,22 +99,51 @@ def fetch_jobs_from_api(title, location):
             "date_posted": "month",
             "employment_types": "FULLTIME",
         }
+        # The page must also leave the scoring reserve; JobSourceTimeout propagates
+        timeout = deadline.timeout()
+        if timeout is not None:
+            timeout = max(0.0, timeout - DEADLINE_SCORING_RESERVE_SECONDS)
+        start = time.perf_counter()
         try:
-            response = requests.get(url, headers=headers, params=params)
-            return response.json().get("data", [])
+            return get_job_source().search(params, timeout=timeout).get("data", [])
+        except JobSourceTimeout:
+            raise
+        except JobSourceError as e:
+            # Already retried (and logged) by the upstream client
+            logger.warning("Error fetching jobs from API page %d: %s", page, e)
+            return []
         except Exception as e:
             logger.exception("Error fetching jobs from API page %d: %s", page, e)
             return []
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - start, endpoint="jsearch_search")
 
     job_list = []
     seen_keys = set()
+    # Catches re-posts under different titles/companies before skill extraction and TF-IDF
+    near_duplicates = NearDuplicateIndex()
     
     # Debug counters
     total_fetched = 0
+    slowest_page = 0.0
+    truncated = False
 
     page = 1
     while page <= MAX_PAGES:
-        data = get_jobs(page=page)
+        if not deadline.allows(slowest_page + DEADLINE_SCORING_RESERVE_SECONDS):
+            logger.warning("Deadline reached: stopping job fetch after %d page(s)", page - 1)
+            deadline.degrade("fetch", "partial_pages")
+            truncated = True
+            break
+        page_start = deadline.clock()
+        try:
+            data = get_jobs(page=page)
+        except JobSourceTimeout as e:
+            logger.warning("Deadline reached during job fetch page %d: %s", page, e)
+            deadline.degrade("fetch", "timeout")
+            truncated = True
+            break
+        slowest_page = max(slowest_page, deadline.clock() - page_start)
         if not data:
             break
         
@@ -86,15 +159,29 @@ def fetch_jobs_from_api(title, location):
             # Deduplicate by title/company
             key = (job_title_raw.lower(), employer.lower())
             if key in seen_keys:
+                JOBS_DEDUPLICATED.inc(kind="exact")
                 continue
-            
-            job_list.append({
+
+            # Deduplicate near-identical descriptions (syndicated / agency re-posts)
+            duplicate_of = near_duplicates.check_and_add(len(job_list), j.get("job_description"))
+            if duplicate_of is not None:
+                logger.debug(
+                    "Dropping '%s' (%s): near-duplicate of '%s'",
+                    job_title_raw, employer, job_list[duplicate_of]["title"],
+                )
+                JOBS_DEDUPLICATED.inc(kind="near")
+                continue
+
+            job = {
                 "title": job_title_raw,
                 "company": employer,
                 "location": j.get("job_city") or j.get("job_state"),
                 "description": j.get("job_description"),
                 "apply_link": j.get("job_apply_link"),
-            })
+            }
+            job["id"] = job_id(job)
+            job["experience_required"] = _experience_required(job["description"])
+            job_list.append(job)
             seen_keys.add(key)
 
         # Stop once enough unique jobs are collected
@@ -105,43 +192,78 @@ def fetch_jobs_from_api(title, location):
 
     logger.info("Fetched %d raw jobs and kept %d unique results.", total_fetched, len(job_list))
 
-    return job_list
+    get_job_store().add_many(job_list)
+    index_jobs(job_list)
+    return PartialJobList(job_list) if truncated else job_list
 
 
-def fetch_random_jobs():
+def fetch_jobs_cached(title, location, deadline=None):
     """
-    Fetch a general list of jobs for homepage feed.
+    `fetch_jobs_from_api` behind the stale-while-revalidate search cache.
+
+    Returns a new list each call; the job dicts themselves are shared with
+    the cache and must not be mutated. A `deadline` bounds both the fetch
+    and any wait for another request's fetch of the same query; background
+    refreshes are never bound to it.
     """
-    url = "https://jsearch.p.rapidapi.com/search"
+    key = search_key(title, location)
+    if deadline is None:
+        return list(search_cache.get(key, lambda: fetch_jobs_from_api(title, location)))
+    try:
+        jobs = search_cache.get(
+            key,
+            lambda: fetch_jobs_from_api(title, location, deadline),
+            timeout=deadline.timeout(),
+            refresh_loader=lambda: fetch_jobs_from_api(title, location),
+        )
+    except FutureTimeoutError:
+        logger.warning("Deadline reached waiting for an in-flight search for %r", key)
+        deadline.degrade("fetch", "timeout")
+        return []
+    return list(jobs)
 
-    headers = {
-        "X-RapidAPI-Key": RAPID_API_KEY,
-        "X-RapidAPI-Host": RAPID_API_HOST
-    }
 
+def fetch_random_jobs():
+    """
+    Fetch a general list of jobs for homepage feed.
+    """
     params = {
         "query": "Data Scientist", # more specific than generic "jobs"
         "num_pages": 1,
         "date_posted": "month",
     }
 
+    start = time.perf_counter()
     try:
-        response = requests.get(url, headers=headers, params=params)
-        data = response.json().get("data", [])
+        data = get_job_source().search(params).get("data", [])
+    except JobSourceError as err:
+        logger.warning("Failed to fetch random jobs: %s", err)
+        data = []
     except Exception as err:
         logger.exception("Failed to fetch random jobs: %s", err)
         data = []
+    finally:
+        UPSTREAM_SECONDS.observe(time.perf_counter() - start, endpoint="jsearch_random")
 
     job_list = []
+    near_duplicates = NearDuplicateIndex()
     for j in data:
-        job_list.append({
+        if near_duplicates.check_and_add(len(job_list), j.get("job_description")) is not None:
+            JOBS_DEDUPLICATED.inc(kind="near")
+            continue
+        job = {
             "title": j.get("job_title"),
             "company": j.get("employer_name"),
             "location": j.get("job_city") or j.get("job_state"),
             "description": j.get("job_description"),
             "apply_link": j.get("job_apply_link"),
-        })
-    
+        }
+        job["id"] = job_id(job)
+        job["experience_required"] = _experience_required(job["description"])
+        job_list.append(job)
+    get_job_store().add_many(job_list)
+    index_jobs(job_list)
+
     # Guard against empty results
     sample_size = min(10, len(job_list))
     if sample_size == 0:
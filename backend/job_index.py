@@ -0,0 +1,195 @@
+# backend/job_index.py
+
+"""
+Prebuilt job feature index on top of `feature_store`.
+
+`build_job_index` featurizes a set of postings once:
+
+- `tfidf`: jobs x terms CSR matrix (float32, L2-normalised rows)
+- `idf`: dense float32 IDF weights, so resumes can be projected into the
+  same space without refitting
+
+and publishes them as a new feature-store generation. With
+`FEATURE_STORE_DIR` set, `score_jobs` reads the semantic dimension from the
+current generation when every job in the request is indexed (a sparse
+matrix-vector product over memory-mapped rows) and falls back to the
+per-request TF-IDF fit otherwise.
+
+With `SEMANTIC_SCORER=bm25`, the semantic dimension is BM25 instead (see
+`nlp_model/bm25.py`). Its inverted index is in memory and is fed as jobs are
+ingested (`index_jobs`, called by `job_fetcher`). Warm-up seeds it from the
+most recent stored jobs.
+
+Rebuild from the SQLite job store with:
+
+    python -m backend.job_index --limit 50000
+"""
+
+import argparse
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .nlp_model.bm25 import BM25Index
+from .nlp_model.document import Document, vectorizer_analyzer
+from .nlp_model.tfidf_matcher import resume_term_vector
+
+if TYPE_CHECKING:
+    from .feature_store import FeatureGeneration, FeatureStore
+
+logger = logging.getLogger(__name__)
+
+FEATURE_STORE_DIR = os.getenv("FEATURE_STORE_DIR", "")
+# "tfidf" (cosine over TF-IDF) or "bm25"
+SEMANTIC_SCORER = os.getenv("SEMANTIC_SCORER", "tfidf").strip().lower()
+JOB_INDEX_MAX_FEATURES = int(os.getenv("JOB_INDEX_MAX_FEATURES", "50000"))
+
+
+def build_job_index(
+    jobs: Iterable[Dict[str, Any]],
+    store: "FeatureStore",
+    max_features: int = JOB_INDEX_MAX_FEATURES,
+) -> str:
+    """
+    Featurize `jobs` (which must carry `id`s) and publish a new generation.
+
+    Returns:
+        The published generation name
+    """
+    # Offline-only dependencies, kept out of the serving import path
+    from scipy import sparse
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    jobs = [job for job in jobs if job.get("id")]
+    documents = [Document(str(job.get("description", "") or "")) for job in jobs]
+
+    vectorizer = TfidfVectorizer(
+        max_features=max_features, analyzer=vectorizer_analyzer, dtype=np.float32
+    )
+    tfidf = vectorizer.fit_transform(documents) if documents else sparse.csr_matrix((0, 0))
+    terms = vectorizer.get_feature_names_out().tolist() if documents else []
+    idf = vectorizer.idf_ if documents else np.zeros(0)
+
+    return store.publish(
+        sparse_arrays={"tfidf": tfidf},
+        dense_arrays={"idf": idf},
+        meta={"job_ids": [job["id"] for job in jobs], "terms": terms},
+    )
+
+
+class JobIndex:
+    """Read-side view of one generation: row lookup and resume similarity."""
+
+    def __init__(self, generation: "FeatureGeneration"):
+        self.generation = generation
+        self.tfidf = generation.sparse["tfidf"]
+        self.idf = generation.dense["idf"]
+        self.rows = {job_id: row for row, job_id in enumerate(generation.meta["job_ids"])}
+        self.columns = {term: col for col, term in enumerate(generation.meta["terms"])}
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.rows
+
+    def resume_vector(self, resume) -> np.ndarray:
+        """Project a resume (text, Document or ResumeProfile) into the index's TF-IDF space."""
+        vector = np.zeros(len(self.columns), dtype=np.float32)
+        for term, count in resume_term_vector(resume).items():
+            col = self.columns.get(term)
+            if col is not None:
+                vector[col] = count
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def tfidf_scores(self, resume, job_ids: Sequence[Optional[str]]) -> Optional[List[float]]:
+        """
+        Cosine similarity of the resume with each job, aligned with `job_ids`.
+
+        Returns:
+            Scores in [0, 1], or None if any job is not in this generation
+        """
+        try:
+            rows = [self.rows[job_id] for job_id in job_ids]
+        except KeyError:
+            return None
+        if not rows:
+            return []
+        sims = self.tfidf[rows] @ self.resume_vector(resume)
+        return [float(max(0.0, min(1.0, s))) for s in sims]
+
+
+_store: Optional["FeatureStore"] = None
+_index: Optional[JobIndex] = None
+_lock = threading.Lock()
+
+
+def get_job_index() -> Optional[JobIndex]:
+    """Return the index for the current generation, or None if not configured/built."""
+    global _store, _index
+    if not FEATURE_STORE_DIR:
+        return None
+    with _lock:
+        if _store is None:
+            from .feature_store import FeatureStore
+
+            _store = FeatureStore(FEATURE_STORE_DIR)
+        generation = _store.current()
+        if generation is None:
+            return None
+        if _index is None or _index.generation is not generation:
+            _index = JobIndex(generation)
+        return _index
+
+
+_bm25: Optional[BM25Index] = None
+_bm25_lock = threading.Lock()
+
+
+def get_bm25_index() -> Optional[BM25Index]:
+    """Return the process-wide BM25 index, or None unless `SEMANTIC_SCORER=bm25`."""
+    global _bm25
+    if SEMANTIC_SCORER != "bm25":
+        return None
+    if _bm25 is None:
+        with _bm25_lock:
+            if _bm25 is None:
+                _bm25 = BM25Index()
+    return _bm25
+
+
+def index_jobs(jobs: Iterable[Dict[str, Any]]) -> int:
+    """Add ingested jobs (with `id`s) to the BM25 index, if enabled; return how many."""
+    index = get_bm25_index()
+    if index is None:
+        return 0
+    return index.add_many(
+        (job["id"], str(job.get("description", "") or "")) for job in jobs if job.get("id")
+    )
+
+
+def main(argv=None) -> None:
+    from .feature_store import FeatureStore
+    from .job_store import JOB_STORE_PATH, JobStore
+
+    parser = argparse.ArgumentParser(description="Rebuild the memory-mapped job feature index.")
+    parser.add_argument("--root", default=FEATURE_STORE_DIR or "backend/features",
+                        help="feature store directory (default: FEATURE_STORE_DIR)")
+    parser.add_argument("--limit", type=int, default=50000,
+                        help="index at most this many of the most recent stored jobs")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    store = JobStore(path=JOB_STORE_PATH)
+    try:
+        jobs = store.recent(args.limit)
+    finally:
+        store.close()
+    name = build_job_index(jobs, FeatureStore(args.root))
+    print(f"Indexed {len(jobs)} jobs into {args.root}/{name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+# backend/job_sources.py
+
+"""
+Pluggable job sources for `job_fetcher`.
+
+A job source takes JSearch `/search` query parameters and returns the raw
+JSearch JSON payload (`{"data": [...]}`), so everything downstream of the
+HTTP call stays identical whichever backend is active.
+
+- `RapidAPIJobSource` talks to `jsearch.p.rapidapi.com` through the
+  rate-limited, retrying `UpstreamClient` (see `upstream.py`), falls back to
+  the last good response for the same query when the upstream is failing,
+  and can optionally record every response to disk.
+- `ReplayJobSource` serves those recordings back with configurable latency
+  and error injection, for offline load testing without spending API quota.
+
+Select a backend with environment variables:
+
+    JOB_SOURCE=replay
+    JOB_REPLAY_DIR=benchmarks/fixtures/jsearch
+    JOB_REPLAY_LATENCY_MS=250
+    JOB_REPLAY_ERROR_RATE=0.05
+    JOB_RECORD_DIR=/tmp/jsearch-recordings   # record while using RapidAPI
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .metrics import UPSTREAM_REQUESTS
+from .upstream import BudgetExceededError, UpstreamClient, UpstreamError
+
+logger = logging.getLogger(__name__)
+
+JSEARCH_URL = "https://jsearch.p.rapidapi.com/search"
+
+# Last good responses kept per query to serve while the upstream is failing
+JOB_SOURCE_STALE_ENTRIES = int(os.getenv("JOB_SOURCE_STALE_ENTRIES", "256"))
+
+
+class JobSourceError(RuntimeError):
+    """Raised when a job source cannot produce a response."""
+
+
+class JobSourceTimeout(JobSourceError):
+    """Raised when a search cannot finish within the caller's `timeout`."""
+
+
+def recording_key(params: Dict[str, Any]) -> str:
+    """Stable file key for a set of query parameters."""
+    canonical = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+class JobSource(ABC):
+    """
+    Interface: return the raw JSearch payload for `params`.
+
+    `timeout` is the time the search may take in seconds (None: unbounded);
+    a source that cannot answer within it raises JobSourceTimeout.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def search(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Return the raw payload for `params`."""
+
+
+class RapidAPIJobSource(JobSource):
+    """
+    Live JSearch backend, optionally recording responses for later replay.
+
+    Calls go through `client` (rate limiting, timeouts, retries, circuit
+    breaker). When a call fails, including fast failures while the circuit
+    is open, the last good response for the same parameters is served
+    instead if one is held; otherwise JobSourceError is raised.
+    """
+
+    name = "rapidapi"
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_host: Optional[str],
+        url: str = JSEARCH_URL,
+        record_dir: Optional[str] = None,
+        client: Optional[UpstreamClient] = None,
+        stale_entries: int = JOB_SOURCE_STALE_ENTRIES,
+    ):
+        self.url = url
+        self.headers = {
+            "X-RapidAPI-Key": api_key,
+            "X-RapidAPI-Host": api_host,
+        }
+        self.record_dir = Path(record_dir) if record_dir else None
+        self.client = client or UpstreamClient("jsearch")
+        self.stale_entries = max(0, stale_entries)
+        self._last_good: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def search(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        key = recording_key(params)
+        try:
+            payload = self.client.get_json(self.url, headers=self.headers, params=params,
+                                           budget=timeout)
+        except UpstreamError as exc:
+            with self._lock:
+                stale = self._last_good.get(key)
+            if stale is None:
+                if isinstance(exc, BudgetExceededError):
+                    raise JobSourceTimeout(str(exc)) from exc
+                raise JobSourceError(str(exc)) from exc
+            logger.warning("Serving stale JSearch response (%s)", exc)
+            UPSTREAM_REQUESTS.inc(upstream=self.client.name, outcome="stale")
+            return stale
+        if self.stale_entries:
+            with self._lock:
+                self._last_good[key] = payload
+                self._last_good.move_to_end(key)
+                while len(self._last_good) > self.stale_entries:
+                    self._last_good.popitem(last=False)
+        if self.record_dir is not None:
+            self._record(params, payload)
+        return payload
+
+    def _record(self, params: Dict[str, Any], payload: Dict[str, Any]) -> None:
+        try:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+            path = self.record_dir / f"{recording_key(params)}.json"
+            with path.open("w", encoding="utf-8") as f:
+                json.dump({"params": params, "response": payload}, f)
+        except OSError as exc:
+            logger.warning("Failed to record JSearch response: %s", exc)
+
+
+class ReplayJobSource(JobSource):
+    """
+    Serve recorded JSearch responses from disk.
+
+    Recordings are JSON files of the form `{"params": {...}, "response": {...}}`
+    (as written by `RapidAPIJobSource` with a `record_dir`). A request whose
+    parameters were recorded gets that exact response. Otherwise, unless
+    `strict` is set, recordings are served round-robin so arbitrary load-test
+    queries still receive realistic payloads.
+
+    Args:
+        directory: Folder containing recordings
+        latency_ms: Base latency added to every call
+        jitter_ms: Uniform random jitter added on top of `latency_ms`
+        error_rate: Probability in [0, 1] that a call raises JobSourceError
+        strict: Only serve exact parameter matches (unknown queries get no data)
+        seed: Seed for the latency/error RNG
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        directory: str,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        strict: bool = False,
+        seed: Optional[int] = None,
+    ):
+        self.directory = Path(directory)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.strict = strict
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._cursor = 0
+        self._by_key: Dict[str, Dict[str, Any]] = {}
+        self._ordered: List[Dict[str, Any]] = []
+        self._load()
+
+    def _load(self) -> None:
+        if not self.directory.is_dir():
+            raise JobSourceError(f"Replay directory not found: {self.directory}")
+        for path in sorted(self.directory.glob("*.json")):
+            with path.open("r", encoding="utf-8") as f:
+                recording = json.load(f)
+            response = recording.get("response", {})
+            self._by_key[recording_key(recording.get("params", {}))] = response
+            self._ordered.append(response)
+        logger.info("Loaded %d JSearch recordings from %s", len(self._ordered), self.directory)
+
+    def search(self, params: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.error_rate
+        if timeout is not None and delay / 1000.0 > timeout:
+            time.sleep(max(0.0, timeout))
+            raise JobSourceTimeout(f"Replay latency {delay:.0f} ms exceeds the {timeout:.2f}s "
+                                   "budget")
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        if fail:
+            raise JobSourceError("Injected replay error")
+
+        response = self._by_key.get(recording_key(params))
+        if response is not None:
+            return response
+        if self.strict or not self._ordered:
+            return {"data": []}
+        with self._lock:
+            response = self._ordered[self._cursor % len(self._ordered)]
+            self._cursor += 1
+        return response
+
+
+def build_job_source() -> JobSource:
+    """Construct the job source selected by `JOB_SOURCE` and related env vars."""
+    kind = os.getenv("JOB_SOURCE", "rapidapi").lower()
+    if kind == "replay":
+        return ReplayJobSource(
+            os.getenv("JOB_REPLAY_DIR", "benchmarks/fixtures/jsearch"),
+            latency_ms=float(os.getenv("JOB_REPLAY_LATENCY_MS", "0")),
+            jitter_ms=float(os.getenv("JOB_REPLAY_JITTER_MS", "0")),
+            error_rate=float(os.getenv("JOB_REPLAY_ERROR_RATE", "0")),
+            strict=os.getenv("JOB_REPLAY_STRICT", "").lower() in ("1", "true", "yes"),
+        )
+    if kind != "rapidapi":
+        raise ValueError(f"Unknown JOB_SOURCE: {kind}")
+    return RapidAPIJobSource(
+        os.getenv("RAPID_API_KEY"),
+        os.getenv("RAPID_API_HOST"),
+        record_dir=os.getenv("JOB_RECORD_DIR"),
+    )
+
+
+_source: Optional[JobSource] = None
+_source_lock = threading.Lock()
+
+
+def get_job_source() -> JobSource:
+    """Return the process-wide job source, building it on first use."""
+    global _source
+    if _source is None:
+        with _source_lock:
+            if _source is None:
+                _source = build_job_source()
+    return _source
+
+
+def set_job_source(source: Optional[JobSource]) -> None:
+    """Override the active job source (tests and load-test harnesses)."""
+    global _source
+    with _source_lock:
+        _source = source
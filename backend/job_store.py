@@ -0,0 +1,216 @@
+# backend/job_store.py
+
+"""
+Job detail store.
+
+Every posting gets a stable, content-derived `id` when `job_fetcher`
+ingests it and is stored here once. Result lists, the cached latest results and
+`/match/more` then refer to jobs by ID instead of carrying their full
+descriptions, and `/jobs/{id}` serves the complete posting.
+
+The store has two bounded tiers:
+
+- an in-memory LRU (`JOB_STORE_SIZE` entries) for the hot working set
+- a SQLite table (`JOB_STORE_PATH`, default `backend/jobs.sqlite3`) holding
+  up to `JOB_STORE_DISK_SIZE` postings, so IDs in cached results still
+  resolve after an eviction or a restart. Set `JOB_STORE_PATH=""` to keep
+  the store in memory only.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOB_STORE_SIZE = int(os.getenv("JOB_STORE_SIZE", "2000"))
+JOB_STORE_DISK_SIZE = int(os.getenv("JOB_STORE_DISK_SIZE", "50000"))
+JOB_STORE_PATH = os.getenv(
+    "JOB_STORE_PATH", str(Path(__file__).resolve().parent / "jobs.sqlite3")
+)
+
+# Fields that identify a posting (description text is excluded: it is long
+# and JSearch occasionally re-renders it without the job changing)
+ID_FIELDS = ("title", "company", "location", "apply_link")
+
+# Trim the on-disk table back to its bound once per this many writes
+PRUNE_EVERY = 256
+
+
+def job_id(job: Dict[str, Any]) -> str:
+    """Stable content-derived ID for a job posting."""
+    parts = [" ".join(str(job.get(name) or "").lower().split()) for name in ID_FIELDS]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+class JobStore:
+    """Thread-safe job ID -> job dict map: bounded LRU over optional SQLite."""
+
+    def __init__(
+        self,
+        max_entries: int = JOB_STORE_SIZE,
+        path: Optional[str] = None,
+        max_disk_entries: int = JOB_STORE_DISK_SIZE,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max(1, max_disk_entries)
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._open(path)
+
+    def _open(self, path: str) -> None:
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, body TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated_at)")
+            self._db = db
+        except sqlite3.Error as exc:
+            logger.warning("Job store running in memory only; cannot open %s: %s", path, exc)
+
+    def add(self, job: Dict[str, Any]) -> str:
+        """Store `job` (setting its `id` if missing) and return the ID."""
+        self.add_many([job])
+        return job["id"]
+
+    def add_many(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        """Store several jobs, written to disk in a single transaction."""
+        rows = []
+        for job in jobs:
+            job["id"] = job.get("id") or job_id(job)
+            rows.append((job["id"], job))
+        if not rows:
+            return
+        with self._lock:
+            for identifier, job in rows:
+                self._remember(identifier, job)
+            self._persist(rows)
+
+    def attach(self, identifier: str, **fields: Any) -> None:
+        """Add derived fields (e.g. extracted `skills`) to a stored job."""
+        self.attach_many([(identifier, fields)])
+
+    def attach_many(self, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """`attach` for several (ID, fields) pairs, with one disk transaction."""
+        changed = []
+        for identifier, fields in updates:
+            job = self.get(identifier)
+            if job is not None and any(job.get(k) != v for k, v in fields.items()):
+                changed.append({**job, **fields})
+        self.add_many(changed)
+
+    def get(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """Return the stored job, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(identifier)
+            if job is not None:
+                self._jobs.move_to_end(identifier)
+                return job
+            job = self._load(identifier)
+            if job is not None:
+                self._remember(identifier, job)
+            return job
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """Up to `limit` most recently stored jobs (from disk when available)."""
+        with self._lock:
+            if self._db is None:
+                return list(self._jobs.values())[-limit:][::-1]
+            try:
+                rows = self._db.execute(
+                    "SELECT body FROM jobs ORDER BY updated_at DESC LIMIT ?", (limit,)
+                ).fetchall()
+            except sqlite3.Error as exc:
+                logger.warning("Failed to list jobs: %s", exc)
+                return []
+        return [json.loads(row[0]) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # --- internals (caller holds the lock) ---
+
+    def _remember(self, identifier: str, job: Dict[str, Any]) -> None:
+        self._jobs[identifier] = job
+        self._jobs.move_to_end(identifier)
+        while len(self._jobs) > self.max_entries:
+            self._jobs.popitem(last=False)
+
+    def _persist(self, rows: List[Tuple[str, Dict[str, Any]]]) -> None:
+        if self._db is None:
+            return
+        now = time.time()
+        try:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO jobs (id, body, updated_at) VALUES (?, ?, ?)",
+                    [(identifier, json.dumps(job), now) for identifier, job in rows],
+                )
+                before, self._writes = self._writes, self._writes + len(rows)
+                if self._writes // PRUNE_EVERY != before // PRUNE_EVERY:
+                    self._db.execute(
+                        "DELETE FROM jobs WHERE id IN "
+                        "(SELECT id FROM jobs ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_disk_entries,),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as exc:
+            logger.warning("Failed to persist %d job(s): %s", len(rows), exc)
+
+    def _load(self, identifier: str) -> Optional[Dict[str, Any]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT body FROM jobs WHERE id = ?", (identifier,)
+            ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("Failed to read job %s: %s", identifier, exc)
+            return None
+        return json.loads(row[0]) if row else None
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Return the process-wide job store, opening it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore(path=JOB_STORE_PATH or None)
+    return _store
+
+
+def set_job_store(store: Optional[JobStore]) -> None:
+    """Override the process-wide job store (tests)."""
+    global _store
+    with _store_lock:
+        _store = store
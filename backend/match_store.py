@@ -0,0 +1,48 @@
+# backend/match_store.py
+
+"""
+Store for scored match states.
+
+`/match` keeps the `ScoredState` of every run here under a random match ID,
+so later preference changes (`/match/{match_id}/rescore`) can re-rank the
+same jobs without re-uploading, reparsing or refetching. Entries expire
+after `MATCH_STORE_TTL_SECONDS`.
+
+States live in the process-wide `state_store`, so with `STATE_STORE` set to
+a shared backend any worker can serve the rescore for a match another worker
+scored. With the default in-memory backend the least recently used state is
+evicted once `STATE_STORE_SIZE` are held.
+"""
+
+import os
+import uuid
+from typing import Any, Optional
+
+from .state_store import StateStore, get_state_store
+
+MATCH_STORE_TTL_SECONDS = float(os.getenv("MATCH_STORE_TTL_SECONDS", "3600"))
+
+NAMESPACE = "match"
+
+
+class MatchStore:
+    """Match ID -> state map with a per-entry TTL over a `StateStore`."""
+
+    def __init__(self, ttl: float = MATCH_STORE_TTL_SECONDS, store: Optional[StateStore] = None):
+        self.ttl = ttl
+        self._store = store
+
+    @property
+    def store(self) -> StateStore:
+        # Resolved per call so tests and workers can swap the process-wide store
+        return self._store if self._store is not None else get_state_store()
+
+    def put(self, state: Any, match_id: Optional[str] = None) -> str:
+        """Store `state` and return its match ID (a new one unless given)."""
+        match_id = match_id or uuid.uuid4().hex
+        self.store.set(NAMESPACE, match_id, state, ttl=self.ttl)
+        return match_id
+
+    def get(self, match_id: str) -> Optional[Any]:
+        """Return the stored state, or None if unknown or expired."""
+        return self.store.get(NAMESPACE, match_id)
@@ -0,0 +1,259 @@
+# backend/metrics.py
+
+"""
+Lightweight in-process metrics with Prometheus text exposition.
+
+Provides counters, histograms and timing spans without pulling in an extra
+dependency. Spans can be used as context managers or decorators:
+
+    with span("parse_sections"):
+        sections = parser.parse_sections(text)
+
+    @timed("fetch_jobs")
+    def fetch_jobs_from_api(...): ...
+
+`render_prometheus()` serialises everything for the `/metrics` endpoint.
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+NAMESPACE = "resume_recommender"
+
+# Seconds; covers fast in-memory stages up to slow multi-page upstream fetches.
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return "{" + body + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing counter keyed by label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{_format_labels(key)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[_label_key(labels)] = float(value)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, List[int]] = {}
+        self._sums: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._series.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        return int(sum(self._series.get(_label_key(labels), [])))
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [(key, list(counts), self._sums[key]) for key, counts in self._series.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(key, ("le", _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(key)} {cumulative}"
+
+
+class Registry:
+    """Holds named metrics plus callbacks that contribute gauges at scrape time."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, **kwargs):
+        full_name = f"{NAMESPACE}_{name}"
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = cls(full_name, documentation, **kwargs)
+                self._metrics[full_name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._get_or_create(Counter, name, documentation)
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation)
+
+    def histogram(self, name: str, documentation: str, buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Register a callable yielding `(name, labels, value)` gauges evaluated on scrape."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        declared = set()
+        for collector in self._collectors:
+            for name, labels, value in collector():
+                full_name = f"{NAMESPACE}_{name}"
+                if full_name not in declared:
+                    lines.append(f"# TYPE {full_name} gauge")
+                    declared.add(full_name)
+                lines.append(
+                    f"{full_name}{_format_labels(_label_key(labels))} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "stage_duration_seconds", "Time spent in each pipeline stage."
+)
+REQUESTS_TOTAL = REGISTRY.counter(
+    "http_requests_total", "HTTP requests handled, by route and status code."
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "End-to-end HTTP request latency by route."
+)
+UPSTREAM_SECONDS = REGISTRY.histogram(
+    "upstream_request_duration_seconds", "Latency of calls to external APIs."
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "cache_lookups_total", "Cache lookups by cache name and result (hit/miss)."
+)
+UPSTREAM_REQUESTS = REGISTRY.counter(
+    "upstream_requests_total",
+    "Upstream API call attempts by upstream and outcome "
+    "(ok/retry/error/rate_limited/circuit_open/stale).",
+)
+JOBS_DEDUPLICATED = REGISTRY.counter(
+    "jobs_deduplicated_total", "Fetched jobs dropped as duplicates, by kind (exact/near)."
+)
+DEGRADATIONS = REGISTRY.counter(
+    "request_degradations_total",
+    "Pipeline stages cut short or skipped to meet the request deadline, by stage and reason.",
+)
+
+
+@contextmanager
+def span(stage: str):
+    """Time the enclosed block and record it under `stage`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+
+
+def timed(stage: str):
+    """Decorator form of `span`."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """Count a cache hit or miss for `cache`."""
+    CACHE_LOOKUPS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def _cache_hit_ratios() -> Iterable[Sample]:
+    caches = {dict(key).get("cache") for key in list(CACHE_LOOKUPS._values)}
+    for cache in sorted(c for c in caches if c):
+        hits = CACHE_LOOKUPS.value(cache=cache, result="hit")
+        misses = CACHE_LOOKUPS.value(cache=cache, result="miss")
+        if hits + misses:
+            yield "cache_hit_ratio", {"cache": cache}, hits / (hits + misses)
+
+
+REGISTRY.register_collector(_cache_hit_ratios)
+
+
+def render_prometheus() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
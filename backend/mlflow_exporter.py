@@ -0,0 +1,228 @@
+# backend/mlflow_exporter.py
+
+"""
+Background MLflow telemetry exporter.
+
+Recommendation runs are queued in memory and shipped to the MLflow REST API
+by a daemon thread, so a slow or unreachable tracking server never adds
+latency to `/match`. Each run costs three calls (`runs/create`,
+`runs/log-batch`, `runs/update`) and the experiment ID is resolved once and
+cached for the lifetime of the process.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI")
+MLFLOW_EXPERIMENT_NAME = os.getenv("MLFLOW_EXPERIMENT_NAME", "resume_recommender")
+MLFLOW_QUEUE_SIZE = int(os.getenv("MLFLOW_QUEUE_SIZE", "256"))
+MLFLOW_BATCH_SIZE = int(os.getenv("MLFLOW_BATCH_SIZE", "16"))
+MLFLOW_TIMEOUT = float(os.getenv("MLFLOW_TIMEOUT", "5"))
+
+
+@dataclass
+class RunRecord:
+    """A single recommendation run waiting to be exported."""
+
+    params: Dict[str, str]
+    metrics: Dict[str, float]
+    start_time: int = field(default_factory=lambda: int(time.time() * 1000))
+
+
+class MLflowExporter:
+    """
+    Bounded, drop-on-overflow queue drained by a background thread.
+
+    `submit` never blocks: when the queue is full the run is dropped and the
+    `dropped` counter is incremented. Export failures are counted and logged
+    at debug level only, mirroring the previous best-effort behaviour.
+    """
+
+    def __init__(
+        self,
+        tracking_uri: Optional[str],
+        experiment_name: str = MLFLOW_EXPERIMENT_NAME,
+        max_queue: int = MLFLOW_QUEUE_SIZE,
+        batch_size: int = MLFLOW_BATCH_SIZE,
+        timeout: float = MLFLOW_TIMEOUT,
+    ):
+        self.tracking_uri = tracking_uri.rstrip("/") if tracking_uri else None
+        self.experiment_name = experiment_name
+        self.batch_size = max(1, batch_size)
+        self.timeout = timeout
+        self._queue: "queue.Queue[RunRecord]" = queue.Queue(maxsize=max_queue)
+        self._session = None
+        self._experiment_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.counters = {"enqueued": 0, "exported": 0, "dropped": 0, "failed": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.tracking_uri)
+
+    def submit(self, record: RunRecord) -> bool:
+        """Queue a run for export; return False if it was dropped."""
+        if not self.enabled:
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("enqueued")
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the exporter counters plus current queue depth."""
+        with self._lock:
+            snapshot = dict(self.counters)
+        snapshot["queued"] = self._queue.qsize()
+        return snapshot
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until queued runs are exported or `timeout` elapses."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Flush pending runs and stop the worker thread."""
+        if self._thread is None:
+            return
+        self.flush(timeout)
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    # ========================================
+    # Worker
+    # ========================================
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="mlflow-exporter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        # Imported here so the exporter costs nothing until a run is queued
+        import requests
+
+        self._session = self._session or requests.Session()
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for record in batch:
+                try:
+                    self._export(record)
+                    self._count("exported")
+                except (requests.RequestException, KeyError, ValueError) as exc:
+                    self._count("failed")
+                    logger.debug("Skipping MLflow logging: %s", exc)
+                finally:
+                    self._queue.task_done()
+
+    def _export(self, record: RunRecord) -> None:
+        experiment_id = self._experiment()
+        if not experiment_id:
+            raise ValueError("MLflow experiment unavailable")
+        created = self._post(
+            "runs/create",
+            {
+                "experiment_id": experiment_id,
+                "start_time": record.start_time,
+                "tags": [{"key": "source", "value": "resume_recommender"}],
+            },
+        )
+        run_id = created["run"]["info"]["run_id"]
+        self._post(
+            "runs/log-batch",
+            {
+                "run_id": run_id,
+                "params": [{"key": k, "value": str(v)} for k, v in record.params.items()],
+                "metrics": [
+                    {"key": k, "value": float(v), "timestamp": record.start_time, "step": 0}
+                    for k, v in record.metrics.items()
+                ],
+            },
+        )
+        self._post(
+            "runs/update",
+            {"run_id": run_id, "status": "FINISHED", "end_time": int(time.time() * 1000)},
+        )
+
+    def _experiment(self) -> Optional[str]:
+        """Return the cached experiment ID, creating the experiment if required."""
+        if self._experiment_id:
+            return self._experiment_id
+        response = self._session.get(
+            f"{self.tracking_uri}/api/2.0/mlflow/experiments/get-by-name",
+            params={"experiment_name": self.experiment_name},
+            timeout=self.timeout,
+        )
+        if response.status_code == 200:
+            self._experiment_id = response.json()["experiment"]["experiment_id"]
+        else:
+            created = self._post("experiments/create", {"name": self.experiment_name})
+            self._experiment_id = created.get("experiment_id")
+        return self._experiment_id
+
+    def _post(self, path: str, payload: dict) -> dict:
+        url = f"{self.tracking_uri}/api/2.0/mlflow/{path}"
+        response = self._session.post(url, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+
+_exporter: Optional[MLflowExporter] = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> MLflowExporter:
+    """Return the process-wide exporter, creating it on first use."""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = MLflowExporter(MLFLOW_TRACKING_URI)
+    return _exporter
+
+
+def _exporter_samples():
+    if _exporter is None:
+        return
+    for name, value in _exporter.stats().items():
+        yield "mlflow_exporter_runs", {"state": name}, value
+
+
+REGISTRY.register_collector(_exporter_samples)
@@ -0,0 +1,127 @@
+# backend/near_duplicates.py
+
+"""
+Near-duplicate job detection with MinHash signatures and an LSH index.
+
+The same posting is often syndicated under slightly different titles or
+re-posted by staffing agencies, which the exact `(title, company)` check in
+`job_fetcher` cannot catch. Here each description is reduced to a set of
+word shingles, summarised by a MinHash signature, and bucketed by LSH
+banding. A lookup only compares against jobs sharing at least one band
+bucket, so the cost per job does not grow with the number already indexed.
+
+With the defaults (128 permutations, 16 bands of 8 rows) pairs above ~0.7
+Jaccard similarity almost always become candidates; candidates are then
+confirmed against `threshold` using the signature estimate.
+"""
+
+import functools
+import os
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+JOB_DEDUP_THRESHOLD = float(os.getenv("JOB_DEDUP_THRESHOLD", "0.8"))
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+BANDS = 16
+# Mersenne prime 2^31 - 1: keeps a * x + b inside uint64 for 31-bit a, b, x
+_PRIME = np.uint64((1 << 31) - 1)
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+@functools.lru_cache(maxsize=8)
+def _permutations(num_perm: int, seed: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> set:
+    """Set of `size`-word shingles of the normalised text."""
+    words = _WORD.findall((text or "").lower())
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index answering "have I already seen a near-copy of this text?".
+
+    Args:
+        threshold: Minimum estimated Jaccard similarity to report a duplicate
+        num_perm: Signature length (number of hash permutations)
+        bands: LSH bands; `num_perm` must be divisible by it
+        seed: Seed for the permutation parameters
+    """
+
+    def __init__(
+        self,
+        threshold: float = JOB_DEDUP_THRESHOLD,
+        num_perm: int = NUM_PERM,
+        bands: int = BANDS,
+        seed: int = 1,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._a, self._b = _permutations(num_perm, seed)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of `text`, or None if it has no words."""
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter(
+            (zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams)
+        ) % _PRIME
+        values = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return values.min(axis=1)
+
+    def _bands(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def query(self, signature: np.ndarray) -> Optional[Hashable]:
+        """Key of the most similar indexed item at or above the threshold."""
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        best, best_score = None, self.threshold
+        for candidate in candidates:
+            score = float(np.mean(self._signatures[candidate] == signature))
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    def add(self, key: Hashable, signature: np.ndarray) -> None:
+        self._signatures[key] = signature
+        for band, bucket_key in self._bands(signature):
+            self._buckets[band].setdefault(bucket_key, []).append(key)
+
+    def check_and_add(self, key: Hashable, text: str) -> Optional[Hashable]:
+        """
+        Return the key of an indexed near-duplicate of `text`, or index it.
+
+        Texts without words are never reported as duplicates.
+        """
+        signature = self.signature(text)
+        if signature is None:
+            return None
+        duplicate = self.query(signature)
+        if duplicate is None:
+            self.add(key, signature)
+        return duplicate
+
+    def __len__(self) -> int:
+        return len(self._signatures)
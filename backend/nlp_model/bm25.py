@@ -0,0 +1,211 @@
+# backend/nlp_model/bm25.py
+
+"""
+BM25 lexical scoring over a compact inverted index.
+
+Job postings range from a few hundred to several thousand words. Plain
+TF-IDF cosine does not saturate repeated terms, and its only length
+normalization is the vector norm. Okapi BM25 handles both: a term's
+contribution saturates with `k1`, and `b` scales it by the posting's length
+relative to the average.
+
+`BM25Index` keeps the corpus statistics in compact arrays:
+
+- one posting list per term: `array("I")` document numbers plus
+  `array("H")` term frequencies, appended in ingestion order
+- `array("I")` document lengths, plus the running total for the average
+
+Documents are added once, when their job is ingested. Scoring a resume
+against a job list then walks the posting lists of the resume's terms,
+viewed zero-copy as numpy arrays, and keeps the hits on the requested jobs.
+No matrix is fitted per request. When the index outgrows `max_docs`, the
+oldest quarter is dropped by filtering and renumbering the postings.
+
+Scores are normalized into [0, 1] by the resume's best achievable score
+(every indexed term matched at saturation).
+"""
+
+import math
+import os
+import threading
+from array import array
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .document import Document, term_counts
+
+BM25_K1 = float(os.getenv("BM25_K1", "1.2"))
+BM25_B = float(os.getenv("BM25_B", "0.75"))
+BM25_INDEX_SIZE = int(os.getenv("BM25_INDEX_SIZE", "20000"))
+
+# Term frequencies are stored as uint16
+MAX_TF = 0xFFFF
+
+
+class BM25Index:
+    """
+    Thread-safe, append-only inverted index with BM25 scoring.
+
+    Args:
+        k1: Term-frequency saturation
+        b: Length normalization strength (0 = none, 1 = full)
+        max_docs: Bound on indexed documents; the oldest are dropped beyond it
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B,
+                 max_docs: int = BM25_INDEX_SIZE):
+        self.k1 = k1
+        self.b = b
+        self.max_docs = max(1, max_docs)
+        self._keys: List[Hashable] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._lengths = array("I")
+        self._total_length = 0
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def average_length(self) -> float:
+        return self._total_length / len(self._keys) if self._keys else 0.0
+
+    def add(self, key: Hashable, document) -> bool:
+        """Index `document` (text or Document) under `key`; False if already indexed."""
+        return self.add_many([(key, document)]) == 1
+
+    def add_many(self, items: Iterable[Tuple[Hashable, object]]) -> int:
+        """Index (key, text or Document) pairs not yet indexed; return how many were added."""
+        # Tokenize outside the lock
+        pending = [(key, term_counts(document)) for key, document in items
+                   if key not in self._rows]
+        added = 0
+        with self._lock:
+            for key, counts in pending:
+                if key in self._rows:
+                    continue
+                self._append(key, counts)
+                added += 1
+            if len(self._keys) > self.max_docs:
+                self._compact(len(self._keys) - self.max_docs + self.max_docs // 4)
+        return added
+
+    def idf(self, term: str) -> float:
+        """BM25 IDF, `ln(1 + (N - df + 0.5) / (df + 0.5))`; 0 for unindexed terms."""
+        posting = self._postings.get(term)
+        if posting is None:
+            return 0.0
+        df = len(posting[0])
+        return math.log(1.0 + (len(self._keys) - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: Mapping[str, float], keys: Sequence[Hashable]) -> List[float]:
+        """
+        BM25 score of each `keys` document for a weighted query, in [0, 1].
+
+        Args:
+            query: Term -> weight (e.g. a resume's term-frequency vector);
+                weights saturate like document term frequencies
+            keys: Documents to score; unindexed keys score 0
+
+        Returns:
+            Scores aligned with `keys`
+        """
+        with self._lock:
+            rows = np.array([self._rows.get(key, -1) for key in keys], dtype=np.int64)
+            if not len(rows) or not self._keys:
+                return [0.0] * len(keys)
+            # Score each distinct row once; `inverse` maps back to `keys` order
+            candidates, inverse = np.unique(rows, return_inverse=True)
+            totals = np.zeros(len(candidates))
+            average_length = self.average_length
+            best = 0.0
+            for term, weight in query.items():
+                posting = self._postings.get(term)
+                if posting is None or weight <= 0:
+                    continue
+                term_weight = self.idf(term) * weight * (self.k1 + 1) / (weight + self.k1)
+                best += term_weight
+                # Temporary zero-copy views (released before any append)
+                docs = np.frombuffer(posting[0], dtype=np.uint32).astype(np.int64)
+                found = np.minimum(np.searchsorted(candidates, docs), len(candidates) - 1)
+                hits = candidates[found] == docs
+                if not hits.any():
+                    continue
+                tfs = np.frombuffer(posting[1], dtype=np.uint16)[hits].astype(np.float64)
+                lengths = np.frombuffer(self._lengths, dtype=np.uint32)[docs[hits]]
+                norm = self.k1 * (1.0 - self.b + self.b * lengths / average_length)
+                np.add.at(totals, found[hits], term_weight * tfs * (self.k1 + 1) / (tfs + norm))
+        if not best:
+            return [0.0] * len(keys)
+        return np.clip(totals[inverse] / (best * (self.k1 + 1)), 0.0, 1.0).tolist()
+
+    # --- internals (caller holds the lock) ---
+
+    def _append(self, key: Hashable, counts: Dict[str, int]) -> None:
+        row = len(self._keys)
+        self._keys.append(key)
+        self._rows[key] = row
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+        for term, count in counts.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = (array("I"), array("H"))
+            posting[0].append(row)
+            posting[1].append(min(count, MAX_TF))
+
+    def _compact(self, drop: int) -> None:
+        """Drop the `drop` oldest documents and renumber the rest."""
+        self._keys = self._keys[drop:]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._lengths = self._lengths[drop:]
+        self._total_length = sum(self._lengths)
+        postings = {}
+        for term, (docs, tfs) in self._postings.items():
+            doc_view = np.frombuffer(docs, dtype=np.uint32)
+            # Postings are in ingestion order, so the survivors are a suffix
+            start = int(np.searchsorted(doc_view, drop))
+            if start < len(docs):
+                postings[term] = (array("I", (doc_view[start:] - drop).astype(np.uint32).tobytes()),
+                                  tfs[start:])
+        self._postings = postings
+
+
+def compute_bm25_scores(
+    resume_text,
+    job_list: List[Dict],
+    documents: Optional[Sequence[Union[str, Document]]] = None,
+    index: Optional[BM25Index] = None,
+    keys: Optional[Sequence[Hashable]] = None,
+) -> List[float]:
+    """
+    BM25 similarity between a resume and each job description.
+
+    The drop-in sibling of `compute_tfidf_scores`: `resume_text` may be
+    text, a Document or a ResumeProfile (scored with its section-weighted
+    term vector). With a shared `index` and the jobs' `keys` (e.g. job IDs),
+    jobs missing from it are added first and the corpus statistics of
+    every ingested posting apply. Without one, a throwaway index over
+    `job_list` is used.
+
+    Returns:
+        A list of scores in [0, 1], aligned with job_list order.
+    """
+    from .tfidf_matcher import resume_term_vector
+
+    if documents is None:
+        # Counted straight from the text; no Document is needed
+        documents = [str(job.get("description", "") or "") for job in job_list]
+    if index is None:
+        index = BM25Index(max_docs=max(1, len(documents)))
+        keys = range(len(documents))
+    elif keys is None:
+        raise ValueError("keys are required with a shared BM25 index")
+    index.add_many(zip(keys, documents, strict=True))
+    return index.scores(resume_term_vector(resume_text), list(keys))
@@ -0,0 +1,205 @@
+"""
+Shared Text Preprocessing
+
+A `Document` lowercases and tokenizes a text once; the skill matcher, role
+matcher, experience extractor and TF-IDF vectorizer all read from it
+instead of re-lowercasing the raw text, running one case-insensitive regex
+per skill, or re-tokenizing inside scikit-learn.
+
+Tokens are runs of letters/digits, with trailing `+`/`#` kept so "C", "C++"
+and "C#" stay distinct. Multi-word phrases ("machine learning", "CI/CD",
+"A/B testing") are matched as consecutive token sequences through a
+position index on their first token, so a lookup costs a dict access plus a
+short comparison per occurrence rather than a scan of the whole text.
+
+Punctuation is not a token, but it still separates phrases: the text between
+two matched tokens may only be whitespace or the phrase's own separator at
+that point. "own product. Strategy" is not "Product Strategy", "weights,
+biases" is not "Weights & Biases", while "CI / CD" is still "CI/CD".
+Punctuation leading or trailing a phrase (".NET") must be present too.
+"""
+
+import functools
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple, Union
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+[+#]*")
+
+# Bump when phrase matching rules change, so compiled matcher artifacts are rebuilt
+MATCH_RULES_VERSION = 2
+
+# A phrase's tokens plus the punctuation before, between and after them
+# (whitespace removed): "CI/CD" -> (("ci", "cd"), ("", "/", ""))
+PhrasePattern = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _squash(text: str) -> str:
+    return "".join(text.split())
+
+
+@functools.lru_cache(maxsize=4096)
+def phrase_tokens(phrase: str) -> Tuple[str, ...]:
+    """Token sequence of a skill or keyword phrase (cached)."""
+    return phrase_pattern(phrase)[0]
+
+
+@functools.lru_cache(maxsize=4096)
+def phrase_pattern(phrase: str) -> PhrasePattern:
+    """Tokens and separators of a skill or keyword phrase (cached)."""
+    text = phrase.lower()
+    matches = list(TOKEN_PATTERN.finditer(text))
+    if not matches:
+        return (), ()
+    # Text outside the tokens: before the first, between each pair, after the last
+    bounds = [0] + [bound for match in matches for bound in match.span()] + [len(text)]
+    separators = tuple(_squash(text[bounds[i]:bounds[i + 1]]) for i in range(0, len(bounds), 2))
+    return tuple(match.group() for match in matches), separators
+
+
+class Document:
+    """
+    Normalized view of one resume, resume section or job description.
+
+    Attributes:
+        text: Original text
+        normalized: Lowercased text (character offsets match `spans`)
+        tokens: Token strings in order
+        spans: (start, end) character offsets of each token in `normalized`
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.normalized = self.text.lower()
+        self.tokens: List[str] = []
+        self.spans: List[Tuple[int, int]] = []
+        for match in TOKEN_PATTERN.finditer(self.normalized):
+            self.tokens.append(match.group())
+            self.spans.append(match.span())
+        self._positions: Dict[str, List[int]] = {}
+        for index, token in enumerate(self.tokens):
+            self._positions.setdefault(token, []).append(index)
+
+    def find(self, phrase: Union[str, PhrasePattern]) -> List[Tuple[int, int]]:
+        """Character spans of every occurrence of `phrase` (text or `phrase_pattern`)."""
+        words, separators = phrase_pattern(phrase) if isinstance(phrase, str) else phrase
+        if not words:
+            return []
+        size = len(words)
+        found = []
+        for start in self._positions.get(words[0], ()):
+            end = start + size - 1
+            if size > 1 and tuple(self.tokens[start:end + 1]) != words:
+                continue
+            if self._separated_by(start, end, separators):
+                found.append((self.spans[start][0], self.spans[end][1]))
+        return found
+
+    def count(self, phrase: Union[str, PhrasePattern]) -> int:
+        """Number of occurrences of `phrase` as a whole-token sequence."""
+        pattern = phrase_pattern(phrase) if isinstance(phrase, str) else phrase
+        words, separators = pattern
+        if len(words) == 1 and not any(separators):
+            return len(self._positions.get(words[0], ()))
+        return len(self.find(pattern))
+
+    def contains(self, phrase: Union[str, Tuple[str, ...]]) -> bool:
+        return self.count(phrase) > 0
+
+    @property
+    def terms(self) -> List[str]:
+        """Vectorizer terms: tokens of two or more characters."""
+        return [token for token in self.tokens if len(token) > 1]
+
+    def term_counts(self) -> Dict[str, int]:
+        """Occurrences of each vectorizer term (a sparse term-frequency vector)."""
+        counts: Dict[str, int] = {}
+        for term in self.terms:
+            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def _separated_by(self, start: int, end: int, separators: Tuple[str, ...]) -> bool:
+        """True if tokens start..end are joined (and framed) as `separators` require."""
+        text = self.normalized
+        leading, trailing = separators[0], separators[-1]
+        if leading and not text.endswith(leading, 0, self.spans[start][0]):
+            return False
+        if trailing and not text.startswith(trailing, self.spans[end][1]):
+            return False
+        for index in range(start, end):
+            gap = _squash(text[self.spans[index][1]:self.spans[index + 1][0]])
+            if gap and gap != separators[index - start + 1]:
+                return False
+        return True
+
+
+class PhraseMatcher:
+    """
+    A phrase list compiled for repeated matching.
+
+    Phrases are indexed by their first token, so matching a document visits
+    only the phrases whose first token actually occurs in it instead of
+    looking up every phrase. Instances are plain data and pickle cleanly
+    (see `matchers.build_artifact`).
+    """
+
+    def __init__(self, phrases: Sequence[str]):
+        self.phrases: Tuple[str, ...] = tuple(phrases)
+        self.by_first_token: Dict[str, List[Tuple[int, PhrasePattern]]] = {}
+        for order, phrase in enumerate(self.phrases):
+            pattern = phrase_pattern(phrase)
+            if pattern[0]:
+                self.by_first_token.setdefault(pattern[0][0], []).append((order, pattern))
+
+    def count(self, document: Document) -> Dict[str, int]:
+        """Same result as `count_phrases(document, self.phrases)`."""
+        found = []
+        for token in document._positions.keys() & self.by_first_token.keys():
+            for order, pattern in self.by_first_token[token]:
+                count = document.count(pattern)
+                if count:
+                    found.append((order, count))
+        found.sort()
+        return {self.phrases[order]: count for order, count in found}
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+
+def count_phrases(document: Document, phrases) -> Dict[str, int]:
+    """Occurrence counts of each phrase found in `document` (absent phrases omitted)."""
+    if isinstance(phrases, PhraseMatcher):
+        return phrases.count(document)
+    counts = {}
+    for phrase in phrases:
+        count = document.count(phrase)
+        if count:
+            counts[phrase] = count
+    return counts
+
+
+def as_document(value: Union[str, Document, None]) -> Document:
+    """Return `value` as a Document, reusing it if it already is one."""
+    return value if isinstance(value, Document) else Document(value or "")
+
+
+def term_counts(value: Union[str, Document, None]) -> Dict[str, int]:
+    """
+    Vectorizer term counts of a text or Document.
+
+    Plain text is counted straight from the token regex, without building
+    the spans and position index a Document needs for phrase matching.
+    """
+    if isinstance(value, Document):
+        return value.term_counts()
+    return dict(Counter(
+        token for token in TOKEN_PATTERN.findall((value or "").lower()) if len(token) > 1
+    ))
+
+
+def vectorizer_analyzer(value: Union[str, Document]) -> List[str]:
+    """`TfidfVectorizer(analyzer=...)` hook reading tokens from a Document."""
+    return as_document(value).terms
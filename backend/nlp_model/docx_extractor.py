@@ -0,0 +1,222 @@
+"""
+Streaming DOCX Text Extraction
+
+Extracts resume text from a .docx package by streaming the main document
+part (normally `word/document.xml`) through `xml.etree.ElementTree.iterparse`
+instead of building a full python-docx object model.
+
+The output follows the layout `ResumeParser` has always produced:
+
+- every top-level paragraph, one per line, in document order
+- then every top-level table, one line per row with each cell's text
+  followed by a space
+
+Paragraph text follows python-docx semantics (runs and hyperlink runs;
+`w:tab`/`w:ptab` -> tab, line breaks -> newline, `w:noBreakHyphen` -> "-").
+Unlike python-docx, a merged cell (horizontal `gridSpan` or vertical
+`vMerge` continuation) is emitted once rather than once per spanned grid
+cell.
+"""
+
+import io
+import posixpath
+import zipfile
+from typing import BinaryIO, List, Optional, Union
+from xml.etree import ElementTree
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+DEFAULT_DOCUMENT_PART = "word/document.xml"
+
+# Refuse document parts that inflate beyond this (zip-bomb guard)
+MAX_DOCUMENT_XML_BYTES = 64 * 1024 * 1024
+
+
+def _w(tag: str) -> str:
+    return f"{{{W_NS}}}{tag}"
+
+
+BODY = _w("body")
+PARAGRAPH = _w("p")
+RUN = _w("r")
+HYPERLINK = _w("hyperlink")
+TABLE = _w("tbl")
+ROW = _w("tr")
+CELL = _w("tc")
+CELL_PROPS = _w("tcPr")
+VMERGE = _w("vMerge")
+TEXT = _w("t")
+BREAK = _w("br")
+BREAK_TYPE = _w("type")
+VAL = _w("val")
+
+# Run children that map to fixed characters
+RUN_CHAR_MAP = {
+    _w("tab"): "\t",
+    _w("ptab"): "\t",
+    _w("cr"): "\n",
+    _w("noBreakHyphen"): "-",
+}
+
+
+def _document_part_name(archive: zipfile.ZipFile) -> str:
+    """Resolve the main document part from the package relationships."""
+    try:
+        with archive.open("_rels/.rels") as rels:
+            for _, elem in ElementTree.iterparse(rels):
+                if (elem.tag == f"{{{REL_NS}}}Relationship"
+                        and elem.get("Type") == OFFICE_DOCUMENT_REL):
+                    return posixpath.normpath(elem.get("Target", "").lstrip("/"))
+    except (KeyError, ElementTree.ParseError):
+        pass
+    return DEFAULT_DOCUMENT_PART
+
+
+class _Collector:
+    """Accumulates text while iterparse walks the document part."""
+
+    def __init__(self):
+        self.paragraph_lines: List[str] = []
+        self.table_lines: List[str] = []
+        self._run_parts: List[str] = []
+        self._cell_paragraphs: List[str] = []
+        self._row_cells: List[str] = []
+        self._skip_cell = False
+
+    def run_child(self, elem: ElementTree.Element) -> None:
+        tag = elem.tag
+        if tag == TEXT:
+            self._run_parts.append(elem.text or "")
+        elif tag == BREAK:
+            if elem.get(BREAK_TYPE, "textWrapping") == "textWrapping":
+                self._run_parts.append("\n")
+        else:
+            char = RUN_CHAR_MAP.get(tag)
+            if char:
+                self._run_parts.append(char)
+
+    def end_paragraph(self, in_cell: bool) -> None:
+        text = "".join(self._run_parts)
+        self._run_parts = []
+        if in_cell:
+            self._cell_paragraphs.append(text)
+        else:
+            self.paragraph_lines.append(text)
+
+    def start_cell(self) -> None:
+        self._cell_paragraphs = []
+        self._skip_cell = False
+
+    def cell_properties(self, elem: ElementTree.Element) -> None:
+        vmerge = elem.find(VMERGE)
+        if vmerge is not None and vmerge.get(VAL, "continue") == "continue":
+            self._skip_cell = True
+
+    def end_cell(self) -> None:
+        if not self._skip_cell:
+            self._row_cells.append("\n".join(self._cell_paragraphs))
+        self._cell_paragraphs = []
+
+    def end_row(self) -> None:
+        self.table_lines.append("".join(cell + " " for cell in self._row_cells))
+        self._row_cells = []
+
+    def text(self) -> str:
+        parts = [line + "\n" for line in self.paragraph_lines]
+        parts.extend(line + "\n" for line in self.table_lines)
+        return "".join(parts).strip()
+
+
+def _extract(stream: BinaryIO) -> str:
+    collector = _Collector()
+    # Stack of open element tags below the document root
+    stack: List[str] = []
+    body_depth: Optional[int] = None
+
+    for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem.tag)
+            if elem.tag == BODY and body_depth is None:
+                body_depth = len(stack)
+            elif body_depth is not None and elem.tag == CELL and _path(stack, body_depth) == (
+                TABLE, ROW, CELL,
+            ):
+                collector.start_cell()
+            continue
+
+        # --- end event ---
+        if body_depth is not None and len(stack) > body_depth:
+            path = _path(stack, body_depth)
+            _handle_end(collector, path, elem)
+            # Top-level blocks and table rows are fully processed; release them.
+            if len(path) == 1 or path == (TABLE, ROW):
+                elem.clear()
+        stack.pop()
+
+    return collector.text()
+
+
+def _path(stack: List[str], body_depth: int) -> tuple:
+    return tuple(stack[body_depth:])
+
+
+# Paragraph positions whose runs contribute text, relative to w:body
+_BODY_PARAGRAPH = (PARAGRAPH,)
+_CELL_PARAGRAPH = (TABLE, ROW, CELL, PARAGRAPH)
+
+
+def _handle_end(collector: _Collector, path: tuple, elem: ElementTree.Element) -> None:
+    # Run content: p/r/X or p/hyperlink/r/X under a body or top-level cell paragraph
+    if len(path) >= 3 and path[-2] == RUN:
+        if path[-3] == PARAGRAPH:
+            paragraph = path[:-2]
+        elif len(path) >= 4 and path[-3] == HYPERLINK and path[-4] == PARAGRAPH:
+            paragraph = path[:-3]
+        else:
+            return
+        if paragraph in (_BODY_PARAGRAPH, _CELL_PARAGRAPH):
+            collector.run_child(elem)
+        return
+
+    if path == _BODY_PARAGRAPH:
+        collector.end_paragraph(in_cell=False)
+    elif path == _CELL_PARAGRAPH:
+        collector.end_paragraph(in_cell=True)
+    elif path == (TABLE, ROW, CELL, CELL_PROPS):
+        collector.cell_properties(elem)
+    elif path == (TABLE, ROW, CELL):
+        collector.end_cell()
+    elif path == (TABLE, ROW):
+        collector.end_row()
+
+
+def extract_docx_text(source: Union[str, BinaryIO, bytes, bytearray, memoryview]) -> str:
+    """
+    Extract text from a DOCX package without building an object model.
+
+    Args:
+        source: Path, seekable binary stream, or the raw file bytes
+
+    Returns:
+        Extracted text (paragraphs first, then table rows)
+
+    Raises:
+        zipfile.BadZipFile: If the source is not a zip package
+        KeyError: If the package has no main document part
+        ValueError: If the document part exceeds MAX_DOCUMENT_XML_BYTES
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    with zipfile.ZipFile(source) as archive:
+        part_name = _document_part_name(archive)
+        info = archive.getinfo(part_name)
+        if info.file_size > MAX_DOCUMENT_XML_BYTES:
+            raise ValueError(
+                f"DOCX document part is too large ({info.file_size} bytes uncompressed)"
+            )
+        with archive.open(info) as part:
+            return _extract(part)
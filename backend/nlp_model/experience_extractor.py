@@ -0,0 +1,229 @@
+"""
+Experience Extraction
+
+Structured years-of-experience parsing for both sides of a match:
+
+- Job postings: `extract_experience_requirement` turns phrases such as
+  "3-5 years of experience", "minimum of five (5) years" or "7+ years
+  preferred" into an `ExperienceRequirement(min_years, max_years,
+  preferred_years)`. A number only counts when its clause talks about
+  experience or states a requirement, so "401k match after 2 years" or
+  "a 10-year-old company" are ignored.
+- Resumes: `estimate_resume_years` sums the dated roles in the experience
+  section ("Jan 2019 - Present", "2016 - 2018", "03/2020 to 06/2021"),
+  merging overlapping periods.
+
+All patterns are compiled once at import; job requirements are parsed once
+per posting at ingestion (`job_fetcher`) and reused by every scoring run.
+"""
+
+import re
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .document import Document
+
+# ========================================
+# Patterns
+# ========================================
+
+WORD_NUMBERS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12, "fifteen": 15,
+    "twenty": 20,
+}
+# Larger figures are company ages or anniversaries, not requirements
+MAX_REQUIRED_YEARS = 30
+
+_NUMBER = r"\d{1,2}|" + "|".join(WORD_NUMBERS)
+YEARS_PATTERN = re.compile(
+    rf"\b(?P<low>{_NUMBER})(?:\s*\(\d{{1,2}}\))?\s*\+?"
+    rf"(?:\s*(?:-|–|—|to)\s*(?P<high>{_NUMBER})(?:\s*\(\d{{1,2}}\))?\s*\+?)?"
+    r"(?:\s+or\s+more)?\s*(?:years?|yrs?)\b(?!\s*old)",
+    re.IGNORECASE,
+)
+CLAUSE_BREAK = re.compile(r"[.;!?\n•]")
+EXPERIENCE_CONTEXT = re.compile(
+    r"experienc|background|track record|hands[- ]on|professional|industry|in (?:a|an)\s+\w+\s+role"
+    r"|working (?:with|in|as|on)",
+    re.IGNORECASE,
+)
+REQUIRED_CONTEXT = re.compile(r"\b(?:required|requires?|minimum|at least|must|mandatory)\b",
+                              re.IGNORECASE)
+PREFERRED_CONTEXT = re.compile(
+    r"\b(?:preferred|preferably|ideally|ideal|desired|desirable|nice to have|bonus|a plus)\b",
+    re.IGNORECASE,
+)
+NOT_EXPERIENCE = re.compile(
+    r"401\s*\(?k\)?|vest(?:ing|ed)?\b|tenure|warranty|anniversary|in business|founded|history of",
+    re.IGNORECASE,
+)
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+_DATE = (
+    r"(?:(?:(?P<{p}mon>jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)[a-z]*\.?,?\s+)"
+    r"|(?P<{p}num>\d{{1,2}})\s*/\s*)?(?P<{p}year>(?:19|20)\d{{2}})"
+)
+DATE_RANGE_PATTERN = re.compile(
+    _DATE.format(p="s") + r"\s*(?:-|–|—|to|until)\s*"
+    r"(?:" + _DATE.format(p="e") + r"|(?P<present>present|current|now|today|date))",
+    re.IGNORECASE,
+)
+
+
+# ========================================
+# Job requirements
+# ========================================
+
+@dataclass(frozen=True)
+class ExperienceRequirement:
+    """
+    Years of experience asked for by a posting.
+
+    Attributes:
+        min_years: Hard minimum (None if the posting only states a preference)
+        max_years: Upper end of a range such as "3-5 years", if given
+        preferred_years: Preferred (soft) minimum, if stated
+    """
+
+    min_years: Optional[int] = None
+    max_years: Optional[int] = None
+    preferred_years: Optional[int] = None
+
+    def as_dict(self) -> Dict[str, Optional[int]]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["ExperienceRequirement"]:
+        if not data:
+            return None
+        return cls(data.get("min_years"), data.get("max_years"), data.get("preferred_years"))
+
+
+def _to_int(token: Optional[str]) -> Optional[int]:
+    if token is None:
+        return None
+    token = token.lower()
+    return WORD_NUMBERS[token] if token in WORD_NUMBERS else int(token)
+
+
+def _clause(text: str, start: int, end: int) -> str:
+    """The sentence or bullet around text[start:end]."""
+    left = max((m.end() for m in CLAUSE_BREAK.finditer(text, 0, start)), default=0)
+    right = CLAUSE_BREAK.search(text, end)
+    return text[left:right.start() if right else len(text)]
+
+
+def extract_experience_requirement(
+    description: Union[str, Document, None],
+) -> Optional[ExperienceRequirement]:
+    """
+    Parse the years of experience a job description asks for.
+
+    The first required (or unqualified) mention sets `min_years`/`max_years`;
+    the first mention qualified as preferred sets `preferred_years`.
+
+    Args:
+        description: Job description text or its preprocessed Document
+
+    Returns:
+        ExperienceRequirement, or None if no experience requirement is stated
+    """
+    if isinstance(description, Document):
+        description = description.normalized
+    if not description:
+        return None
+    hard: Optional[Tuple[int, Optional[int]]] = None
+    preferred: Optional[int] = None
+    for match in YEARS_PATTERN.finditer(description):
+        low, high = _to_int(match.group("low")), _to_int(match.group("high"))
+        if high is not None and high < low:
+            continue
+        if (high or low) > MAX_REQUIRED_YEARS:
+            continue
+        clause = _clause(description, match.start(), match.end())
+        if NOT_EXPERIENCE.search(clause):
+            continue
+        is_preferred = bool(PREFERRED_CONTEXT.search(clause))
+        if not (EXPERIENCE_CONTEXT.search(clause) or REQUIRED_CONTEXT.search(clause)
+                or is_preferred):
+            continue
+        if is_preferred and not REQUIRED_CONTEXT.search(clause):
+            if preferred is None:
+                preferred = low
+        elif hard is None:
+            hard = (low, high)
+        if hard is not None and preferred is not None:
+            break
+    if hard is None and preferred is None:
+        return None
+    min_years, max_years = hard if hard is not None else (None, None)
+    return ExperienceRequirement(min_years, max_years, preferred)
+
+
+# ========================================
+# Resume experience
+# ========================================
+
+def _month_index(mon: Optional[str], num: Optional[str], year: str) -> int:
+    if mon:
+        month = _MONTHS[mon[:3].lower()]
+    elif num and 1 <= int(num) <= 12:
+        month = int(num)
+    else:
+        month = 7  # year only: assume mid-year
+    return int(year) * 12 + month - 1
+
+
+def estimate_resume_years(
+    experience_text: Union[str, Document, None],
+    today: Optional[date] = None,
+) -> float:
+    """
+    Total years covered by the dated roles in a resume's experience section.
+
+    Overlapping roles are merged so concurrent positions are not counted
+    twice. Both ends of a range are inclusive ("Jan 2020 - Dec 2020" is one
+    year); year-only dates are taken as mid-year.
+
+    Args:
+        experience_text: The `experience` section from `parse_sections`
+            (text or Document)
+        today: Reference date for "Present" (defaults to today)
+
+    Returns:
+        Years of experience rounded to one decimal (0.0 if no dated roles)
+    """
+    if isinstance(experience_text, Document):
+        experience_text = experience_text.normalized
+    if not experience_text:
+        return 0.0
+    today = today or date.today()
+    now = today.year * 12 + today.month - 1
+    intervals: List[Tuple[int, int]] = []
+    for match in DATE_RANGE_PATTERN.finditer(experience_text):
+        start = _month_index(match.group("smon"), match.group("snum"), match.group("syear"))
+        if match.group("present"):
+            end = now
+        else:
+            end = _month_index(match.group("emon"), match.group("enum"), match.group("eyear"))
+        end = min(end, now)
+        if start <= end:
+            intervals.append((start, end + 1))
+
+    months = 0
+    current_start, current_end = None, None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                months += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        months += current_end - current_start
+    return round(months / 12, 1)
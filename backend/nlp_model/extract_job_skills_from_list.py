@@ -12,22 +12,25 @@ Author: (your name, Member C)
 
 
 
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from .skills_dict import get_all_skills, normalize_skill
+from .document import Document, PhraseMatcher, as_document, count_phrases
+from .matchers import get_matchers
+from .skills_dict import normalize_skill
 
 
 def extract_job_skills_from_description(
-    description: str,
-    all_skills: List[str]
+    description: Union[str, Document],
+    all_skills: Union[List[str], PhraseMatcher]
 ) -> Dict[str, Any]:
     """
     Extract skills from a single job description based on predefined skill lists.
 
     Args:
-        description (str): The job description text.
-        all_skills (List[str]): Flattened skill list from SKILL_DICT.
+        description (str | Document): The job description text, or its
+                                      preprocessed Document.
+        all_skills (List[str] | PhraseMatcher): Flattened skill list from
+                                      SKILL_DICT, or the compiled skill matcher.
 
     Returns:
         Dict[str, Any]: A dictionary containing extracted skill information:
@@ -52,14 +55,10 @@ def extract_job_skills_from_description(
             "total_count": 0
         }
 
-    for skill in all_skills:
-        pattern = r"\b" + re.escape(skill) + r"\b"
-        matches = re.findall(pattern, description, flags=re.IGNORECASE)
-
-        if matches:
-            normalized = normalize_skill(skill)
-            primary_skills.add(normalized)
-            skill_frequency[normalized] = skill_frequency.get(normalized, 0) + len(matches)
+    for skill, count in count_phrases(as_document(description), all_skills).items():
+        normalized = normalize_skill(skill)
+        primary_skills.add(normalized)
+        skill_frequency[normalized] = skill_frequency.get(normalized, 0) + count
 
     all_skill_set = primary_skills.union(secondary_skills)
 
@@ -74,7 +73,8 @@ def extract_job_skills_from_description(
 
 def extract_job_skills_from_list(
     job_list: List[Dict[str, Any]],
-    skill_dict: Optional[Dict[str, Any]] = None
+    skill_dict: Optional[Dict[str, Any]] = None,
+    documents: Optional[Sequence[Document]] = None
 ) -> List[Dict[str, Any]]:
     """
     Extract required job skills from job_list using job['description'].
@@ -83,6 +83,8 @@ def extract_job_skills_from_list(
         job_list (List[Dict]): List of job dictionaries fetched from backend/APIs.
         skill_dict (Optional[Dict]): Custom skill dictionary similar to SKILL_DICT.
                                      If None, default SKILL_DICT is used.
+        documents (Optional[Sequence[Document]]): Preprocessed descriptions aligned
+                                     with job_list, reused instead of re-tokenizing.
 
     Returns:
         List[Dict[str, Any]]: A list of job items with standardized fields and
@@ -111,16 +113,16 @@ def extract_job_skills_from_list(
             elif isinstance(value, str):
                 merged.append(value)
 
-        all_skills = sorted({
+        all_skills = PhraseMatcher(sorted({
             normalize_skill(s) for s in merged if isinstance(s, str)
-        })
+        }))
     else:
-        all_skills = get_all_skills()
+        all_skills = get_matchers().skills
 
     results: List[Dict[str, Any]] = []
 
     # Process each job in job_list
-    for job in job_list:
+    for index, job in enumerate(job_list):
         title = str(job.get("title", "")).strip()
         company = str(job.get("company", "")).strip()
         location = str(job.get("location", "")).strip()
@@ -128,7 +130,7 @@ def extract_job_skills_from_list(
         apply_link = str(job.get("apply_link", "")).strip()
 
         skills_info = extract_job_skills_from_description(
-            description=description,
+            description=documents[index] if documents is not None else description,
             all_skills=all_skills,
         )
 
@@ -0,0 +1,226 @@
+"""
+Resume Loader Registry
+
+Maps resume files to text extractors by sniffing their leading bytes rather
+than trusting the file extension. Each loader declares:
+
+- `sniff(head)`: True if the first SNIFF_BYTES bytes look like its format
+- `load(stream)`: extract text from a seekable binary stream
+- `max_bytes`: inputs larger than this are rejected before any parsing
+- `interruptible`: `load` also takes a `deadline` and checks it between
+  pages, so an abandoned parse stops early instead of running to the end
+
+Loaders are tried in registration order, so specific binary signatures are
+registered ahead of the permissive text/HTML fallbacks. New formats (or
+faster paths for existing ones) plug in with `register_loader`.
+"""
+
+import importlib.util
+import logging
+import os
+import re
+import struct
+import sys
+import zipfile
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, List, Optional, Tuple
+from xml.etree.ElementTree import ParseError
+
+# PDF parsing (pdfplumber is imported on the first PDF, not at startup)
+PDF_AVAILABLE = importlib.util.find_spec("pdfplumber") is not None
+
+try:
+    from .docx_extractor import extract_docx_text
+    from .text_formats import (
+        SNIFF_BYTES,
+        detect_text_encoding,
+        extract_html_text,
+        extract_plain_text,
+        extract_rtf_text,
+    )
+    from .word97_extractor import OLE_MAGIC, extract_doc_text
+except ImportError:
+    # For standalone testing
+    from docx_extractor import extract_docx_text
+    from text_formats import (
+        SNIFF_BYTES,
+        detect_text_encoding,
+        extract_html_text,
+        extract_plain_text,
+        extract_rtf_text,
+    )
+    from word97_extractor import OLE_MAGIC, extract_doc_text
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Loader:
+    """A registered resume format."""
+
+    name: str
+    sniff: Callable[[bytes], bool]
+    load: Callable[..., str]
+    max_bytes: int
+    interruptible: bool = False
+
+
+LOADERS: List[Loader] = []
+
+
+def register_loader(loader: Loader, first: bool = False) -> None:
+    """Add a loader; `first=True` gives it priority over existing ones."""
+    if first:
+        LOADERS.insert(0, loader)
+    else:
+        LOADERS.append(loader)
+
+
+def detect_loader(head: bytes) -> Optional[Loader]:
+    """Return the first registered loader whose signature matches `head`."""
+    for loader in LOADERS:
+        if loader.sniff(head):
+            return loader
+    return None
+
+
+def stream_size(stream: BinaryIO) -> int:
+    """Size of a seekable stream, leaving its position unchanged."""
+    position = stream.tell()
+    size = stream.seek(0, os.SEEK_END)
+    stream.seek(position)
+    return size - position
+
+
+def _corrupt_file_errors() -> Tuple[type, ...]:
+    """Exception types meaning "this file is damaged", from every parser in use."""
+    errors = [zipfile.BadZipFile, KeyError, struct.error, OverflowError, ParseError]
+    # pdfminer (under pdfplumber) is only imported by the first PDF; a
+    # module that was never imported cannot have raised
+    psexceptions = sys.modules.get("pdfminer.psexceptions") or sys.modules.get("pdfminer.psparser")
+    if psexceptions is not None:
+        errors.append(psexceptions.PSException)
+    plumber_errors = sys.modules.get("pdfplumber.utils.exceptions")
+    if plumber_errors is not None:
+        errors.append(plumber_errors.PdfminerException)
+    return tuple(errors)
+
+
+def check_deadline(deadline: Optional[Any], label: str) -> None:
+    """Raise TimeoutError if `deadline` (anything with `expired()`) has passed."""
+    if deadline is not None and deadline.expired():
+        raise TimeoutError(f"Parsing {label} exceeded the request deadline")
+
+
+def load_document(stream: BinaryIO, label: str = "<stream>",
+                  deadline: Optional[Any] = None) -> str:
+    """
+    Detect the format of `stream` and extract its text.
+
+    Args:
+        stream: Seekable binary stream positioned at the start of the file
+        label: Name used in log and error messages
+        deadline: Request deadline (e.g. `backend.deadline.Deadline`),
+                  checked before parsing and between pages
+
+    Returns:
+        Extracted text
+
+    Raises:
+        ValueError: If the format is unknown, the file exceeds the loader's
+                    size limit, or the content is not valid for its format
+        TimeoutError: If the deadline passes before parsing finishes
+    """
+    position = stream.tell()
+    head = stream.read(SNIFF_BYTES)
+    stream.seek(position)
+
+    loader = detect_loader(head)
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {label}")
+
+    size = stream_size(stream)
+    if size > loader.max_bytes:
+        raise ValueError(
+            f"{loader.name.upper()} file too large: {size} bytes "
+            f"(limit {loader.max_bytes} bytes)"
+        )
+
+    logger.debug("Loading %s as %s (%d bytes)", label, loader.name, size)
+    check_deadline(deadline, label)
+    try:
+        if loader.interruptible:
+            return loader.load(stream, deadline=deadline)
+        return loader.load(stream)
+    except _corrupt_file_errors() as exc:
+        # A zip without a Word document part, a damaged archive, malformed
+        # XML, a PDF pdfminer cannot parse, or binary fields pointing past
+        # the data they describe
+        raise ValueError(f"Corrupt or unsupported {loader.name.upper()} file: {label}") from exc
+
+
+# ========================================
+# Built-in loaders
+# ========================================
+
+def _load_pdf(stream: BinaryIO, deadline: Optional[Any] = None) -> str:
+    if not PDF_AVAILABLE:
+        raise ImportError(
+            "pdfplumber is required for PDF parsing. "
+            "Install with: pip install pdfplumber"
+        )
+
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(stream) as pdf:
+        for page in pdf.pages:
+            check_deadline(deadline, "PDF")
+            page_text = page.extract_text()
+            if page_text:
+                pages.append(page_text + "\n")
+    return "".join(pages).strip()
+
+
+def _is_pdf(head: bytes) -> bool:
+    # The header may be preceded by junk within the first 1024 bytes
+    return b"%PDF-" in head[:1024]
+
+
+def _is_zip(head: bytes) -> bool:
+    return head.startswith(b"PK\x03\x04")
+
+
+def _is_ole(head: bytes) -> bool:
+    return head.startswith(OLE_MAGIC)
+
+
+def _is_rtf(head: bytes) -> bool:
+    return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"{\\rtf")
+
+
+_HTML_SIGNATURE = re.compile(
+    rb"^\s*(?:<\?xml[^>]*>\s*)?(?:<!--.*?-->\s*)*<(?:!doctype\s+html|html|head|body)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _is_html(head: bytes) -> bool:
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    return bool(_HTML_SIGNATURE.match(head))
+
+
+def _is_text(head: bytes) -> bool:
+    complete = len(head) < SNIFF_BYTES
+    return bool(head.strip()) and detect_text_encoding(head, complete) is not None
+
+
+register_loader(Loader("pdf", _is_pdf, _load_pdf, max_bytes=20 * MB, interruptible=True))
+register_loader(Loader("docx", _is_zip, extract_docx_text, max_bytes=20 * MB))
+register_loader(Loader("doc", _is_ole, extract_doc_text, max_bytes=20 * MB))
+register_loader(Loader("rtf", _is_rtf, extract_rtf_text, max_bytes=10 * MB))
+register_loader(Loader("html", _is_html, extract_html_text, max_bytes=5 * MB))
+register_loader(Loader("txt", _is_text, extract_plain_text, max_bytes=2 * MB))
@@ -0,0 +1,163 @@
+"""
+Prebuilt Skill and Role Matchers
+
+The skill matcher (every skill in SKILL_DICT compiled into a
+`PhraseMatcher`) and the role matcher (JOB_ROLE_KEYWORDS with lowercased
+keywords) are built once at image build time and pickled into a single
+artifact:
+
+    python -m backend.nlp_model.matchers --output backend/artifacts/matchers.pkl
+
+`get_matchers()` loads that artifact at startup. The artifact carries a
+fingerprint of the skill and role tables it was built from; if the tables
+have changed since (or the file is missing or unreadable) the matchers are
+compiled in process instead, so a stale artifact can never change results.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+try:
+    from .document import MATCH_RULES_VERSION, TOKEN_PATTERN, PhraseMatcher
+    from .skills_dict import get_all_skills
+except ImportError:
+    # For standalone testing
+    from document import MATCH_RULES_VERSION, TOKEN_PATTERN, PhraseMatcher
+    from skills_dict import get_all_skills
+
+logger = logging.getLogger(__name__)
+
+MATCHER_ARTIFACT_PATH = os.getenv(
+    "MATCHER_ARTIFACT_PATH",
+    str(Path(__file__).resolve().parent.parent / "artifacts" / "matchers.pkl"),
+)
+
+
+class RoleMatcher:
+    """Role keyword table compiled for substring scoring."""
+
+    def __init__(self, role_keywords: Dict[str, Sequence[str]]):
+        self.roles: Tuple[str, ...] = tuple(role_keywords)
+        self.keywords: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(keyword.lower() for keyword in keywords)
+            for keywords in role_keywords.values()
+        )
+
+    def scores(self, text: str) -> Dict[str, int]:
+        """
+        Number of each role's keywords contained in `text` (lowercased).
+
+        Returns:
+            Role -> keyword hits, for roles with at least one hit
+        """
+        result = {}
+        if not text:
+            return result
+        for role, keywords in zip(self.roles, self.keywords, strict=True):
+            score = sum(1 for keyword in keywords if keyword in text)
+            if score > 0:
+                result[role] = score
+        return result
+
+
+class Matchers:
+    """The compiled skill and role matchers plus where they came from."""
+
+    def __init__(self, skills: PhraseMatcher, roles: RoleMatcher, source: str = "compiled"):
+        self.skills = skills
+        self.roles = roles
+        self.source = source
+
+
+def _role_keywords() -> Dict[str, Sequence[str]]:
+    try:
+        from .resume_parser import JOB_ROLE_KEYWORDS
+    except ImportError:
+        from resume_parser import JOB_ROLE_KEYWORDS
+    return JOB_ROLE_KEYWORDS
+
+
+def fingerprint(skills: Sequence[str], role_keywords: Dict[str, Sequence[str]]) -> str:
+    """Digest of the tables, tokenizer and match rules a matcher artifact is built from."""
+    payload = json.dumps(
+        [TOKEN_PATTERN.pattern, MATCH_RULES_VERSION, list(skills),
+         {k: list(v) for k, v in role_keywords.items()}]
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def compile_matchers() -> Matchers:
+    """Build both matchers from the in-code tables."""
+    return Matchers(PhraseMatcher(get_all_skills()), RoleMatcher(_role_keywords()))
+
+
+def build_artifact(path: str = MATCHER_ARTIFACT_PATH) -> str:
+    """
+    Compile the matchers and write them to `path` atomically.
+
+    Returns:
+        The artifact fingerprint
+    """
+    matchers = compile_matchers()
+    digest = fingerprint(matchers.skills.phrases, _role_keywords())
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.with_suffix(target.suffix + ".tmp")
+    with staging.open("wb") as f:
+        pickle.dump(
+            {"fingerprint": digest, "skills": matchers.skills, "roles": matchers.roles},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(staging, target)
+    return digest
+
+
+def load_matchers(path: str = MATCHER_ARTIFACT_PATH) -> Matchers:
+    """Load the prebuilt artifact, or compile if it is missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+        expected = fingerprint(get_all_skills(), _role_keywords())
+        if artifact.get("fingerprint") == expected:
+            return Matchers(artifact["skills"], artifact["roles"], source=path)
+        logger.warning("Matcher artifact %s is stale; compiling matchers instead", path)
+    except FileNotFoundError:
+        logger.info("No matcher artifact at %s; compiling matchers", path)
+    except Exception as exc:
+        logger.warning("Cannot load matcher artifact %s (%s); compiling matchers", path, exc)
+    return compile_matchers()
+
+
+_matchers: Optional[Matchers] = None
+_matchers_lock = threading.Lock()
+
+
+def get_matchers() -> Matchers:
+    """Return the process-wide matchers, loading them on first use."""
+    global _matchers
+    if _matchers is None:
+        with _matchers_lock:
+            if _matchers is None:
+                _matchers = load_matchers()
+    return _matchers
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Prebuild the skill and role matcher artifact.")
+    parser.add_argument("--output", default=MATCHER_ARTIFACT_PATH,
+                        help="artifact path (default: MATCHER_ARTIFACT_PATH)")
+    args = parser.parse_args(argv)
+    digest = build_artifact(args.output)
+    print(f"Wrote matcher artifact {args.output} ({digest[:12]})")
+
+
+if __name__ == "__main__":
+    main()
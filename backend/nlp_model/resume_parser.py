@@ -1,23 +1,22 @@
+import io
 import logging
 import os
 import re
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 
-# PDF parsing
+# Format detection and text extraction (PDF, DOCX, DOC, RTF, HTML, TXT)
 try:
-    import pdfplumber
-    PDF_AVAILABLE = True
+    from .loaders import load_document
 except ImportError:
-    PDF_AVAILABLE = False
-    print("Warning: pdfplumber not installed. PDF parsing will not be available.")
+    # For standalone testing
+    from loaders import load_document
 
-# DOCX parsing
+# Shared tokenization (one pass per section, reused by every matcher)
 try:
-    from docx import Document
-    DOCX_AVAILABLE = True
+    from .document import as_document, count_phrases
 except ImportError:
-    DOCX_AVAILABLE = False
-    print("Warning: python-docx not installed. DOCX parsing will not be available.")
+    # For standalone testing
+    from document import as_document, count_phrases
 
 # Import skill dictionary
 try:
@@ -26,6 +25,13 @@ except ImportError:
     # For standalone testing
     from skills_dict import get_all_skills, normalize_skill
 
+# Prebuilt skill/role matchers (see matchers.py)
+try:
+    from .matchers import get_matchers
+except ImportError:
+    # For standalone testing
+    from matchers import get_matchers
+
 # ========================================
 # Logging Configuration
 # ========================================
@@ -138,6 +144,8 @@ JOB_ROLE_KEYWORDS = {
     ]
 }
 
+ResumeSource = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, BinaryIO]
+
 # ========================================
 # Helper Functions
 # ========================================
@@ -290,117 +298,82 @@ class ResumeParser:
     def __init__(self):
         """Initialize the resume parser."""
         self.all_skills = get_all_skills()
+        matchers = get_matchers()
+        self.skill_matcher = matchers.skills
+        self.role_matcher = matchers.roles
         logger.info("ResumeParser initialized with %d skills", len(self.all_skills))
 
     # ========================================
     # File Loading Methods
     # ========================================
 
-    def load_resume(self, file_path: str) -> str:
+    def load_resume(self, source: ResumeSource, file_name: Optional[str] = None,
+                    deadline: Optional[Any] = None) -> str:
         """
-        Load a resume file and extract its text content.
+        Load a resume and extract its text content.
 
-        Supports PDF and DOCX formats. Automatically detects file type
-        based on extension.
+        Supports PDF, DOCX, legacy Word (.doc), RTF, HTML and plain text.
+        `source` may be a filesystem path or the file contents themselves
+        (bytes, bytearray, memoryview or a binary file-like object), so
+        uploads can be parsed straight from memory without a temporary file.
+        The format is detected from the leading bytes (see loaders.py), so a
+        misnamed or extension-less file is still parsed correctly.
 
         Args:
-            file_path: Path to the resume file
+            source: Path to the resume file, or its contents
+            file_name: Original file name, used in log and error messages
+            deadline: Request deadline, checked between pages (see loaders.py)
 
         Returns:
             Extracted text content
 
         Raises:
-            FileNotFoundError: If file doesn't exist
-            ValueError: If file format is not supported
+            FileNotFoundError: If a path is given and the file doesn't exist
+            ValueError: If the format is not supported, the file is too large
+                        for its format, or its content is corrupt
+            TimeoutError: If the deadline passes before parsing finishes
 
         Example:
             >>> parser = ResumeParser()
             >>> text = parser.load_resume("resume.pdf")
-            >>> print(len(text))
-            5000
+            >>> text = parser.load_resume(upload_bytes, file_name="resume.docx")
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File not found: {file_path}")
-
-        _, file_extension = os.path.splitext(file_path)
-        file_extension = file_extension.lower()
-
-        if file_extension == '.pdf':
-            return self._load_pdf(file_path)
-        elif file_extension in ['.docx', '.doc']:
-            return self._load_docx(file_path)
-        else:
-            raise ValueError(f"Unsupported file format: {file_extension}")
-
-    def _load_pdf(self, file_path: str) -> str:
-        """
-        Extract text from a PDF file.
-
-        Args:
-            file_path: Path to PDF file
-
-        Returns:
-            Extracted text
-        """
-        if not PDF_AVAILABLE:
-            raise ImportError(
-                "pdfplumber is required for PDF parsing. "
-                "Install with: pip install pdfplumber"
+        if isinstance(source, (str, os.PathLike)):
+            file_path = os.fspath(source)
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            with open(file_path, "rb") as stream:
+                return self._load_stream(stream, file_name or file_path, deadline)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return self._load_stream(io.BytesIO(source), file_name or "<bytes>", deadline)
+        if hasattr(source, "read"):
+            return self._load_stream(
+                source, file_name or getattr(source, "name", "<stream>"), deadline
             )
+        raise TypeError(f"Unsupported resume source: {type(source).__name__}")
 
-        try:
-            text = ""
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-
-            logger.info(f"PDF parsed successfully: {len(text)} characters from {file_path}")
-            return text.strip()
-
-        except Exception as exc:
-            logger.error("Error parsing PDF %s: %s", file_path, exc)
-            raise
-
-    def _load_docx(self, file_path: str) -> str:
+    def _load_stream(self, stream: BinaryIO, label: str,
+                     deadline: Optional[Any] = None) -> str:
         """
-        Extract text from a DOCX file.
+        Extract text from a seekable binary stream via the loader registry.
 
         Args:
-            file_path: Path to DOCX file
+            stream: Seekable binary stream positioned at the start of the file
+            label: Name used in log messages
+            deadline: Request deadline passed on to the loader
 
         Returns:
             Extracted text
         """
-        if not DOCX_AVAILABLE:
-            raise ImportError(
-                "python-docx is required for DOCX parsing. "
-                "Install with: pip install python-docx"
-            )
-
         try:
-            doc = Document(file_path)
-            text = ""
-
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-
-            # Extract text from tables (if any)
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
-
-            logger.info(f"DOCX parsed successfully: {len(text)} characters from {file_path}")
-            return text.strip()
-
+            text = load_document(stream, label, deadline)
         except Exception as exc:
-            logger.error("Error parsing DOCX %s: %s", file_path, exc)
+            logger.error("Error parsing resume %s: %s", label, exc)
             raise
 
+        logger.info(f"Resume parsed successfully: {len(text)} characters from {label}")
+        return text.strip()
+
     # ========================================
     # Section Parsing Methods
     # ========================================
@@ -612,61 +585,48 @@ class ResumeParser:
         secondary_skills = set()    # Skills in other sections
         skill_frequency = {}        # Track how often each skill appears
 
-        # Search in Skills section first
-        skills_section = sections.get('skills', '')
-        for skill in self.all_skills:
-            # Use word boundary matching to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            matches = re.findall(pattern, skills_section, re.IGNORECASE)
-
-            if matches:
-                normalized = normalize_skill(skill)
-                primary_skills.add(normalized)
-                skill_frequency[normalized] = len(matches)
+        # Search in Skills section first (whole-token matches, so "C" does
+        # not match inside "C++")
+        skills_section = as_document(sections.get('skills', ''))
+        for skill, count in count_phrases(skills_section, self.skill_matcher).items():
+            normalized = normalize_skill(skill)
+            primary_skills.add(normalized)
+            skill_frequency[normalized] = count
 
         # Search in other named sections (experience, projects, summary, education)
-        named_sections = (
-            sections.get('experience', '') + ' ' +
-            sections.get('projects', '') + ' ' +
-            sections.get('summary', '') + ' ' +
-            sections.get('education', '')
-        )
-
-        for skill in self.all_skills:
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            matches = re.findall(pattern, named_sections, re.IGNORECASE)
-
-            if matches:
-                normalized = normalize_skill(skill)
-                if normalized not in primary_skills:
-                    secondary_skills.add(normalized)
-                    skill_frequency[normalized] = len(matches)
-                else:
-                    # Add to existing count
-                    skill_frequency[normalized] += len(matches)
+        named_counts: Dict[str, int] = {}
+        for name in ('experience', 'projects', 'summary', 'education'):
+            section = as_document(sections.get(name, ''))
+            for skill, count in count_phrases(section, self.skill_matcher).items():
+                named_counts[skill] = named_counts.get(skill, 0) + count
+
+        for skill, count in named_counts.items():
+            normalized = normalize_skill(skill)
+            if normalized not in primary_skills:
+                secondary_skills.add(normalized)
+                skill_frequency[normalized] = count
+            else:
+                # Add to existing count
+                skill_frequency[normalized] += count
 
         # CRITICAL FALLBACK: If no skills found yet, search in 'other' section
         # This handles cases where section parsing failed and all content is in 'other'
         all_found = primary_skills.union(secondary_skills)
 
         if not all_found:
-            other_section = sections.get('other', '')
+            other_section = as_document(sections.get('other', ''))
             if other_section:
                 logger.info("No skills found in named sections. "
                            "Searching in 'other' section as fallback...")
 
-                for skill in self.all_skills:
-                    pattern = r'\b' + re.escape(skill) + r'\b'
-                    matches = re.findall(pattern, other_section, re.IGNORECASE)
-
-                    if matches:
-                        normalized = normalize_skill(skill)
-                        # Treat all skills from 'other' as secondary since
-                        # we couldn't identify the Skills section
-                        secondary_skills.add(normalized)
-                        skill_frequency[normalized] = (
-                            skill_frequency.get(normalized, 0) + len(matches)
-                        )
+                for skill, count in count_phrases(other_section, self.skill_matcher).items():
+                    normalized = normalize_skill(skill)
+                    # Treat all skills from 'other' as secondary since
+                    # we couldn't identify the Skills section
+                    secondary_skills.add(normalized)
+                    skill_frequency[normalized] = (
+                        skill_frequency.get(normalized, 0) + count
+                    )
 
                 if secondary_skills:
                     logger.info(
@@ -677,21 +637,17 @@ class ResumeParser:
         # Even if we found some skills, also search 'other' to ensure completeness
         # This catches cases where some content wasn't properly categorized
         elif sections.get('other', ''):
-            other_section = sections.get('other', '')
+            other_section = as_document(sections.get('other', ''))
             additional_found = 0
 
-            for skill in self.all_skills:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                matches = re.findall(pattern, other_section, re.IGNORECASE)
-
-                if matches:
-                    normalized = normalize_skill(skill)
-                    if normalized not in primary_skills and normalized not in secondary_skills:
-                        secondary_skills.add(normalized)
-                        skill_frequency[normalized] = len(matches)
-                        additional_found += 1
-                    elif normalized in skill_frequency:
-                        skill_frequency[normalized] += len(matches)
+            for skill, count in count_phrases(other_section, self.skill_matcher).items():
+                normalized = normalize_skill(skill)
+                if normalized not in primary_skills and normalized not in secondary_skills:
+                    secondary_skills.add(normalized)
+                    skill_frequency[normalized] = count
+                    additional_found += 1
+                elif normalized in skill_frequency:
+                    skill_frequency[normalized] += count
 
             if additional_found > 0:
                 logger.debug(f"Found {additional_found} additional skills in 'other' section")
@@ -742,66 +698,41 @@ class ResumeParser:
             >>> print(roles)
             ['Data Scientist', 'Machine Learning Engineer']
         """
-        target_roles = []
+        return self.rank_roles(self.score_roles(sections), user_input)
 
-        # Step 1: Handle explicit user input
-        if user_input:
-            user_input_clean = user_input.strip()
+    def score_roles(self, sections: Dict[str, str]) -> Dict[str, int]:
+        """
+        Role keyword hits from the resume alone (independent of user input).
 
-            # Check if user input matches any of our predefined roles
-            for role in JOB_ROLE_KEYWORDS.keys():
-                if (user_input_clean.lower() in role.lower() or
-                    role.lower() in user_input_clean.lower()):
-                    if role not in target_roles:
-                        target_roles.append(role)
+        Reads the summary, then skills and experience, then the 'other'
+        section, stopping at the first that mentions any role keyword.
 
-            # If no match found, add user input directly
-            if not target_roles:
-                target_roles.append(user_input_clean)
-                logger.info(f"Using custom role from user: {user_input_clean}")
+        Args:
+            sections: Dictionary of resume sections
 
+        Returns:
+            Role -> keyword hits, for roles with at least one hit
+        """
         # Step 2: Analyze Summary/Objective section
-        summary_text = sections.get('summary', '').lower()
-        role_scores = {}
-
-        if summary_text:
-            for role, keywords in JOB_ROLE_KEYWORDS.items():
-                score = 0
-                for keyword in keywords:
-                    if keyword in summary_text:
-                        score += 1
-                if score > 0:
-                    role_scores[role] = score
+        summary_text = as_document(sections.get('summary', '')).normalized
+        role_scores = self.role_matcher.scores(summary_text)
 
         # Step 3: If no summary info, analyze skills and experience
         if not role_scores:
-            skills_text = sections.get('skills', '').lower()
-            experience_text = sections.get('experience', '').lower()
+            skills_text = as_document(sections.get('skills', '')).normalized
+            experience_text = as_document(sections.get('experience', '')).normalized
             combined_text = skills_text + ' ' + experience_text
-
-            for role, keywords in JOB_ROLE_KEYWORDS.items():
-                score = 0
-                for keyword in keywords:
-                    if keyword in combined_text:
-                        score += 1
-                if score > 0:
-                    role_scores[role] = score
+            role_scores = self.role_matcher.scores(combined_text)
 
         # Step 4: FALLBACK - If still no roles found, search in 'other' section
         # This handles cases where section parsing failed
         if not role_scores:
-            other_text = sections.get('other', '').lower()
+            other_text = as_document(sections.get('other', '')).normalized
             if other_text:
                 logger.info("No roles found in named sections. "
                            "Searching in 'other' section as fallback...")
 
-                for role, keywords in JOB_ROLE_KEYWORDS.items():
-                    score = 0
-                    for keyword in keywords:
-                        if keyword in other_text:
-                            score += 1
-                    if score > 0:
-                        role_scores[role] = score
+                role_scores = self.role_matcher.scores(other_text)
 
                 if role_scores:
                     logger.info(
@@ -809,6 +740,39 @@ class ResumeParser:
                         len(role_scores),
                     )
 
+        return role_scores
+
+    @staticmethod
+    def rank_roles(role_scores: Dict[str, int],
+                   user_input: Optional[str] = None) -> List[str]:
+        """
+        Combine explicit user input with `score_roles` output.
+
+        Args:
+            role_scores: Role keyword hits from score_roles()
+            user_input: Optional explicit job title from user
+
+        Returns:
+            List of inferred job roles (user matches first, then up to 3 scored)
+        """
+        target_roles = []
+
+        # Step 1: Handle explicit user input
+        if user_input:
+            user_input_clean = user_input.strip()
+
+            # Check if user input matches any of our predefined roles
+            for role in JOB_ROLE_KEYWORDS.keys():
+                if (user_input_clean.lower() in role.lower() or
+                    role.lower() in user_input_clean.lower()):
+                    if role not in target_roles:
+                        target_roles.append(role)
+
+            # If no match found, add user input directly
+            if not target_roles:
+                target_roles.append(user_input_clean)
+                logger.info(f"Using custom role from user: {user_input_clean}")
+
         # Sort roles by score and add top 3 (excluding user input if already added)
         sorted_roles = sorted(role_scores.items(),
                             key=lambda x: x[1], reverse=True)
@@ -0,0 +1,166 @@
+# backend/nlp_model/resume_profile.py
+
+"""
+Resume-side features, extracted once and reused for any job list.
+
+Scoring a resume against jobs needs the same resume features every time:
+its term frequencies (TF-IDF), its skills (skill overlap), its role keyword
+hits (role intent) and its years of experience. `build_resume_profile`
+parses and tokenizes the resume once and keeps only those features. The
+resulting `ResumeProfile` can be passed to `score_jobs` for any number of
+job lists, and `to_dict`/`from_dict` round-trip it through JSON or a cache.
+
+Term frequencies are kept per `parse_sections` section. `term_vector`
+combines them into one sparse vector with per-section weights
+(`TFIDF_SECTION_WEIGHTS`), so skills and experience count for more than
+contact details or education. Because cosine similarity ignores scale, a
+resume whose text all lands in one section scores exactly as if
+unweighted. IDF is not applied here: it belongs to the job corpus the
+resume is compared with (a per-request job list or the prebuilt job
+index), see `tfidf_matcher.compute_tfidf_scores` and
+`JobIndex.resume_vector`.
+
+Example:
+    >>> profile = build_resume_profile(resume_text)
+    >>> for job_list in (analyst_jobs, engineer_jobs):
+    ...     state = score_jobs(profile, job_list, "Analyst", "Ohio", "3")
+"""
+
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Set
+
+from .document import Document
+from .experience_extractor import estimate_resume_years
+from .resume_parser import ResumeParser
+
+# Bump when the meaning of a field changes, so stale cached profiles are rebuilt
+PROFILE_VERSION = 3
+
+DEFAULT_SECTION_WEIGHTS = {
+    "skills": 2.0,
+    "experience": 1.5,
+    "projects": 1.0,
+    "summary": 1.0,
+    "education": 0.25,
+    # Contact details, and anything under an unrecognized header
+    "other": 0.25,
+}
+
+
+def parse_section_weights(spec: str) -> Dict[str, float]:
+    """
+    Parse `"skills=2,experience=1.5"` over the defaults.
+
+    Raises:
+        ValueError: For an unknown section or a negative or non-numeric weight
+    """
+    weights = dict(DEFAULT_SECTION_WEIGHTS)
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        name = name.strip().lower()
+        if name not in DEFAULT_SECTION_WEIGHTS:
+            raise ValueError(f"Unknown resume section {name!r} in section weights")
+        weight = float(value)
+        if weight < 0:
+            raise ValueError(f"Section weight for {name!r} must be >= 0")
+        weights[name] = weight
+    return weights
+
+
+SECTION_WEIGHTS = parse_section_weights(os.getenv("TFIDF_SECTION_WEIGHTS", ""))
+
+
+@dataclass
+class ResumeProfile:
+    """
+    Parsed, job-independent features of one resume.
+
+    Attributes:
+        section_term_counts: Section -> vectorizer term -> occurrences
+            (one sparse TF vector per non-empty section)
+        skills: Extracted skills, canonical names (`all_skills`)
+        role_scores: Role -> keyword hits, before any user-supplied title
+        resume_years: Years covered by the dated roles in the experience section
+        version: `PROFILE_VERSION` the profile was built with
+    """
+
+    section_term_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    skills: List[str] = field(default_factory=list)
+    role_scores: Dict[str, int] = field(default_factory=dict)
+    resume_years: float = 0.0
+    version: int = PROFILE_VERSION
+
+    @property
+    def skill_set(self) -> Set[str]:
+        """Lowercased skills, as compared with job skills."""
+        return {skill.lower().strip() for skill in self.skills}
+
+    def term_vector(self, weights: Optional[Mapping[str, float]] = None) -> Dict[str, float]:
+        """
+        Section-weighted sparse term-frequency vector: sum of `weight * tf` per section.
+
+        Args:
+            weights: Section -> weight (defaults to `SECTION_WEIGHTS`);
+                sections not listed are dropped
+        """
+        weights = SECTION_WEIGHTS if weights is None else weights
+        vector: Dict[str, float] = {}
+        for section, counts in self.section_term_counts.items():
+            weight = weights.get(section, 0.0)
+            if not weight:
+                continue
+            for term, count in counts.items():
+                vector[term] = vector.get(term, 0.0) + weight * count
+        return vector
+
+    def target_roles(self, user_input: Optional[str] = None) -> List[str]:
+        """Target roles for a search title, as `infer_target_roles` would return."""
+        return ResumeParser.rank_roles(self.role_scores, user_input)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (see `from_dict`)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResumeProfile":
+        """
+        Rebuild a profile from `to_dict` output.
+
+        Raises:
+            ValueError: If it was built by an incompatible version
+        """
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(
+                f"Resume profile version {data.get('version')!r} != {PROFILE_VERSION}"
+            )
+        return cls(**data)
+
+
+def build_resume_profile(
+    resume_text: str,
+    parser: Optional[ResumeParser] = None,
+) -> ResumeProfile:
+    """
+    Parse a resume once into its reusable scoring features.
+
+    Args:
+        resume_text: Extracted resume text
+        parser: ResumeParser to reuse (one is created if omitted)
+
+    Returns:
+        ResumeProfile
+    """
+    parser = parser or ResumeParser()
+    sections = parser.parse_sections(resume_text)
+    section_docs = {name: Document(text) for name, text in sections.items()}
+
+    extracted = parser.extract_skills(section_docs)
+    return ResumeProfile(
+        section_term_counts={
+            name: document.term_counts() for name, document in section_docs.items() if document
+        },
+        skills=list(extracted["all_skills"]),
+        role_scores=parser.score_roles(section_docs),
+        resume_years=estimate_resume_years(section_docs.get("experience")),
+    )
@@ -0,0 +1,331 @@
+"""
+Plain Text, HTML and RTF Extraction
+
+Pure-Python extractors used by the loader registry in loaders.py. Plain
+text and HTML are decoded incrementally, `CHUNK_SIZE` bytes at a time. RTF
+is read whole and tokenized in one pass. The caller is responsible for
+rejecting inputs above the loader's size limit before calling them, which
+bounds the memory each extractor needs.
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import BinaryIO, List, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+SNIFF_BYTES = 4096
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_HORIZONTAL_SPACE = re.compile(r"[ \t\f\v\xa0]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def detect_text_encoding(head: bytes, complete: bool = False) -> Optional[str]:
+    """
+    Guess the encoding of a text document from its leading bytes.
+
+    Args:
+        head: Leading bytes of the document
+        complete: True if `head` is the whole document (no truncated tail)
+
+    Returns:
+        Codec name, or None if the bytes do not look like text
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    if b"\x00" in head:
+        return None
+    try:
+        head.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as exc:
+        # A multi-byte sequence cut off by the sniff window is still UTF-8
+        if (not complete and exc.start >= len(head) - 3
+                and exc.reason == "unexpected end of data"):
+            return "utf-8"
+    # Legacy single-byte text: accept if it is overwhelmingly printable
+    printable = sum(1 for b in head if b >= 0x20 or b in (0x09, 0x0A, 0x0D))
+    return "cp1252" if head and printable / len(head) > 0.95 else None
+
+
+def _iter_decoded(stream: BinaryIO, encoding: str):
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                yield tail
+            return
+        yield decoder.decode(chunk)
+
+
+def _tidy(text: str) -> str:
+    lines = [_HORIZONTAL_SPACE.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+# ========================================
+# Plain text
+# ========================================
+
+def extract_plain_text(stream: BinaryIO) -> str:
+    """Decode a plain-text resume, normalising line endings."""
+    position = stream.tell()
+    head = stream.read(SNIFF_BYTES)
+    encoding = detect_text_encoding(head, complete=len(head) < SNIFF_BYTES) or "cp1252"
+    stream.seek(position)
+    parts = list(_iter_decoded(stream, encoding))
+    return "".join(parts).replace("\r\n", "\n").replace("\r", "\n").strip()
+
+
+# ========================================
+# HTML
+# ========================================
+
+# Tags whose start or end begins a new line of text
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+    "table", "tbody", "thead", "tfoot", "tr", "ul",
+}
+_CELL_TAGS = {"td", "th"}
+_SKIPPED_TAGS = {"script", "style", "noscript", "template", "head", "svg"}
+
+
+class _HTMLTextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def _break_line(self):
+        # Adjacent block boundaries (</li><li>, </h1><ul>) yield one line break
+        if self.parts and self.parts[-1] != "\n":
+            self.parts.append("\n")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self._break_line()
+        elif tag in _CELL_TAGS:
+            self.parts.append(" ")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self._break_line()
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self._break_line()
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data.replace("\n", " "))
+
+
+_META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+
+def extract_html_text(stream: BinaryIO) -> str:
+    """Extract visible text from an HTML resume, keeping block structure as lines."""
+    position = stream.tell()
+    head = stream.read(SNIFF_BYTES)
+    stream.seek(position)
+
+    encoding = None
+    match = _META_CHARSET.search(head)
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            encoding = None
+    encoding = (encoding or detect_text_encoding(head, complete=len(head) < SNIFF_BYTES)
+                or "cp1252")
+
+    parser = _HTMLTextParser()
+    for text in _iter_decoded(stream, encoding):
+        parser.feed(text)
+    parser.close()
+    return _tidy("".join(parser.parts))
+
+
+# ========================================
+# RTF
+# ========================================
+
+# Destinations whose content is never visible text
+_RTF_SKIP_DESTINATIONS = {
+    "fonttbl", "colortbl", "stylesheet", "info", "pict", "object", "themedata",
+    "colorschememapping", "datastore", "latentstyles", "rsidtbl", "listtable",
+    "listoverridetable", "generator", "xmlnstbl", "mmathPr", "fldinst", "header",
+    "footer", "headerl", "headerr", "headerf", "footerl", "footerr", "footerf",
+    "filetbl", "revtbl", "pgdsctbl", "bkmkstart", "bkmkend", "xe", "tc", "wgrffmtfilter",
+    "nonshppict", "blipuid", "shpinst", "sp", "sv", "sn",
+}
+
+_RTF_SPECIAL_WORDS = {
+    "par": "\n", "line": "\n", "sect": "\n", "page": "\n", "row": "\n",
+    "tab": "\t", "cell": " ", "emdash": "\u2014", "endash": "\u2013",
+    "bullet": "\u2022", "lquote": "\u2018", "rquote": "\u2019",
+    "ldblquote": "\u201c", "rdblquote": "\u201d", "emspace": " ", "enspace": " ",
+    "qmspace": " ",
+}
+
+_RTF_TOKEN = re.compile(
+    r"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"   # control word with optional parameter
+    r"|\\'([0-9a-fA-F]{2})"                # hex-escaped byte
+    r"|\\(.)"                              # control symbol
+    r"|([{}])"                             # group delimiters
+    r"|([\r\n]+)"                          # raw newlines are not content
+    r"|([^\\{}\r\n]+)",                    # plain text run
+    re.DOTALL,
+)
+
+
+def _rtf_unicode(code: int, high_surrogate: Optional[int]) -> Tuple[str, Optional[int]]:
+    """
+    Decode one `\\uN` parameter, a signed 16-bit UTF-16 code unit.
+
+    Returns:
+        (text to emit, high surrogate waiting for its low half); invalid
+        units (out of range, unpaired surrogates) emit nothing
+    """
+    if -0x8000 <= code < 0:
+        code += 0x10000
+    if not 0 <= code <= 0xFFFF:
+        return "", None
+    if 0xD800 <= code < 0xDC00:
+        return "", code
+    if 0xDC00 <= code < 0xE000:
+        if high_surrogate is None:
+            return "", None
+        return chr(0x10000 + ((high_surrogate - 0xD800) << 10) + (code - 0xDC00)), None
+    return chr(code), None
+
+
+def extract_rtf_text(stream: BinaryIO) -> str:
+    """
+    Convert an RTF document to plain text in a single tokenizer pass.
+
+    The document is read whole (unlike plain text and HTML). Handles groups,
+    ignorable (`\\*`) and known non-text destinations, `\\'hh` escapes in the
+    document code page, and `\\uN` Unicode escapes with their `\\ucN`
+    fallback characters. Surrogate pairs are joined; out-of-range and
+    unpaired code units are skipped.
+    """
+    # RTF is 7-bit; latin-1 maps every byte one-to-one for the tokenizer.
+    data = stream.read().decode("latin-1")
+
+    out: List[str] = []
+    pending_bytes = bytearray()
+    codepage = "cp1252"
+    # Per-group state: (skip, unicode fallback count)
+    stack = []
+    skip = False
+    uc = 1
+    fallback_to_skip = 0
+    expect_destination = False
+    high_surrogate = None
+
+    def flush_bytes():
+        if pending_bytes:
+            out.append(pending_bytes.decode(codepage, errors="replace"))
+            pending_bytes.clear()
+
+    for match in _RTF_TOKEN.finditer(data):
+        word, param, hex_byte, symbol, brace, newline, text = match.groups()
+
+        if brace == "{":
+            flush_bytes()
+            stack.append((skip, uc))
+            expect_destination = False
+            continue
+        if brace == "}":
+            flush_bytes()
+            if stack:
+                skip, uc = stack.pop()
+            fallback_to_skip = 0
+            expect_destination = False
+            continue
+        if newline:
+            continue
+
+        is_first_in_group = expect_destination
+        expect_destination = False
+
+        if word:
+            if word in _RTF_SKIP_DESTINATIONS:
+                skip = True
+            elif is_first_in_group and not skip:
+                # Unknown destination after \*: ignorable by definition
+                skip = True
+            elif word == "ansicpg" and param:
+                codepage = f"cp{param}"
+                try:
+                    codecs.lookup(codepage)
+                except LookupError:
+                    codepage = "cp1252"
+            elif word == "uc" and param is not None:
+                uc = max(0, min(int(param), 0xFFFF))
+            elif word == "u" and param is not None and not skip:
+                flush_bytes()
+                char, high_surrogate = _rtf_unicode(int(param), high_surrogate)
+                out.append(char)
+                fallback_to_skip = uc
+            elif not skip and word in _RTF_SPECIAL_WORDS:
+                flush_bytes()
+                out.append(_RTF_SPECIAL_WORDS[word])
+            continue
+
+        if symbol is not None:
+            if symbol == "*":
+                expect_destination = True
+                continue
+            if skip:
+                continue
+            if fallback_to_skip:
+                fallback_to_skip -= 1
+                continue
+            flush_bytes()
+            if symbol in "\\{}":
+                out.append(symbol)
+            elif symbol == "~":
+                out.append(" ")
+            elif symbol == "_":
+                out.append("-")
+            elif symbol in "\r\n":
+                out.append("\n")
+            continue
+
+        if hex_byte is not None:
+            if skip:
+                continue
+            if fallback_to_skip:
+                fallback_to_skip -= 1
+                continue
+            pending_bytes.append(int(hex_byte, 16))
+            continue
+
+        if text and not skip:
+            if fallback_to_skip:
+                dropped = min(fallback_to_skip, len(text))
+                text = text[dropped:]
+                fallback_to_skip -= dropped
+            if text:
+                flush_bytes()
+                out.append(text)
+
+    flush_bytes()
+    return _tidy("".join(out))
@@ -1,33 +1,116 @@
 # backend/nlp_model/tfidf_matcher.py
 
-from typing import Dict, List
+"""
+TF-IDF cosine similarity between a resume and a job list.
 
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+The job descriptions are counted into a sparse matrix. The resume enters
+as one sparse term-frequency vector, so a profile built once is never
+re-tokenized:
 
+- a `ResumeProfile` contributes its section-weighted `term_vector`
+  (skills and experience outweigh contact details and education)
+- raw text or a Document contributes its plain term counts
 
-def compute_tfidf_scores(resume_text: str, job_list: List[Dict]) -> List[float]:
+Weights otherwise follow scikit-learn's `TfidfVectorizer` defaults: smoothed
+IDF over the jobs plus the resume (`ln((1 + n) / (1 + df)) + 1`),
+L2-normalised rows, and the `max_features` most frequent terms.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from .document import Document, as_document
+from .resume_profile import ResumeProfile
+
+MAX_FEATURES = 5000
+
+ResumeInput = Union[str, Document, ResumeProfile]
+
+
+def resume_term_vector(
+    resume: ResumeInput,
+    section_weights: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Sparse term-frequency vector of a resume given as text, Document or profile.
+
+    Only a profile knows its sections, so `section_weights` (default
+    `SECTION_WEIGHTS`) applies to profiles alone.
+    """
+    if isinstance(resume, ResumeProfile):
+        return resume.term_vector(section_weights)
+    return dict(as_document(resume).term_counts())
+
+
+def compute_tfidf_scores(
+    resume_text: ResumeInput,
+    job_list: List[Dict],
+    documents: Optional[Sequence[Document]] = None,
+    max_features: int = MAX_FEATURES,
+    section_weights: Optional[Mapping[str, float]] = None,
+) -> List[float]:
     """
     Compute TF-IDF cosine similarity between resume_text and each job description.
 
+    `resume_text` may be raw text, a preprocessed Document or a
+    ResumeProfile, and `documents` the preprocessed job descriptions
+    aligned with job_list; their tokens are reused instead of re-tokenizing.
+    `section_weights` overrides `SECTION_WEIGHTS` for a profile.
+
     Returns:
         A list of scores in [0, 1], aligned with job_list order.
     """
-    # Collect corpus: resume + all job descriptions
-    descriptions = [str(job.get("description", "") or "") for job in job_list]
-    corpus = [resume_text] + descriptions
+    # scipy is slow to import; defer it to the first call
+    from scipy import sparse
+
+    if documents is None:
+        documents = [as_document(str(job.get("description", "") or "")) for job in job_list]
+    if not documents:
+        return []
+
+    # Jobs x terms count matrix, built directly in CSR form
+    vocabulary: Dict[str, int] = {}
+    indptr, indices, counts = [0], [], []
+    for document in documents:
+        for term, count in document.term_counts().items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(count)
+        indptr.append(len(indices))
+    resume_counts = resume_term_vector(resume_text, section_weights)
+    for term in resume_counts:
+        vocabulary.setdefault(term, len(vocabulary))
+    if not vocabulary:
+        return [0.0] * len(documents)
+
+    jobs = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), indices, indptr),
+        shape=(len(documents), len(vocabulary)),
+    )
+    resume = np.zeros(len(vocabulary))
+    resume[[vocabulary[term] for term in resume_counts]] = list(resume_counts.values())
 
-    # Fit TF-IDF on both resume and jobs
-    vectorizer = TfidfVectorizer(max_features=5000)
-    tfidf_matrix = vectorizer.fit_transform(corpus)
+    # Keep the most frequent terms across jobs and resume (ties: alphabetical)
+    if len(vocabulary) > max_features:
+        totals = np.asarray(jobs.sum(axis=0)).ravel() + resume
+        terms = sorted(vocabulary, key=lambda term: (-totals[vocabulary[term]], term))
+        keep = np.sort([vocabulary[term] for term in terms[:max_features]])
+        jobs = jobs[:, keep]
+        resume = resume[keep]
 
-    # First row is resume, rest are jobs
-    resume_vec = tfidf_matrix[0:1]
-    job_vecs = tfidf_matrix[1:]
+    # Smoothed IDF over the jobs plus the resume, as one more document
+    n_docs = len(documents) + 1
+    df = np.bincount(jobs.indices, minlength=jobs.shape[1]) + (resume > 0)
+    idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
 
-    # Cosine similarity
-    sims = cosine_similarity(resume_vec, job_vecs)[0]  # shape: (n_jobs,)
+    jobs = jobs.multiply(idf).tocsr()
+    resume = resume * idf
+    job_norms = np.sqrt(np.asarray(jobs.multiply(jobs).sum(axis=1)).ravel())
+    resume_norm = np.linalg.norm(resume)
+    if not resume_norm:
+        return [0.0] * len(documents)
 
-    # Normalize to [0, 1] (cosine is already in [0, 1] for TF-IDF, usually)
-    scores = [float(max(0.0, min(1.0, s))) for s in sims]
-    return scores
+    dots = jobs @ resume
+    sims = np.divide(dots, job_norms * resume_norm,
+                     out=np.zeros_like(dots), where=job_norms > 0)
+    return [float(max(0.0, min(1.0, s))) for s in sims]
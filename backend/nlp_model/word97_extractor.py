@@ -0,0 +1,253 @@
+"""
+Legacy Word (.doc) Text Extraction
+
+Pure-Python reader for Word 97-2003 binary documents. It walks the OLE
+Compound File (CFB) container to find the `WordDocument` and table streams,
+then reassembles the main document text from the piece table (CLX) as
+described in [MS-DOC]. Only the main story is returned; headers, footnotes
+and field instructions are dropped, while field results are kept.
+
+The container is random access (sector chains point anywhere in the file),
+so the whole file is read into memory; the loader's size limit bounds it.
+"""
+
+import struct
+from typing import BinaryIO, Dict, List
+
+OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+# Special sector IDs in the FAT
+FREESECT = 0xFFFFFFFF
+ENDOFCHAIN = 0xFFFFFFFE
+FATSECT = 0xFFFFFFFD
+DIFSECT = 0xFFFFFFFC
+_MAX_REGULAR_SECT = 0xFFFFFFFA
+
+# Directory entry object types
+_STREAM = 2
+_ROOT = 5
+
+# FIB magic and flags
+_WORD_IDENT = 0xA5EC
+_FLAG_WHICH_TBL_STM = 0x0200
+_FLAG_ENCRYPTED = 0x0100
+
+# Index of the fcClx/lcbClx pair within FibRgFcLcb97
+_CLX_PAIR_INDEX = 33
+# Index of ccpText within FibRgLw97
+_CCP_TEXT_INDEX = 3
+
+# Word control characters and their plain-text equivalents
+_CONTROL_CHARS = {
+    "\r": "\n",      # paragraph mark
+    "\x0b": "\n",    # hard line break
+    "\x0c": "\n",    # page / section break
+    "\x07": " ",     # table cell / row mark
+    "\x1e": "-",     # non-breaking hyphen
+    "\x1f": "",      # optional hyphen
+    "\xa0": " ",
+    "\x01": "",      # embedded object anchor
+    "\x08": "",      # drawn object anchor
+}
+_FIELD_BEGIN, _FIELD_SEPARATOR, _FIELD_END = "\x13", "\x14", "\x15"
+
+
+class Word97Error(ValueError):
+    """Raised when a file is not a readable Word 97-2003 document."""
+
+
+class _CompoundFile:
+    """Minimal read-only OLE Compound File reader."""
+
+    def __init__(self, data: bytes):
+        if len(data) < 512 or not data.startswith(OLE_MAGIC):
+            raise Word97Error("Not an OLE compound file")
+        self.data = data
+        header = data[:512]
+        sector_shift, mini_shift = struct.unpack_from("<HH", header, 0x1E)
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_shift
+        if self.sector_size not in (512, 4096) or self.mini_sector_size != 64:
+            raise Word97Error("Unsupported compound file sector size")
+        (num_fat, first_dir, _, self.mini_cutoff, first_minifat, num_minifat,
+         first_difat, num_difat) = struct.unpack_from("<IIIIIIII", header, 0x2C)
+        self.max_sectors = max(1, (len(data) - 512) // self.sector_size + 1)
+
+        fat_sectors = [
+            s for s in struct.unpack_from("<109I", header, 0x4C) if s <= _MAX_REGULAR_SECT
+        ]
+        sector = first_difat
+        per_difat = self.sector_size // 4 - 1
+        for _ in range(num_difat):
+            if sector > _MAX_REGULAR_SECT:
+                break
+            entries = struct.unpack_from(f"<{per_difat + 1}I", self._sector(sector))
+            fat_sectors.extend(s for s in entries[:per_difat] if s <= _MAX_REGULAR_SECT)
+            sector = entries[per_difat]
+        fat_sectors = fat_sectors[:num_fat]
+
+        fat_bytes = b"".join(self._sector(s) for s in fat_sectors)
+        self.fat = list(struct.unpack(f"<{len(fat_bytes) // 4}I", fat_bytes))
+
+        self.entries: Dict[str, tuple] = {}
+        root = None
+        dir_bytes = self._read_chain(first_dir, self.fat, self.sector_size, self._sector)
+        for offset in range(0, len(dir_bytes) - 127, 128):
+            name_len, obj_type = struct.unpack_from("<HB", dir_bytes, offset + 64)
+            if obj_type not in (_STREAM, _ROOT) or not 2 <= name_len <= 64:
+                continue
+            name = dir_bytes[offset:offset + name_len - 2].decode("utf-16-le", errors="replace")
+            start, size = struct.unpack_from("<II", dir_bytes, offset + 116)
+            if obj_type == _ROOT:
+                root = (start, size)
+            else:
+                self.entries.setdefault(name, (start, size))
+
+        self.mini_stream = b""
+        self.minifat: List[int] = []
+        if root is not None and num_minifat:
+            self.mini_stream = self._read_chain(root[0], self.fat, self.sector_size,
+                                                self._sector)[:root[1]]
+            minifat_bytes = self._read_chain(first_minifat, self.fat, self.sector_size,
+                                             self._sector)
+            self.minifat = list(struct.unpack(f"<{len(minifat_bytes) // 4}I", minifat_bytes))
+
+    def _sector(self, index: int) -> bytes:
+        start = 512 + index * self.sector_size
+        if index > _MAX_REGULAR_SECT or start >= len(self.data):
+            raise Word97Error("Sector index out of range")
+        return self.data[start:start + self.sector_size]
+
+    def _mini_sector(self, index: int) -> bytes:
+        start = index * self.mini_sector_size
+        return self.mini_stream[start:start + self.mini_sector_size]
+
+    def _read_chain(self, start: int, table: List[int], size: int, reader) -> bytes:
+        chunks = []
+        sector = start
+        # Bound the walk so a cyclic chain cannot loop forever
+        for _ in range(self.max_sectors * (self.sector_size // size)):
+            if sector in (ENDOFCHAIN, FREESECT) or sector > _MAX_REGULAR_SECT:
+                break
+            if sector >= len(table):
+                raise Word97Error("Corrupt sector chain")
+            chunks.append(reader(sector))
+            sector = table[sector]
+        else:
+            raise Word97Error("Cyclic sector chain")
+        return b"".join(chunks)
+
+    def stream(self, name: str) -> bytes:
+        if name not in self.entries:
+            raise Word97Error(f"Missing stream: {name}")
+        start, size = self.entries[name]
+        if size < self.mini_cutoff:
+            data = self._read_chain(start, self.minifat, self.mini_sector_size,
+                                    self._mini_sector)
+        else:
+            data = self._read_chain(start, self.fat, self.sector_size, self._sector)
+        return data[:size]
+
+
+def _piece_table_text(word_doc: bytes, table: bytes, fc_clx: int, lcb_clx: int) -> str:
+    clx = table[fc_clx:fc_clx + lcb_clx]
+    pos = 0
+    # Skip any Prc (property modifier) entries preceding the Pcdt
+    while pos < len(clx) and clx[pos] == 0x01:
+        (cb_grpprl,) = struct.unpack_from("<H", clx, pos + 1)
+        pos += 3 + cb_grpprl
+    if pos >= len(clx) or clx[pos] != 0x02:
+        raise Word97Error("Piece table not found")
+    (lcb,) = struct.unpack_from("<I", clx, pos + 1)
+    plc = clx[pos + 5:pos + 5 + lcb]
+    count = (lcb - 4) // 12
+    if count <= 0:
+        return ""
+    cps = struct.unpack_from(f"<{count + 1}i", plc, 0)
+    parts = []
+    for i in range(count):
+        _, fc_value = struct.unpack_from("<HI", plc, (count + 1) * 4 + i * 8)
+        n_chars = cps[i + 1] - cps[i]
+        if n_chars <= 0:
+            continue
+        if fc_value & 0x40000000:
+            offset = (fc_value & 0x3FFFFFFF) // 2
+            parts.append(word_doc[offset:offset + n_chars].decode("cp1252", errors="replace"))
+        else:
+            offset = fc_value & 0x3FFFFFFF
+            raw = word_doc[offset:offset + 2 * n_chars]
+            parts.append(raw.decode("utf-16-le", errors="replace"))
+    return "".join(parts)
+
+
+def _clean(text: str) -> str:
+    out = []
+    # For each open field: True while inside its instruction part
+    in_instruction: List[bool] = []
+    for char in text:
+        if char == _FIELD_BEGIN:
+            in_instruction.append(True)
+            continue
+        if char == _FIELD_SEPARATOR and in_instruction:
+            in_instruction[-1] = False
+            continue
+        if char == _FIELD_END and in_instruction:
+            in_instruction.pop()
+            continue
+        if any(in_instruction):
+            continue
+        out.append(_CONTROL_CHARS.get(char, char))
+    lines = [" ".join(line.split()) for line in "".join(out).split("\n")]
+    return "\n".join(lines).strip()
+
+
+def extract_doc_text(stream: BinaryIO) -> str:
+    """
+    Extract the main document text from a Word 97-2003 (.doc) file.
+
+    Args:
+        stream: Binary stream positioned at the start of the file
+
+    Returns:
+        Extracted text
+
+    Raises:
+        Word97Error: If the file is not a readable Word binary document
+    """
+    try:
+        return _extract(stream.read())
+    except (struct.error, OverflowError, IndexError) as exc:
+        # Offsets and counts in a damaged file point past the data they describe
+        raise Word97Error(f"Corrupt Word document: {exc}") from exc
+
+
+def _extract(data: bytes) -> str:
+    compound = _CompoundFile(data)
+    word_doc = compound.stream("WordDocument")
+    if len(word_doc) < 0x200:
+        raise Word97Error("WordDocument stream is truncated")
+
+    ident, _, _, _, _, flags = struct.unpack_from("<HHHHHH", word_doc, 0)
+    if ident != _WORD_IDENT:
+        raise Word97Error("Not a Word binary document")
+    if flags & _FLAG_ENCRYPTED:
+        raise Word97Error("Encrypted Word documents are not supported")
+    table = compound.stream("1Table" if flags & _FLAG_WHICH_TBL_STM else "0Table")
+
+    # FibBase (32 bytes), then csw + FibRgW, cslw + FibRgLw, cbRgFcLcb + FibRgFcLcb
+    pos = 32
+    (csw,) = struct.unpack_from("<H", word_doc, pos)
+    pos += 2 + csw * 2
+    (cslw,) = struct.unpack_from("<H", word_doc, pos)
+    rg_lw = pos + 2
+    (ccp_text,) = struct.unpack_from("<i", word_doc, rg_lw + _CCP_TEXT_INDEX * 4)
+    pos = rg_lw + cslw * 4
+    (cb_rg_fc_lcb,) = struct.unpack_from("<H", word_doc, pos)
+    if cb_rg_fc_lcb <= _CLX_PAIR_INDEX:
+        raise Word97Error("FIB has no piece table reference")
+    fc_clx, lcb_clx = struct.unpack_from("<II", word_doc, pos + 2 + _CLX_PAIR_INDEX * 8)
+
+    text = _piece_table_text(word_doc, table, fc_clx, lcb_clx)
+    if ccp_text > 0:
+        text = text[:ccp_text]
+    return _clean(text)
@@ -13,21 +13,29 @@ Author: Integration Lead
 """
 
 import logging
-import os
 import re
 import time
-
-import requests
-
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional
+
+from .deadline import DEADLINE_TFIDF_MIN_SECONDS, unbounded
+from .job_index import get_bm25_index, get_job_index
+from .job_store import job_id
+from .metrics import STAGE_SECONDS, span
+from .mlflow_exporter import RunRecord, get_exporter
+from .nlp_model.bm25 import compute_bm25_scores
+from .nlp_model.document import Document
+from .nlp_model.experience_extractor import (
+    ExperienceRequirement,
+    extract_experience_requirement,
+)
 from .nlp_model.extract_job_skills_from_list import extract_job_skills_from_list
-from .nlp_model.resume_parser import ResumeParser, extract_resume_skills, infer_target_roles
+from .nlp_model.resume_profile import ResumeProfile, build_resume_profile
 from .nlp_model.tfidf_matcher import compute_tfidf_scores
+from .scoring_profiles import ScoringProfile, get_profile
 
 logger = logging.getLogger(__name__)
 
-MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI")
-MLFLOW_EXPERIMENT_NAME = os.getenv("MLFLOW_EXPERIMENT_NAME", "resume_recommender")
-
 # Mapping of U.S. state names to abbreviations (used for location matching)
 STATE_MAP = {
     "alabama": "al",
@@ -82,156 +90,317 @@ STATE_MAP = {
     "wyoming": "wy",
 }
 
-def recommend_jobs(resume_text, job_list, title, location, experience):
+
+@dataclass
+class ScoredState:
+    """
+    Per-job scoring features from one run, reusable for re-ranking.
+
+    Only the expensive, preference- and profile-independent parts are
+    stored: matched skills and job skill counts (dimension 1), raw TF-IDF
+    similarity (dimension 2), the role match (dimension 3), and the parsed
+    experience requirements, resume years and job locations behind
+    dimensions 4-5. `rescore` turns these into
+    scores for new preferences or a different scoring profile without
+    reparsing, refetching or re-vectorizing anything.
+    """
+
+    jobs: List[Dict[str, Any]] = field(default_factory=list)
+    matched_skills: List[List[str]] = field(default_factory=list)
+    job_skill_counts: List[int] = field(default_factory=list)
+    tfidf_scores: List[float] = field(default_factory=list)
+    role_scores: List[float] = field(default_factory=list)
+    experience_requirements: List[Optional[ExperienceRequirement]] = field(default_factory=list)
+    job_locations: List[str] = field(default_factory=list)
+    target_roles: List[str] = field(default_factory=list)
+    resume_years: float = 0.0
+    title: str = ""
+    location: str = ""
+    experience: str = ""
+    profile: ScoringProfile = field(default_factory=ScoringProfile)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def recommend_jobs(resume_text, job_list, title, location, experience, profile=None):
     """
     Main recommendation function implementing the 5-Dimensional Scoring System.
+
+    Returns the ranked results; use `score_jobs` to also keep the features
+    needed to re-rank cheaply with `rescore`. `profile` names the scoring
+    profile (weights and shaping constants) to use; None selects the default.
+    """
+    return score_jobs(resume_text, job_list, title, location, experience, profile).results
+
+
+def score_jobs(resume_text, job_list, title, location, experience, profile=None,
+               deadline=None) -> ScoredState:
     """
-    
+    Run the full pipeline and return the ranked results with their features.
+
+    `resume_text` may also be a `ResumeProfile` from `build_resume_profile`,
+    so one resume can be scored against several job lists without being
+    parsed again.
+
+    With a `deadline` that is nearly spent, the per-request TF-IDF fit is
+    skipped (every job scores 0 on that dimension) and telemetry is not
+    queued; both are recorded on the deadline.
+    """
+    scoring_profile = get_profile(profile)
+    deadline = deadline or unbounded()
+
     # Return early if no jobs were fetched
     if not job_list:
-        return []
+        return ScoredState(title=title or "", location=location or "",
+                           experience=experience or "", profile=scoring_profile)
 
     # ==========================================
     # Phase 1: user profiling
     # ==========================================
-    logger.info("Starting user profile parsing...")
-    parser = ResumeParser()
-    sections = parser.parse_sections(resume_text)
-
-    # Extract skills from resume sections
-    skills_result = extract_resume_skills(sections)
-    extracted_skills = skills_result.get('all_skills', [])
-    # Normalize to lowercase set
-    user_skills_set = {s.lower().strip() for s in extracted_skills}
-
-    # Infer user intent / target roles
-    target_roles = infer_target_roles(sections, title)
-
-    # Parse years of experience
-    user_yoe_is_any = False
-    user_yoe = 0
-    
-    # Handle "No preference" inputs
-    if experience and "no preference" in str(experience).lower():
-        user_yoe_is_any = True
-        user_yoe = 0
+    # Parse and tokenize the resume once; a prebuilt profile skips this entirely
+    if isinstance(resume_text, ResumeProfile):
+        resume = resume_text
     else:
-        try:
-            user_yoe = int(re.search(r'\d+', str(experience)).group())
-        except (AttributeError, ValueError):
-            user_yoe = 0
-    
+        logger.info("Starting user profile parsing...")
+        with span("resume_profile"):
+            resume = build_resume_profile(resume_text)
+
+    user_skills_set = resume.skill_set
+    target_roles = resume.target_roles(title)
+    resume_years = resume.resume_years
+
+    # Tokenize every description once; the skill, role, experience and
+    # TF-IDF steps below all reuse these
+    with span("preprocess"):
+        job_docs = [Document(str(job.get("description", "") or "")) for job in job_list]
+
     logger.info(
-        "User parsed: %d skills, roles=%s, YoE=%d (any=%s)",
+        "User parsed: %d skills, roles=%s, experience=%r, resume_years=%.1f",
         len(user_skills_set),
         target_roles,
-        user_yoe,
-        user_yoe_is_any,
+        experience,
+        resume_years,
     )
 
     # ==========================================
     # Phase 2: process job data
     # ==========================================
-    
-    structured_jobs = extract_job_skills_from_list(job_list)
-    ml_scores = compute_tfidf_scores(resume_text, job_list)
 
-    results = []
+    with span("job_skills"):
+        structured_jobs = extract_job_skills_from_list(job_list, documents=job_docs)
+    with span("tfidf"):
+        bm25_index = get_bm25_index()
+        index = get_job_index() if bm25_index is None else None
+        if bm25_index is not None:
+            # BM25 over the ingestion-time inverted index (jobs from other sources are added)
+            ml_scores = compute_bm25_scores(
+                resume, job_list, documents=job_docs, index=bm25_index,
+                keys=[job.get("id") or job_id(job) for job in job_list],
+            )
+        elif index is not None:
+            # Prebuilt memory-mapped index when every job is in it, else fit per request
+            ml_scores = index.tfidf_scores(resume, [job.get("id") for job in job_list])
+        else:
+            ml_scores = None
+        if ml_scores is None and not deadline.allows(DEADLINE_TFIDF_MIN_SECONDS):
+            logger.warning("Deadline reached: skipping the TF-IDF dimension")
+            deadline.degrade("tfidf", "skipped")
+            ml_scores = [0.0] * len(job_list)
+        if ml_scores is None:
+            ml_scores = compute_tfidf_scores(resume, job_list, documents=job_docs)
+
+    scoring_start = time.perf_counter()
 
     # ==========================================
-    # Phase 3: scoring loop
+    # Phase 3: preference-independent features
     # ==========================================
-    
-    logger.debug("=" * 80)
-    logger.debug(
-        "%-20s | Skill | Seman | Role | Exp  | Loc  | ==> Final",
-        "Job Title",
+
+    state = ScoredState(
+        target_roles=list(target_roles),
+        resume_years=resume_years,
+        title=title or "",
+        location=location or "",
+        experience=experience or "",
+        profile=scoring_profile,
     )
-    logger.debug("=" * 80)
 
-    for job, tfidf_score in zip(structured_jobs, ml_scores, strict=False):
-        
+    for raw_job, job, job_doc, tfidf_score in zip(
+        job_list, structured_jobs, job_docs, ml_scores, strict=False
+    ):
+        if raw_job.get("id"):
+            job["id"] = raw_job["id"]
+
         job_title = job.get("title", "").lower()
-        job_desc = job.get("description", "").lower()
-        job_loc = job.get("location", "").lower()
+        job_desc = job_doc.normalized
 
         # --------------------------------------
-        # Dimension 1: skill overlap (40%)
+        # Dimension 1: skill overlap (scored in _rank)
         # --------------------------------------
         raw_job_skills = job.get("skills", {}).get("all_skills", [])
         job_skills_set = {s.lower().strip() for s in raw_job_skills}
-        
-        matched_skills_set = user_skills_set.intersection(job_skills_set)
-        matched_skills = list(matched_skills_set)
-        
-        # Cap denominator at 7 to avoid penalizing long job descriptions.
-        denom = min(len(job_skills_set), 7)
-        denom = max(denom, 1)
-        
-        skill_score = min(1.0, len(matched_skills) / denom)
 
-        # --------------------------------------
-        # Dimension 2: semantic (TF-IDF, 25%) multiplied by 3
-        # --------------------------------------
-        content_score = min(1.0, tfidf_score * 3.0)
+        matched_skills = list(user_skills_set.intersection(job_skills_set))
 
         # --------------------------------------
-        # Dimension 3: role intent match (15%)
+        # Dimension 3: role intent match
         # --------------------------------------
         role_score = 0.0
         for role in target_roles:
             if role.lower() in job_title or role.lower() in job_desc:
                 role_score = 1.0
                 break
-        
-        # --------------------------------------
-        # Dimension 4: experience alignment (10%)
-        # --------------------------------------
-        exp_match = re.search(r'(\d+)\+?\s*years?', job_desc)
-        req_yoe = int(exp_match.group(1)) if exp_match else 0
-        
-        if user_yoe_is_any:
-            exp_score = 1.0
-        elif user_yoe >= req_yoe:
-            exp_score = 1.0
-        elif user_yoe >= req_yoe - 1:
-            exp_score = 0.5
+
+        # Raw inputs for dimensions 4 and 5 (requirements are parsed at
+        # ingestion; jobs from other sources are parsed here)
+        if "experience_required" in raw_job:
+            requirement = ExperienceRequirement.from_dict(raw_job["experience_required"])
         else:
-            exp_score = 0.0
+            requirement = extract_experience_requirement(job_doc)
+
+        state.jobs.append(job)
+        state.matched_skills.append(matched_skills)
+        state.job_skill_counts.append(len(job_skills_set))
+        # Dimension 2: raw TF-IDF similarity (scaled in _rank)
+        state.tfidf_scores.append(float(tfidf_score))
+        state.role_scores.append(role_score)
+        state.experience_requirements.append(requirement)
+        state.job_locations.append(job.get("location", "").lower())
+
+    state.results = _rank(state)
+    STAGE_SECONDS.observe(time.perf_counter() - scoring_start, stage="scoring")
+    if deadline.expired():
+        deadline.degrade("telemetry", "skipped")
+    else:
+        log_recommendation_run(job_list, state.results, target_roles, title, location,
+                               scoring_profile.name)
+    return state
 
-        # --------------------------------------
-        # Dimension 5: location match (10%)
-        # Supports full names and state abbreviations (e.g., California -> CA)
-        # --------------------------------------
-        user_loc_raw = location.lower().strip() if location else ""
-        user_loc_abbr = STATE_MAP.get(user_loc_raw, user_loc_raw)  # e.g., "california" -> "ca"
-        
-        loc_score = 0.0
-        
-        if "remote" in job_loc:
-            loc_score = 1.0
-        elif user_loc_raw and user_loc_raw in job_loc:
-            loc_score = 1.0
-        elif user_loc_abbr and user_loc_abbr != user_loc_raw:
-            patterns = [
-                f", {user_loc_abbr}",
-                f",{user_loc_abbr}",
-                f" {user_loc_abbr} ",
-            ]
-            if any(pattern in job_loc for pattern in patterns):
-                loc_score = 1.0
+
+def rescore(state: ScoredState, location=None, experience=None, profile=None) -> ScoredState:
+    """
+    Re-rank a previous run for new preferences or a different scoring profile.
+
+    Only the cheap scoring step is redone from the cached features; the
+    resume is not reparsed and the jobs are neither refetched nor
+    re-vectorized. Arguments left as None keep their previous value. The
+    input state is not modified.
+
+    Args:
+        state: Result of `score_jobs`
+        location: New location preference
+        experience: New experience preference
+        profile: Name of the scoring profile to switch to
+
+    Returns:
+        A new ScoredState sharing the cached features, with fresh results
+    """
+    scoring_profile = state.profile if profile is None else get_profile(profile)
+    with span("rescore"):
+        updated = replace(
+            state,
+            location=state.location if location is None else location,
+            experience=state.experience if experience is None else experience,
+            profile=scoring_profile,
+        )
+        updated.results = _rank(updated)
+    return updated
+
+
+def _parse_experience(experience, resume_years=0.0):
+    """
+    Return (years, no_preference) for the experience form value.
+
+    Falls back to the years derived from the resume when the form gives no
+    number.
+    """
+    # Handle "No preference" inputs
+    if experience and "no preference" in str(experience).lower():
+        return 0, True
+    try:
+        return int(re.search(r'\d+', str(experience)).group()), False
+    except (AttributeError, ValueError):
+        return resume_years, False
+
+
+def _experience_score(user_yoe, user_yoe_is_any, requirement):
+    """Dimension 4: experience alignment."""
+    if user_yoe_is_any or requirement is None:
+        return 1.0
+    if requirement.min_years is not None:
+        if user_yoe >= requirement.min_years:
+            preferred = requirement.preferred_years
+            # Meets the minimum but not the stated preference
+            return 0.9 if preferred is not None and user_yoe < preferred else 1.0
+        if user_yoe >= requirement.min_years - 1:
+            return 0.5
+        return 0.0
+    # Preference only: never disqualifying
+    return 1.0 if user_yoe >= requirement.preferred_years else 0.5
+
+
+def _location_score(user_loc_raw, user_loc_abbr, job_loc):
+    """
+    Dimension 5: location match.
+
+    Supports full names and state abbreviations (e.g., California -> CA).
+    """
+    if "remote" in job_loc:
+        return 1.0
+    if user_loc_raw and user_loc_raw in job_loc:
+        return 1.0
+    if user_loc_abbr and user_loc_abbr != user_loc_raw:
+        patterns = [
+            f", {user_loc_abbr}",
+            f",{user_loc_abbr}",
+            f" {user_loc_abbr} ",
+        ]
+        if any(pattern in job_loc for pattern in patterns):
+            return 1.0
+    return 0.0
+
+
+def _rank(state: ScoredState) -> List[Dict[str, Any]]:
+    """Combine cached and preference-dependent dimensions into ranked results."""
+    weights = state.profile
+    user_yoe, user_yoe_is_any = _parse_experience(state.experience, state.resume_years)
+    location = state.location
+    user_loc_raw = location.lower().strip() if location else ""
+    user_loc_abbr = STATE_MAP.get(user_loc_raw, user_loc_raw)  # e.g., "california" -> "ca"
+
+    logger.debug("=" * 80)
+    logger.debug(
+        "%-20s | Skill | Seman | Role | Exp  | Loc  | ==> Final",
+        "Job Title",
+    )
+    logger.debug("=" * 80)
+
+    results = []
+    for i, job in enumerate(state.jobs):
+        matched_skills = state.matched_skills[i]
+
+        # Cap denominator (7 by default) to avoid penalizing long job descriptions.
+        denom = min(state.job_skill_counts[i], weights.skill_denominator_cap)
+        denom = max(denom, 1)
+        skill_score = min(1.0, len(matched_skills) / denom)
+
+        # Semantic (TF-IDF) similarity, multiplied by 3 by default
+        content_score = min(1.0, state.tfidf_scores[i] * weights.tfidf_multiplier)
+
+        role_score = state.role_scores[i]
+        exp_score = _experience_score(user_yoe, user_yoe_is_any,
+                                      state.experience_requirements[i])
+        loc_score = _location_score(user_loc_raw, user_loc_abbr, state.job_locations[i])
 
         # ==========================================
-        # Weighted combination (emphasize hard skills)
+        # Weighted combination (default profile emphasizes hard skills)
         # ==========================================
-        combined_score = (skill_score * 0.40) + \
-                         (content_score * 0.25) + \
-                         (role_score * 0.15) + \
-                         (exp_score * 0.10) + \
-                         (loc_score * 0.10)
-        
+        combined_score = (skill_score * weights.skills) + \
+                         (content_score * weights.semantic) + \
+                         (role_score * weights.role) + \
+                         (exp_score * weights.experience) + \
+                         (loc_score * weights.location)
+
         final_score = float(min(1.0, combined_score))
-        
+
         # Debug logging
         logger.debug(
             "%-20s | %.2f  | %.2f  | %.1f  | %.1f  | %.1f  | ==> %.2f",
@@ -256,6 +425,7 @@ def recommend_jobs(resume_text, job_list, title, location, experience):
             summary = "Potential match based on role alignment."
 
         results.append({
+            "id": job.get("id"),
             "title": job["title"],
             "company": job["company"],
             "location": job["location"] or (location or "Remote"),
@@ -263,7 +433,7 @@ def recommend_jobs(resume_text, job_list, title, location, experience):
             "apply_link": job["apply_link"],
             "score": round(final_score, 2),
             "summary": summary,
-            "skills": job["skills"],       
+            "skills": job["skills"],
             "keywords": matched_skills[:5],
             "evidence_image": None,
         })
@@ -271,81 +441,26 @@ def recommend_jobs(resume_text, job_list, title, location, experience):
     logger.debug("=" * 80)
 
     results.sort(key=lambda x: x["score"], reverse=True)
-    log_recommendation_run(job_list, results, target_roles, title, location)
     return results
 
 
-def log_recommendation_run(job_list, results, target_roles, title, location):
-    """Record lightweight experiment metrics in MLflow via REST, if configured."""
-    if not MLFLOW_TRACKING_URI:
+def log_recommendation_run(job_list, results, target_roles, title, location,
+                           profile_name=""):
+    """Queue lightweight experiment metrics for background export to MLflow, if configured."""
+    exporter = get_exporter()
+    if not exporter.enabled:
         return
-    try:
-        experiment_id = _ensure_experiment(MLFLOW_EXPERIMENT_NAME)
-        if not experiment_id:
-            return
-        run_id = _create_run(experiment_id)
-        if not run_id:
-            return
-        params = {
-            "query_title": title or "",
-            "query_location": location or "",
-            "target_roles": ",".join(target_roles) if target_roles else "",
-        }
-        metrics = {
-            "jobs_fetched": len(job_list),
-            "jobs_returned": len(results),
-        }
-        if results:
-            avg_score = sum(job["score"] for job in results) / len(results)
-            metrics["avg_recommendation_score"] = avg_score
-
-        for key, value in params.items():
-            _mlflow_post(
-                "runs/log-parameter",
-                {"run_id": run_id, "key": key, "value": value},
-            )
-        timestamp = int(time.time() * 1000)
-        for key, value in metrics.items():
-            _mlflow_post(
-                "runs/log-metric",
-                {"run_id": run_id, "key": key, "value": value, "timestamp": timestamp},
-            )
-        _mlflow_post("runs/update", {"run_id": run_id, "status": "FINISHED"})
-    except requests.RequestException as exc:
-        logger.debug("Skipping MLflow logging: %s", exc)
-def _ensure_experiment(name: str) -> str | None:
-    """Return an experiment_id, creating the experiment if required."""
-    try:
-        response = requests.get(
-            f"{MLFLOW_TRACKING_URI}/api/2.0/mlflow/experiments/get-by-name",
-            params={"experiment_name": name},
-            timeout=5,
-        )
-        if response.status_code == 200:
-            return response.json()["experiment"]["experiment_id"]
-    except requests.RequestException:
-        return None
-
-    create_resp = _mlflow_post("experiments/create", {"name": name})
-    if create_resp:
-        return create_resp.get("experiment_id")
-    return None
-
-
-def _create_run(experiment_id: str) -> str | None:
-    payload = {
-        "experiment_id": experiment_id,
-        "start_time": int(time.time() * 1000),
-        "tags": [{"key": "source", "value": "resume_recommender"}],
+    params = {
+        "query_title": title or "",
+        "query_location": location or "",
+        "target_roles": ",".join(target_roles) if target_roles else "",
+        "scoring_profile": profile_name,
     }
-    response = _mlflow_post("runs/create", payload)
-    if response:
-        return response["run"]["info"]["run_id"]
-    return None
-
-
-def _mlflow_post(path: str, payload: dict) -> dict | None:
-    url = f"{MLFLOW_TRACKING_URI}/api/2.0/mlflow/{path}"
-    response = requests.post(url, json=payload, timeout=5)
-    response.raise_for_status()
-    return response.json()
+    metrics = {
+        "jobs_fetched": len(job_list),
+        "jobs_returned": len(results),
+    }
+    if results:
+        avg_score = sum(job["score"] for job in results) / len(results)
+        metrics["avg_recommendation_score"] = avg_score
+    exporter.submit(RunRecord(params=params, metrics=metrics))
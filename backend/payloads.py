@@ -0,0 +1,107 @@
+# backend/payloads.py
+
+"""
+Response shaping for job lists.
+
+List endpoints return slim job cards by default: enough to render a result
+list, with a short `snippet` in place of the full description and no
+`skills` breakdown. Clients fetch the full posting from `/jobs/{id}`, or ask
+for specific fields with `fields=title,score,description` (`fields=full`
+returns every field).
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+SNIPPET_CHARS = 200
+
+CARD_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "score",
+    "summary",
+    "keywords",
+    "apply_link",
+    "snippet",
+)
+DETAIL_FIELDS = ("description", "skills", "experience_required", "evidence_image")
+ALL_FIELDS = CARD_FIELDS + DETAIL_FIELDS
+FULL = "full"
+
+# Per-result fields that are not part of the stored job (see job_store.py)
+# (`location` is included because results fall back to the searched location)
+RESULT_FIELDS = ("id", "location", "score", "summary", "keywords", "evidence_image")
+
+
+def parse_fields(raw: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Parse a `fields=` parameter.
+
+    Returns:
+        The requested field names, CARD_FIELDS when `raw` is empty, or None
+        for `fields=full` (no projection)
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not raw or not raw.strip():
+        return CARD_FIELDS
+    names = tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+    if FULL in names or "*" in names:
+        return None
+    unknown = [name for name in names if name not in ALL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+
+def snippet(description: Optional[str], limit: int = SNIPPET_CHARS) -> str:
+    """First `limit` characters of a description, cut at a word boundary."""
+    text = " ".join((description or "").split())
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    return text[:cut if cut > 0 else limit].rstrip(",.;:") + "..."
+
+
+def project(item: Dict[str, Any], fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Return `item` restricted to `fields` (derived `snippet` included)."""
+    if fields is None:
+        return item
+    out = {}
+    for name in fields:
+        if name == "snippet":
+            out[name] = snippet(item.get("description"))
+        elif name in item:
+            out[name] = item[name]
+    return out
+
+
+def project_all(items: Iterable[Dict[str, Any]],
+                fields: Optional[Tuple[str, ...]]) -> List[Dict[str, Any]]:
+    return [project(item, fields) for item in items]
+
+
+def compact(results: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Strip scored results down to their job ID and per-result fields."""
+    return [{name: result.get(name) for name in RESULT_FIELDS} for result in results]
+
+
+def hydrate(entries: Iterable[Dict[str, Any]],
+            lookup: Callable[[str], Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Rebuild full results from `compact` entries using `lookup(job_id)`.
+
+    Entries whose job can no longer be found are dropped; entries that are
+    already complete (caches written before results were compacted) are
+    returned unchanged.
+    """
+    results = []
+    for entry in entries:
+        job = lookup(entry["id"]) if entry.get("id") else None
+        if job is not None:
+            results.append({**job, **entry})
+        elif "title" in entry:
+            results.append(entry)
+    return results
@@ -0,0 +1,167 @@
+# backend/scoring_profiles.py
+
+"""
+Named scoring profiles for the 5-dimensional ranking.
+
+A profile holds the dimension weights plus the two shaping constants of
+`recommend_jobs` (the TF-IDF multiplier and the skill denominator cap).
+Profiles are loaded from a JSON file (`SCORING_PROFILES_PATH`, default
+`backend/scoring_profiles.json`) shaped like:
+
+    {
+      "default": "baseline",
+      "profiles": {
+        "baseline": {"skills": 0.40, "semantic": 0.25, "role": 0.15,
+                     "experience": 0.10, "location": 0.10,
+                     "tfidf_multiplier": 3.0, "skill_denominator_cap": 7},
+        "semantic_heavy": {"skills": 0.30, "semantic": 0.35}
+      }
+    }
+
+Omitted fields take the built-in defaults. The file is re-read when its
+modification time changes (checked at most every
+`SCORING_PROFILES_RELOAD_SECONDS`), so ranking variants can be edited and
+A/B tested without a deploy. A file that fails to load is logged and the
+previously loaded profiles stay active.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SCORING_PROFILES_PATH = os.getenv(
+    "SCORING_PROFILES_PATH", str(Path(__file__).resolve().parent / "scoring_profiles.json")
+)
+SCORING_PROFILES_RELOAD_SECONDS = float(os.getenv("SCORING_PROFILES_RELOAD_SECONDS", "2"))
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """Weights and shaping constants for one ranking variant."""
+
+    name: str = "baseline"
+    skills: float = 0.40
+    semantic: float = 0.25
+    role: float = 0.15
+    experience: float = 0.10
+    location: float = 0.10
+    tfidf_multiplier: float = 3.0
+    skill_denominator_cap: int = 7
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict[str, Any]) -> "ScoringProfile":
+        """Build a profile from its JSON object, rejecting unknown or negative values."""
+        known = {f.name for f in fields(cls)} - {"name"}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Profile {name!r} has unknown fields: {sorted(unknown)}")
+        values = {}
+        for key, value in data.items():
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise ValueError(f"Profile {name!r}: {key} must be a non-negative number")
+            values[key] = int(value) if key == "skill_denominator_cap" else float(value)
+        if values.get("skill_denominator_cap", 1) < 1:
+            raise ValueError(f"Profile {name!r}: skill_denominator_cap must be at least 1")
+        return cls(name=name, **values)
+
+
+DEFAULT_PROFILE = ScoringProfile()
+
+
+class ProfileRegistry:
+    """Profiles loaded from a JSON file, reloaded when the file changes."""
+
+    def __init__(self, path: str, reload_interval: float = SCORING_PROFILES_RELOAD_SECONDS):
+        self.path = Path(path)
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._profiles: Dict[str, ScoringProfile] = {DEFAULT_PROFILE.name: DEFAULT_PROFILE}
+        self._default = DEFAULT_PROFILE.name
+        self._mtime: Optional[float] = None
+        self._next_check = 0.0
+        self._refresh(force=True)
+
+    def get(self, name: Optional[str] = None) -> ScoringProfile:
+        """
+        Return the named profile, or the configured default when `name` is empty.
+
+        Raises:
+            ValueError: If no profile with that name is configured
+        """
+        self._refresh()
+        with self._lock:
+            key = name or self._default
+            profile = self._profiles.get(key)
+            if profile is None:
+                raise ValueError(f"Unknown scoring profile: {key}")
+            return profile
+
+    def names(self):
+        """Names of the currently loaded profiles."""
+        self._refresh()
+        with self._lock:
+            return sorted(self._profiles)
+
+    def _refresh(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            default, profiles = self._load()
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logger.error("Keeping previous scoring profiles; failed to load %s: %s",
+                         self.path, exc)
+            self._mtime = mtime
+            return
+        with self._lock:
+            self._profiles = profiles
+            self._default = default
+            self._mtime = mtime
+        logger.info("Loaded %d scoring profiles from %s (default=%s)",
+                    len(profiles), self.path, default)
+
+    def _load(self):
+        with self.path.open("r", encoding="utf-8") as f:
+            config = json.load(f)
+        profiles = {
+            name: ScoringProfile.from_dict(name, data or {})
+            for name, data in config.get("profiles", {}).items()
+        }
+        profiles.setdefault(DEFAULT_PROFILE.name, DEFAULT_PROFILE)
+        default = config.get("default", DEFAULT_PROFILE.name)
+        if default not in profiles:
+            raise ValueError(f"Default profile {default!r} is not defined")
+        return default, profiles
+
+
+_registry: Optional[ProfileRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ProfileRegistry:
+    """Return the process-wide profile registry, loading it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ProfileRegistry(SCORING_PROFILES_PATH)
+    return _registry
+
+
+def get_profile(name: Optional[str] = None) -> ScoringProfile:
+    """Resolve a profile by name (None selects the configured default)."""
+    return get_registry().get(name)
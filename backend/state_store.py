@@ -0,0 +1,249 @@
+# backend/state_store.py
+
+"""
+Pluggable store for state that must outlive a single request.
+
+Scored match states (`/match/{match_id}/rescore`) and the latest result list
+(`/match/more`) used to live in process memory and `cache.json`. With several
+workers behind one port, the request that reads them usually lands on a
+different process than the one that wrote them, so they go through this
+store instead. `STATE_STORE` picks the backend:
+
+- `memory` (default): per-process LRU; objects are stored as-is. Fine for a
+  single worker and for tests.
+- `sqlite:///path/to/state.sqlite3`: one file shared by every worker on the
+  host. Values are pickled.
+- `redis://host:6379/0`: any Redis-compatible server, shared across hosts.
+  Requires the optional `redis` package.
+
+Every value lives under a namespace and key with an optional TTL in seconds.
+Connections are opened lazily in the process that uses them, so a store
+created before gunicorn forks its workers is safe to inherit.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+STATE_STORE = os.getenv("STATE_STORE", "memory")
+STATE_STORE_SIZE = int(os.getenv("STATE_STORE_SIZE", "128"))
+
+# Trim expired SQLite rows once per this many writes
+PRUNE_EVERY = 256
+
+
+class StateStore(ABC):
+    """Namespaced key -> value store with per-entry TTL."""
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Return the stored value, or None if unknown or expired."""
+
+    @abstractmethod
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value`; it expires after `ttl` seconds unless `ttl` is None."""
+
+    @abstractmethod
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove `key` if present."""
+
+    def close(self) -> None:  # noqa: B027 - optional; only backends holding connections override it
+        """Release connections held by this process."""
+
+
+class MemoryStateStore(StateStore):
+    """Thread-safe in-process LRU, bounded to `max_entries` per namespace."""
+
+    def __init__(self, max_entries: int = STATE_STORE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._spaces: Dict[str, "OrderedDict[str, Tuple[Optional[float], Any]]"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            entries = self._spaces.get(namespace)
+            entry = entries.get(key) if entries else None
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            entries = self._spaces.setdefault(namespace, OrderedDict())
+            entries[key] = (expires_at, value)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._spaces.get(namespace, {}).pop(key, None)
+
+
+class SQLiteStateStore(StateStore):
+    """Pickled values in one SQLite file shared by all local workers."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Never reuse a connection inherited across fork()
+        if self._db is None or self._pid != os.getpid():
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None, timeout=5.0
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                "expires_at REAL, PRIMARY KEY (namespace, key))"
+            )
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT value, expires_at FROM state WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.warning("Failed to read state %s/%s: %s", namespace, key, exc)
+                return None
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return pickle.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            try:
+                db = self._connection()
+                db.execute(
+                    "INSERT OR REPLACE INTO state (namespace, key, value, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (namespace, key, blob, expires_at),
+                )
+                self._writes += 1
+                if self._writes % PRUNE_EVERY == 0:
+                    db.execute("DELETE FROM state WHERE expires_at < ?", (time.time(),))
+            except sqlite3.Error as exc:
+                logger.warning("Failed to write state %s/%s: %s", namespace, key, exc)
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            try:
+                self._connection().execute(
+                    "DELETE FROM state WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+            except sqlite3.Error as exc:
+                logger.warning("Failed to delete state %s/%s: %s", namespace, key, exc)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db = None
+
+
+class RedisStateStore(StateStore):
+    """Pickled values in a Redis-compatible server, expired server-side."""
+
+    def __init__(self, url: str, prefix: str = "resume-recommender"):
+        if redis is None:
+            raise RuntimeError("STATE_STORE=redis://... requires the 'redis' package")
+        self.url = url
+        self.prefix = prefix
+        self._client = None
+        self._pid: Optional[int] = None
+
+    def _redis(self):
+        if self._client is None or self._pid != os.getpid():
+            self._client, self._pid = redis.Redis.from_url(self.url), os.getpid()
+        return self._client
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}:{namespace}:{key}"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        try:
+            blob = self._redis().get(self._key(namespace, key))
+        except redis.RedisError as exc:
+            logger.warning("Failed to read state %s/%s: %s", namespace, key, exc)
+            return None
+        return pickle.loads(blob) if blob is not None else None
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            self._redis().set(
+                self._key(namespace, key), blob, px=int(ttl * 1000) if ttl is not None else None
+            )
+        except redis.RedisError as exc:
+            logger.warning("Failed to write state %s/%s: %s", namespace, key, exc)
+
+    def delete(self, namespace: str, key: str) -> None:
+        try:
+            self._redis().delete(self._key(namespace, key))
+        except redis.RedisError as exc:
+            logger.warning("Failed to delete state %s/%s: %s", namespace, key, exc)
+
+
+def build_state_store(spec: str = STATE_STORE) -> StateStore:
+    """Create the backend named by a `STATE_STORE` value."""
+    spec = (spec or "memory").strip()
+    if spec == "memory":
+        return MemoryStateStore()
+    if spec.startswith("sqlite:///"):
+        return SQLiteStateStore(spec[len("sqlite:///"):])
+    if spec.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateStore(spec)
+    raise ValueError(f"Unsupported STATE_STORE: {spec!r}")
+
+
+_store: Optional[StateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    """Return the process-wide state store, creating it on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = build_state_store(os.getenv("STATE_STORE", STATE_STORE))
+    return _store
+
+
+def set_state_store(store: Optional[StateStore]) -> None:
+    """Override the process-wide state store (tests)."""
+    global _store
+    with _store_lock:
+        _store = store
@@ -0,0 +1,171 @@
+# backend/swr_cache.py
+
+"""
+Stale-while-revalidate cache for slow upstream lookups.
+
+Each entry is fresh for `ttl` seconds, then stale for a further `grace`
+seconds. A stale entry is returned immediately while one background task
+refreshes it; only lookups after the grace window (or for unknown keys)
+wait for the loader. Concurrent misses and refreshes for the same key share
+a single loader call.
+
+`/jobs/search` and the job-fetch step of `/match` use this through
+`job_fetcher.fetch_jobs_cached`, so an expiring hot query costs its next
+user nothing.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .metrics import REGISTRY, record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+CACHE_REFRESHES = REGISTRY.counter(
+    "cache_refreshes_total", "Background stale-while-revalidate refreshes by cache and result."
+)
+
+
+class SWRCache:
+    """
+    Thread-safe bounded LRU with stale-while-revalidate expiry.
+
+    Args:
+        name: Cache name used in metrics
+        ttl: Seconds an entry is served as fresh
+        grace: Further seconds an expired entry may be served while refreshing
+        max_entries: LRU bound
+        should_cache: Predicate deciding whether a loaded value is stored
+            (e.g. skip empty results so an upstream outage does not replace
+            good data)
+        max_workers: Background refresh threads
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        grace: float,
+        max_entries: int = 256,
+        should_cache: Callable[[Any], bool] = lambda value: True,
+        max_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.grace = grace
+        self.max_entries = max(1, max_entries)
+        self.should_cache = should_cache
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix=f"swr-{name}")
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        timeout: Optional[float] = None,
+        refresh_loader: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        Return the value for `key`, calling `loader` only when needed.
+
+        Args:
+            timeout: Longest wait for another caller's in-flight load
+                (raises `concurrent.futures.TimeoutError`)
+            refresh_loader: Loader for background refreshes, when `loader`
+                is bound to the caller (e.g. to its request deadline)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self.clock()
+            if entry is not None:
+                loaded_at, value = entry
+                age = now - loaded_at
+                if age <= self.ttl + self.grace:
+                    self._entries.move_to_end(key)
+                    if age > self.ttl and key not in self._inflight:
+                        future = Future()
+                        self._inflight[key] = future
+                        self._executor.submit(
+                            self._refresh, key, refresh_loader or loader, future
+                        )
+                    record_cache_lookup(self.name, hit=True)
+                    return value
+            record_cache_lookup(self.name, hit=False)
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        if owner:
+            self._load(key, loader, future)
+        return future.result(timeout=timeout)
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], future: Future) -> None:
+        try:
+            value = loader()
+        except Exception as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            return
+        with self._lock:
+            if self.should_cache(value):
+                self._entries[key] = (self.clock(), value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], future: Future) -> None:
+        self._load(key, loader, future)
+        if future.exception() is not None:
+            CACHE_REFRESHES.inc(cache=self.name, result="error")
+            logger.warning("Background refresh of %s %r failed: %s",
+                           self.name, key, future.exception())
+        else:
+            CACHE_REFRESHES.inc(cache=self.name, result="ok")
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Store a value loaded elsewhere (e.g. prefetched); False if `should_cache` rejects it."""
+        if not self.should_cache(value):
+            return False
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Seconds since `key` was loaded, or None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else self.clock() - entry[0]
+
+    def wait_idle(self, timeout: Optional[float] = None) -> None:
+        """Block until in-flight loads finish (tests and shutdown)."""
+        with self._lock:
+            futures = list(self._inflight.values())
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
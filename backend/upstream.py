@@ -0,0 +1,369 @@
+# backend/upstream.py
+
+"""
+Resilient HTTP client for rate-limited upstream APIs (RapidAPI JSearch).
+
+`UpstreamClient.get_json` wraps `requests` with:
+
+- a token-bucket limiter sized to the API plan, so bursts queue briefly
+  instead of being rejected upstream with HTTP 429
+- connect/read timeouts, so a hung upstream cannot hold a worker forever
+- jittered exponential retries for idempotent GETs on timeouts, connection
+  errors, 5xx and 429 (honouring `Retry-After`)
+- a circuit breaker that fails fast after repeated failures and lets a
+  single probe through once `reset_timeout` has passed
+- an optional per-call time budget (the request deadline): each attempt's
+  timeouts are capped to what is left, and no token wait, backoff or retry
+  is started that cannot finish within it
+
+The limiter is per process; its defaults are the plan's limits divided by
+`WEB_CONCURRENCY`, so the workers together stay within the plan.
+
+Quota headers returned by RapidAPI (`X-RateLimit-Requests-Limit` /
+`-Remaining`) and the limiter/breaker state are exported as metrics.
+"""
+
+import email.utils
+import logging
+import math
+import os
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from .metrics import REGISTRY, UPSTREAM_REQUESTS
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
+# Each worker process holds its own bucket, so the default plan limits (5
+# requests/second, bursts of 5) are split across `WEB_CONCURRENCY` workers
+_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+UPSTREAM_RATE_PER_SEC = float(os.getenv("UPSTREAM_RATE_PER_SEC", str(5 / _WORKERS)))
+UPSTREAM_BURST = int(os.getenv("UPSTREAM_BURST", str(max(1, 5 // _WORKERS))))
+UPSTREAM_MAX_WAIT_SECONDS = float(os.getenv("UPSTREAM_MAX_WAIT_SECONDS", "5"))
+UPSTREAM_CONNECT_TIMEOUT = float(os.getenv("UPSTREAM_CONNECT_TIMEOUT", "3.05"))
+UPSTREAM_READ_TIMEOUT = float(os.getenv("UPSTREAM_READ_TIMEOUT", "10"))
+UPSTREAM_MAX_RETRIES = int(os.getenv("UPSTREAM_MAX_RETRIES", "3"))
+UPSTREAM_BACKOFF_BASE = float(os.getenv("UPSTREAM_BACKOFF_BASE", "0.5"))
+UPSTREAM_BACKOFF_MAX = float(os.getenv("UPSTREAM_BACKOFF_MAX", "8"))
+UPSTREAM_BREAKER_FAILURES = int(os.getenv("UPSTREAM_BREAKER_FAILURES", "5"))
+UPSTREAM_BREAKER_RESET_SECONDS = float(os.getenv("UPSTREAM_BREAKER_RESET_SECONDS", "30"))
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class UpstreamError(RuntimeError):
+    """Raised when an upstream call fails after retries (or is not attempted)."""
+
+
+class CircuitOpenError(UpstreamError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+
+class RateLimitedError(UpstreamError):
+    """Raised when no request token became available within the wait budget."""
+
+
+class BudgetExceededError(UpstreamError):
+    """Raised when the caller's time budget runs out before a response."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate` tokens/second."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def cancel(self) -> None:
+        """Return a token taken by `reserve` that will not be used."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def block_for(self, seconds: float) -> None:
+        """Hold all requests for `seconds` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self.clock() + seconds)
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill(self.clock())
+            return max(0.0, self._tokens)
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive failures -> half-open probe."""
+
+    CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_thread: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True if a call may proceed (at most one probe while half-open)."""
+        with self._lock:
+            if self.state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probe_thread = threading.get_ident()
+                return True
+            return self.state == self.CLOSED
+
+    def release(self) -> None:
+        """
+        Settle this thread's half-open probe if it ended without a verdict.
+
+        A probe that never reached the upstream (rate limited) or ended in an
+        error that says nothing about its health (a 4xx, an unexpected
+        exception) reverts to open with the original open time, so the next
+        call probes again instead of the breaker staying half-open forever.
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._probe_thread == threading.get_ident():
+                self.state = self.OPEN
+                self._probe_thread = None
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Upstream circuit opened after %d failures", self._failures)
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class UpstreamClient:
+    """Rate-limited, retrying, circuit-broken JSON GET client for one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_sec: float = UPSTREAM_RATE_PER_SEC,
+        burst: int = UPSTREAM_BURST,
+        max_wait: float = UPSTREAM_MAX_WAIT_SECONDS,
+        timeout=(UPSTREAM_CONNECT_TIMEOUT, UPSTREAM_READ_TIMEOUT),
+        max_retries: int = UPSTREAM_MAX_RETRIES,
+        backoff_base: float = UPSTREAM_BACKOFF_BASE,
+        backoff_max: float = UPSTREAM_BACKOFF_MAX,
+        breaker: Optional[CircuitBreaker] = None,
+        session: Optional["requests.Session"] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.bucket = TokenBucket(rate_per_sec, burst, clock=clock)
+        self.breaker = breaker or CircuitBreaker(
+            UPSTREAM_BREAKER_FAILURES, UPSTREAM_BREAKER_RESET_SECONDS, clock=clock
+        )
+        self.max_wait = max_wait
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._session = session
+        self.sleep = sleep
+        self.clock = clock
+        self.quota: Dict[str, int] = {}
+        self._rng = random.Random()
+        _CLIENTS[name] = self
+
+    @property
+    def session(self) -> "requests.Session":
+        # Created on first use: keeps `requests` off the import path and
+        # out of a gunicorn master that forks workers afterwards
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": uniform in [0, min(cap, base * 2^attempt)]
+        return self._rng.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _record_quota(self, response: "requests.Response") -> None:
+        for header, key in (
+            ("X-RateLimit-Requests-Limit", "limit"),
+            ("X-RateLimit-Requests-Remaining", "remaining"),
+        ):
+            value = response.headers.get(header)
+            if value is not None and value.isdigit():
+                self.quota[key] = int(value)
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None,
+                 params: Optional[Dict[str, Any]] = None,
+                 budget: Optional[float] = None) -> Any:
+        """
+        GET `url` and decode the JSON body.
+
+        Args:
+            budget: Seconds the whole call (token wait, attempts, backoff)
+                may take, e.g. `Deadline.remaining()`; None means unbounded
+
+        Raises:
+            CircuitOpenError: If the breaker is open (no request is made)
+            RateLimitedError: If no token frees up within `max_wait` seconds
+            BudgetExceededError: If `budget` runs out before a response
+            UpstreamError: If the request still fails after retries
+        """
+        import requests
+
+        expires_at = None if budget is None or math.isinf(budget) else self.clock() + budget
+        try:
+            return self._get_json(requests, url, headers, params, expires_at)
+        finally:
+            # A half-open probe must always be settled, whatever ended the call
+            self.breaker.release()
+
+    def _out_of_budget(self, last_error: str) -> BudgetExceededError:
+        UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="budget_exceeded")
+        return BudgetExceededError(f"{self.name}: time budget exhausted ({last_error})")
+
+    def _get_json(self, requests, url: str, headers: Optional[Dict[str, str]],
+                  params: Optional[Dict[str, Any]], expires_at: Optional[float]) -> Any:
+        last_error = "no attempt made"
+        for attempt in range(self.max_retries + 1):
+            if not self.breaker.allow():
+                UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="circuit_open")
+                raise CircuitOpenError(f"{self.name}: circuit open ({last_error})")
+
+            wait = self.bucket.reserve()
+            if wait > self.max_wait:
+                self.bucket.cancel()
+                UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="rate_limited")
+                raise RateLimitedError(f"{self.name}: no request token within {self.max_wait}s")
+            if expires_at is not None and wait >= expires_at - self.clock():
+                self.bucket.cancel()
+                raise self._out_of_budget(last_error)
+            if wait > 0:
+                self.sleep(wait)
+
+            timeout = self.timeout
+            if expires_at is not None:
+                remaining = expires_at - self.clock()
+                if remaining <= 0:
+                    raise self._out_of_budget(last_error)
+                timeout = _cap_timeout(self.timeout, remaining)
+
+            retry_after = None
+            try:
+                response = self.session.get(url, headers=headers, params=params,
+                                            timeout=timeout)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                last_error = f"{type(exc).__name__}: {exc}"
+                if timeout != self.timeout and isinstance(exc, requests.Timeout):
+                    # Cut short by the budget, not a sign of an upstream outage
+                    raise self._out_of_budget(last_error) from exc
+            else:
+                self._record_quota(response)
+                if response.status_code < 400:
+                    try:
+                        payload = response.json()
+                    except ValueError as exc:
+                        self.breaker.record_failure()
+                        UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="error")
+                        raise UpstreamError(f"{self.name}: invalid JSON response") from exc
+                    self.breaker.record_success()
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="ok")
+                    return payload
+                last_error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUS:
+                    # Client errors (bad key, bad params) are not upstream outages
+                    UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="error")
+                    raise UpstreamError(f"{self.name}: {last_error}")
+                if response.status_code == 429:
+                    retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+                    self.bucket.block_for(retry_after if retry_after is not None
+                                          else self._backoff(attempt))
+
+            self.breaker.record_failure()
+            if attempt == self.max_retries:
+                break
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if delay > self.backoff_max:
+                break  # Retry-After beyond our budget: fail now rather than stall the request
+            if expires_at is not None and delay >= expires_at - self.clock():
+                raise self._out_of_budget(last_error)
+            UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="retry")
+            logger.info("%s: %s, retrying in %.2fs", self.name, last_error, delay)
+            self.sleep(delay)
+
+        UPSTREAM_REQUESTS.inc(upstream=self.name, outcome="error")
+        raise UpstreamError(f"{self.name}: {last_error}")
+
+
+def _cap_timeout(timeout, limit: float):
+    """`timeout` (seconds or a (connect, read) pair) with each part capped at `limit`."""
+    if isinstance(timeout, tuple):
+        return tuple(min(part, limit) for part in timeout)
+    return min(timeout, limit)
+
+
+_CLIENTS: Dict[str, UpstreamClient] = {}
+_BREAKER_STATE = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+
+
+def _upstream_samples():
+    for name, client in list(_CLIENTS.items()):
+        labels = {"upstream": name}
+        yield "upstream_circuit_state", labels, _BREAKER_STATE[client.breaker.state]
+        yield "upstream_tokens_available", labels, client.bucket.available()
+        for key, value in client.quota.items():
+            yield f"upstream_quota_{key}", labels, value
+
+
+REGISTRY.register_collector(_upstream_samples)
@@ -0,0 +1,123 @@
+# backend/warmup.py
+
+"""
+Startup warm-up and readiness.
+
+Importing `backend.app` stays cheap: scipy, pdfplumber and requests are
+imported on first use. `warm_up` then pays those costs once,
+before real traffic does:
+
+- `matchers`: load the prebuilt skill/role matcher artifact
+- `scoring_profiles`: read the scoring profile registry
+- `vectorizer`: import scipy and score one tiny TF-IDF comparison
+- `job_index`: map the current feature-store generation, if configured
+- `bm25`: with `SEMANTIC_SCORER=bm25`, index the most recent stored jobs
+
+Under gunicorn, `gunicorn_conf.when_ready` runs it in the master before
+forking, so every worker starts ready. A single uvicorn process runs it in a
+background thread from the startup hook, so the port opens immediately and
+`/ready` answers 503 until it finishes.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .metrics import span
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_matchers() -> None:
+    from .nlp_model.matchers import get_matchers
+
+    get_matchers()
+
+
+def _warm_scoring_profiles() -> None:
+    from .scoring_profiles import get_registry
+
+    get_registry()
+
+
+def _warm_vectorizer() -> None:
+    from .nlp_model.tfidf_matcher import compute_tfidf_scores
+
+    compute_tfidf_scores("warm up", [{"description": "warm up"}])
+
+
+def _warm_job_index() -> None:
+    from .job_index import get_job_index
+
+    get_job_index()
+
+
+def _warm_bm25() -> None:
+    from .job_index import get_bm25_index, index_jobs
+    from .job_store import JOB_STORE_PATH, JobStore
+
+    index = get_bm25_index()
+    if index is None or not JOB_STORE_PATH:
+        return
+    # A private connection: this may run in the gunicorn master, before the fork
+    store = JobStore(path=JOB_STORE_PATH)
+    try:
+        jobs = store.recent(index.max_docs)
+    finally:
+        store.close()
+    # Oldest first, so the index's ingestion order matches the store's
+    index_jobs(reversed(jobs))
+
+
+STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("matchers", _warm_matchers),
+    ("scoring_profiles", _warm_scoring_profiles),
+    ("vectorizer", _warm_vectorizer),
+    ("job_index", _warm_job_index),
+    ("bm25", _warm_bm25),
+]
+
+_lock = threading.Lock()
+_state: Dict[str, Any] = {"ready": False, "started": False, "steps": {}, "errors": {}}
+
+
+def warm_up() -> None:
+    """Run every warm-up step once (later calls return immediately)."""
+    with _lock:
+        if _state["ready"]:
+            return
+        _state["started"] = True
+        started = time.perf_counter()
+        for name, step in STEPS:
+            step_started = time.perf_counter()
+            try:
+                with span(f"warm_up_{name}"):
+                    step()
+            except Exception as exc:
+                # A failed step only means that work happens on first use instead
+                logger.exception("Warm-up step %s failed", name)
+                _state["errors"][name] = str(exc)
+            _state["steps"][name] = round(time.perf_counter() - step_started, 4)
+        _state["seconds"] = round(time.perf_counter() - started, 4)
+        _state["ready"] = True
+    logger.info("Warm-up finished in %.2fs", _state["seconds"])
+
+
+def start_warm_up() -> Optional[threading.Thread]:
+    """Run `warm_up` in a background thread unless it already ran or is running."""
+    if _state["ready"] or _state["started"]:
+        return None
+    thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def readiness() -> Dict[str, Any]:
+    """Snapshot of warm-up progress for the `/ready` endpoint."""
+    return {
+        "ready": _state["ready"],
+        "steps": dict(_state["steps"]),
+        "errors": dict(_state["errors"]),
+        "seconds": _state.get("seconds"),
+    }
@@ -0,0 +1,75 @@
+# benchmarks/compare.py
+
+"""
+Compare two benchmark JSON reports produced by `benchmarks.run`.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 1.10]
+
+Cases whose median time (or peak memory) grew by more than `threshold` are
+reported as regressions and the command exits with status 1.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+Key = Tuple[str, str]
+
+
+def _index(report: Dict) -> Dict[Key, Dict]:
+    return {
+        (row["benchmark"], json.dumps(row["params"], sort_keys=True)): row
+        for row in report["results"]
+    }
+
+
+def compare(baseline: Dict, candidate: Dict, threshold: float = 1.10) -> List[Dict]:
+    """Return one row per case present in both reports, with time and memory ratios."""
+    base_rows = _index(baseline)
+    rows = []
+    for key, cand in _index(candidate).items():
+        base = base_rows.get(key)
+        if base is None:
+            continue
+        time_ratio = cand["median_s"] / base["median_s"] if base["median_s"] else None
+        base_mem = base.get("peak_memory_bytes") or 0
+        mem_ratio = cand.get("peak_memory_bytes", 0) / base_mem if base_mem else None
+        rows.append({
+            "benchmark": key[0],
+            "params": key[1],
+            "time_ratio": time_ratio,
+            "memory_ratio": mem_ratio,
+            "regression": bool(
+                (time_ratio and time_ratio > threshold) or (mem_ratio and mem_ratio > threshold)
+            ),
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="ratio above which a case counts as a regression")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    candidate = json.loads(args.candidate.read_text(encoding="utf-8"))
+    rows = compare(baseline, candidate, args.threshold)
+
+    print(f"{'benchmark':<16} {'time x':>8} {'mem x':>8}  params")
+    for row in rows:
+        flag = "  <-- regression" if row["regression"] else ""
+        time_ratio = f"{row['time_ratio']:.2f}" if row["time_ratio"] else "n/a"
+        mem_ratio = f"{row['memory_ratio']:.2f}" if row["memory_ratio"] else "n/a"
+        print(f"{row['benchmark']:<16} {time_ratio:>8} {mem_ratio:>8}  {row['params']}{flag}")
+
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
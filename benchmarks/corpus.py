@@ -0,0 +1,155 @@
+# benchmarks/corpus.py
+
+"""
+Synthetic and fixture-based corpora for the benchmark harness.
+
+Everything is generated from a seeded RNG so that two runs on different
+commits score exactly the same inputs.
+"""
+
+import io
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from backend.nlp_model.skills_dict import get_all_skills
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+FILLER_WORDS = (
+    "team build deliver product customers data platform scale design review "
+    "support stakeholders improve reliability metrics growth collaborate own "
+    "roadmap quality services pipeline analysis reporting research strategy "
+    "cross functional environment fast paced mission impact ownership"
+).split()
+
+TITLES = [
+    "Data Scientist", "Machine Learning Engineer", "Data Engineer", "Data Analyst",
+    "Software Engineer", "DevOps Engineer", "Research Scientist", "Product Manager",
+]
+LOCATIONS = ["New York, NY", "Austin, TX", "Remote", "Seattle, WA", "Arlington, VA", None]
+
+# Resume length presets: number of bullet lines in experience/projects.
+RESUME_LENGTHS = {"short": 4, "medium": 20, "long": 80}
+RESUME_FORMATS = ("headed", "inline", "unstructured")
+
+
+def _sentence(rng: random.Random, skills: List[str], n_words: int) -> str:
+    words = []
+    for _ in range(n_words):
+        if rng.random() < 0.12:
+            words.append(rng.choice(skills))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+    return " ".join(words).capitalize() + "."
+
+
+def make_resume(length: str = "medium", fmt: str = "headed", seed: int = 0) -> str:
+    """
+    Build a synthetic resume.
+
+    Args:
+        length: One of RESUME_LENGTHS ("short", "medium", "long")
+        fmt: "headed" (ALL CAPS section headers), "inline" ("Skills: ..."
+             lines without headers) or "unstructured" (a single text blob)
+        seed: RNG seed
+
+    Returns:
+        Resume text
+    """
+    rng = random.Random(seed)
+    skills = get_all_skills()
+    n_lines = RESUME_LENGTHS[length]
+    skill_line = ", ".join(rng.sample(skills, 15))
+    summary = _sentence(rng, skills, 25)
+    experience = [f"- {_sentence(rng, skills, 18)}" for _ in range(n_lines)]
+    projects = [f"- {_sentence(rng, skills, 14)}" for _ in range(max(1, n_lines // 2))]
+    education = "Master of Science in Computer Science, State University (2016-2018)"
+
+    if fmt == "headed":
+        parts = [
+            "Jane Doe", "jane@example.com | (555) 010-0000", "",
+            "PROFESSIONAL SUMMARY", summary, "",
+            "SKILLS", skill_line, "",
+            "EXPERIENCE", "Senior Data Scientist at Acme (2019-2024)", *experience, "",
+            "PROJECTS", *projects, "",
+            "EDUCATION", education,
+        ]
+    elif fmt == "inline":
+        parts = [
+            "Jane Doe - jane@example.com",
+            f"Skills: {skill_line}",
+            summary,
+            *experience,
+            *projects,
+            f"University: {education}",
+        ]
+    elif fmt == "unstructured":
+        parts = [" ".join([summary, skill_line, *experience, *projects, education])]
+    else:
+        raise ValueError(f"Unknown resume format: {fmt}")
+    return "\n".join(parts)
+
+
+def make_resume_docx(text: str, table_rows: int = 0, table_cols: int = 4) -> bytes:
+    """
+    Render resume text to DOCX bytes, optionally appending a skills table.
+
+    Table-heavy documents stress the DOCX loader the way templated resumes do.
+    """
+    from docx import Document
+
+    document = Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    if table_rows:
+        skills = get_all_skills()
+        table = document.add_table(rows=table_rows, cols=table_cols)
+        for r, row in enumerate(table.rows):
+            for c, cell in enumerate(row.cells):
+                cell.text = skills[(r * table_cols + c) % len(skills)]
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_jobs(n_jobs: int, seed: int = 0, min_words: int = 80, max_words: int = 600) -> List[Dict]:
+    """Build `n_jobs` synthetic postings shaped like `fetch_jobs_from_api` output."""
+    rng = random.Random(seed)
+    skills = get_all_skills()
+    jobs = []
+    for i in range(n_jobs):
+        n_words = rng.randint(min_words, max_words)
+        sentences = []
+        remaining = n_words
+        while remaining > 0:
+            size = min(remaining, rng.randint(8, 20))
+            sentences.append(_sentence(rng, skills, size))
+            remaining -= size
+        if rng.random() < 0.6:
+            sentences.append(f"Requires {rng.randint(1, 8)}+ years of experience.")
+        jobs.append({
+            "title": rng.choice(TITLES),
+            "company": f"Company {i}",
+            "location": rng.choice(LOCATIONS),
+            "description": " ".join(sentences),
+            "apply_link": f"https://example.com/jobs/{i}",
+        })
+    return jobs
+
+
+def load_fixture_resumes() -> Dict[str, str]:
+    """Return `{name: text}` for every `*.txt` resume in benchmarks/fixtures."""
+    return {
+        path.stem: path.read_text(encoding="utf-8")
+        for path in sorted(FIXTURE_DIR.glob("*.txt"))
+    }
+
+
+def load_fixture_jobs() -> List[Dict]:
+    """Return the recorded job list stored in benchmarks/fixtures/jobs.json."""
+    path = FIXTURE_DIR / "jobs.json"
+    if not path.exists():
+        return []
+    return json.loads(path.read_text(encoding="utf-8"))
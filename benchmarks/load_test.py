@@ -0,0 +1,234 @@
+# benchmarks/load_test.py
+
+"""
+Open-loop HTTP load test for the FastAPI app.
+
+Requests are scheduled at a fixed target rate (independent of how fast the
+server answers) and per-endpoint p50/p95/p99 latencies are reported. Pair it
+with the replay job source so no RapidAPI quota is spent:
+
+    JOB_SOURCE=replay uvicorn backend.app:app --port 8000 &
+    python -m benchmarks.load_test --rps 20 --duration 30
+
+or let the script start the server itself:
+
+    python -m benchmarks.load_test --serve --rps 20 --duration 30 \\
+        --replay-latency-ms 300 --replay-error-rate 0.02
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+from .corpus import FIXTURE_DIR, load_fixture_resumes
+
+DEFAULT_MIX = "search=3,match=1"
+QUERIES = [
+    ("Data Scientist", "Virginia"),
+    ("Software Engineer", ""),
+    ("Data Engineer", "New York"),
+]
+
+
+def _resume_docx() -> bytes:
+    """Render a fixture resume to DOCX so /match exercises the real upload path."""
+    from docx import Document
+
+    text = next(iter(load_fixture_resumes().values()))
+    document = Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadTest:
+    """Fire requests at `rps` for `duration` seconds and collect latencies."""
+
+    def __init__(self, base_url: str, rps: float, duration: float, mix: Dict[str, int],
+                 concurrency: int = 64, seed: int = 0):
+        self.base_url = base_url.rstrip("/")
+        self.rps = rps
+        self.duration = duration
+        self.concurrency = concurrency
+        self.endpoints = [name for name, weight in mix.items() for _ in range(weight)]
+        self.rng = random.Random(seed)
+        self.resume_bytes = _resume_docx() if "match" in mix else b""
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _call(self, endpoint: str, title: str, location: str) -> None:
+        session = self._session()
+        start = time.perf_counter()
+        status = None
+        try:
+            if endpoint == "search":
+                response = session.get(
+                    f"{self.base_url}/jobs/search",
+                    params={"title": title, "location": location},
+                    timeout=60,
+                )
+            elif endpoint == "random":
+                response = session.get(f"{self.base_url}/jobs/random", timeout=60)
+            elif endpoint == "match":
+                response = session.post(
+                    f"{self.base_url}/match",
+                    files={"file": ("resume.docx", self.resume_bytes)},
+                    data={"title": title, "location": location, "experience": "3"},
+                    timeout=120,
+                )
+            else:
+                raise ValueError(f"Unknown endpoint: {endpoint}")
+            status = response.status_code
+        except requests.RequestException:
+            status = None
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.latencies[endpoint].append(elapsed)
+            if status is None or status >= 400:
+                self.errors[endpoint] += 1
+            self.statuses[endpoint][status or 0] += 1
+
+    def run(self) -> Dict:
+        interval = 1.0 / self.rps
+        total = int(self.rps * self.duration)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for i in range(total):
+                target = started + i * interval
+                delay = target - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                title, location = self.rng.choice(QUERIES)
+                pool.submit(self._call, self.rng.choice(self.endpoints), title, location)
+        wall = time.perf_counter() - started
+        return self.report(total, wall)
+
+    def report(self, sent: int, wall: float) -> Dict:
+        endpoints = {}
+        for endpoint, values in self.latencies.items():
+            ordered = sorted(values)
+            endpoints[endpoint] = {
+                "requests": len(ordered),
+                "errors": self.errors[endpoint],
+                "status_counts": {str(k): v for k, v in self.statuses[endpoint].items()},
+                "p50_ms": _percentile(ordered, 50) * 1000,
+                "p95_ms": _percentile(ordered, 95) * 1000,
+                "p99_ms": _percentile(ordered, 99) * 1000,
+                "max_ms": ordered[-1] * 1000 if ordered else float("nan"),
+            }
+        return {
+            "target_rps": self.rps,
+            "achieved_rps": sent / wall if wall else 0.0,
+            "duration_s": wall,
+            "endpoints": endpoints,
+        }
+
+
+def _start_server(port: int, args, job_store_path: str) -> subprocess.Popen:
+    env = dict(os.environ)
+    env.update({
+        "JOB_SOURCE": "replay",
+        # Keep the run's postings out of backend/jobs.sqlite3
+        "JOB_STORE_PATH": job_store_path,
+        "JOB_REPLAY_DIR": str(args.replay_dir),
+        "JOB_REPLAY_LATENCY_MS": str(args.replay_latency_ms),
+        "JOB_REPLAY_ERROR_RATE": str(args.replay_error_rate),
+    })
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.app:app", "--port", str(port),
+         "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            requests.get(f"http://127.0.0.1:{port}/metrics", timeout=1)
+            return process
+        except requests.RequestException:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start within 30s")
+
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = int(weight or 1)
+    return mix
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop load test for the API.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help="weighted endpoint mix, e.g. search=3,match=1,random=1")
+    parser.add_argument("--serve", action="store_true",
+                        help="start uvicorn with the replay job source for the run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replay-dir", type=Path, default=FIXTURE_DIR / "jsearch")
+    parser.add_argument("--replay-latency-ms", type=float, default=0.0)
+    parser.add_argument("--replay-error-rate", type=float, default=0.0)
+    parser.add_argument("--output", type=Path, help="also write the report as JSON")
+    args = parser.parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    scratch = tempfile.TemporaryDirectory(prefix="load-test-")
+    try:
+        if args.serve:
+            server = _start_server(args.port, args, os.path.join(scratch.name, "jobs.sqlite3"))
+            base_url = f"http://127.0.0.1:{args.port}"
+        report = LoadTest(base_url, args.rps, args.duration, _parse_mix(args.mix),
+                          args.concurrency).run()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+        scratch.cleanup()
+
+    print(f"target {report['target_rps']:.1f} rps, achieved {report['achieved_rps']:.1f} rps")
+    print(f"{'endpoint':<10} {'reqs':>6} {'errs':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for name, row in sorted(report["endpoints"].items()):
+        print(f"{name:<10} {row['requests']:>6} {row['errors']:>6} "
+              f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f}")
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
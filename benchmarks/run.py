@@ -0,0 +1,209 @@
+# benchmarks/run.py
+
+"""
+Benchmark harness for the matching pipeline.
+
+Measures wall time and peak traced memory for `load_resume` (DOCX), `parse_sections`,
+`extract_skills`, `extract_job_skills_from_list`, `compute_tfidf_scores` and
+end-to-end `recommend_jobs` over synthetic and fixture corpora, then writes
+the results to JSON so runs from different commits can be compared with
+`python -m benchmarks.compare`.
+
+Usage:
+    python -m benchmarks.run                          # default sizes
+    python -m benchmarks.run --sizes 10 1000 50000    # custom job-list sizes
+    python -m benchmarks.run --only tfidf recommend   # subset of benchmarks
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from backend.nlp_model.extract_job_skills_from_list import extract_job_skills_from_list
+from backend.nlp_model.resume_parser import ResumeParser
+from backend.nlp_model.tfidf_matcher import compute_tfidf_scores
+from backend.nlp_model_stub import recommend_jobs
+
+from .corpus import (
+    RESUME_FORMATS,
+    RESUME_LENGTHS,
+    load_fixture_jobs,
+    load_fixture_resumes,
+    make_jobs,
+    make_resume,
+    make_resume_docx,
+)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SIZES = [10, 100, 1000]
+BENCHMARKS = ("load_resume", "parse_sections", "extract_skills", "job_skills", "tfidf", "recommend")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(func: Callable[[], object], repeat: int, items: int = 1) -> Dict:
+    """
+    Time `func` `repeat` times, then run it once more under tracemalloc.
+
+    Returns:
+        Dictionary with min/median/mean seconds, items-per-second throughput
+        (based on the median) and peak traced memory in bytes.
+    """
+    func()  # warm-up: populate lazy imports and module-level caches
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(timings)
+    return {
+        "repeat": len(timings),
+        "min_s": min(timings),
+        "median_s": median,
+        "mean_s": statistics.fmean(timings),
+        "throughput_per_s": items / median if median > 0 else None,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _resume_corpus() -> Dict[str, str]:
+    corpus = {
+        f"synthetic-{length}-{fmt}": make_resume(length, fmt, seed=i)
+        for i, (length, fmt) in enumerate(
+            (length, fmt) for length in RESUME_LENGTHS for fmt in RESUME_FORMATS
+        )
+    }
+    corpus.update({f"fixture-{name}": text for name, text in load_fixture_resumes().items()})
+    return corpus
+
+
+def _job_corpora(sizes: List[int]) -> Dict[str, List[Dict]]:
+    corpora = {f"synthetic-{n}": make_jobs(n, seed=n) for n in sizes}
+    fixture_jobs = load_fixture_jobs()
+    if fixture_jobs:
+        corpora["fixture"] = fixture_jobs
+    return corpora
+
+
+def _repeat_for(n_items: int, base: int) -> int:
+    """Fewer repetitions for large inputs so a 50k-job run stays tractable."""
+    if n_items >= 10000:
+        return 1
+    if n_items >= 1000:
+        return max(1, base // 3)
+    return base
+
+
+def run(sizes: List[int], only: Optional[List[str]] = None, repeat: int = 5) -> Dict:
+    """Run the selected benchmarks and return the JSON-serialisable report."""
+    selected = set(only or BENCHMARKS)
+    parser = ResumeParser()
+    resumes = _resume_corpus()
+    job_corpora = _job_corpora(sizes)
+    reference_resume = resumes["synthetic-medium-headed"]
+    results = []
+
+    def record(name: str, params: Dict, stats: Dict) -> None:
+        results.append({"benchmark": name, "params": params, **stats})
+        print(
+            f"{name:<16} {json.dumps(params):<50} "
+            f"median={stats['median_s'] * 1000:9.2f} ms  "
+            f"peak={stats['peak_memory_bytes'] / 1024:9.1f} KiB"
+        )
+
+    if "load_resume" in selected:
+        for length in RESUME_LENGTHS:
+            for table_rows in (0, 200):
+                data = make_resume_docx(make_resume(length, "headed"), table_rows)
+                params = {"resume": f"docx-{length}", "table_rows": table_rows, "bytes": len(data)}
+                record("load_resume", params,
+                       measure(lambda d=data: parser.load_resume(d, file_name="r.docx"), repeat))
+
+    for name, text in resumes.items():
+        params = {"resume": name, "chars": len(text)}
+        if "parse_sections" in selected:
+            record("parse_sections", params,
+                   measure(lambda t=text: parser.parse_sections(t), repeat))
+        if "extract_skills" in selected:
+            sections = parser.parse_sections(text)
+            record("extract_skills", params,
+                   measure(lambda s=sections: parser.extract_skills(s), repeat))
+
+    for name, jobs in job_corpora.items():
+        params = {"jobs": name, "n_jobs": len(jobs)}
+        reps = _repeat_for(len(jobs), repeat)
+        if "job_skills" in selected:
+            record("job_skills", params,
+                   measure(lambda j=jobs: extract_job_skills_from_list(j), reps, len(jobs)))
+        if "tfidf" in selected:
+            record("tfidf", params,
+                   measure(lambda j=jobs: compute_tfidf_scores(reference_resume, j),
+                           reps, len(jobs)))
+        if "recommend" in selected:
+            record("recommend", params,
+                   measure(lambda j=jobs: recommend_jobs(
+                       reference_resume, j, "Data Scientist", "Virginia", "3"),
+                       reps, len(jobs)))
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="job-list sizes for the synthetic corpora (e.g. 10 1000 50000)")
+    arg_parser.add_argument("--only", nargs="+", choices=BENCHMARKS,
+                            help="run only these benchmarks")
+    arg_parser.add_argument("--repeat", type=int, default=5,
+                            help="timed repetitions per case (reduced for large inputs)")
+    arg_parser.add_argument("--output", type=Path,
+                            help="output JSON path (default: benchmarks/results/<commit>.json)")
+    args = arg_parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+    report = run(args.sizes, args.only, args.repeat)
+
+    output = args.output or RESULTS_DIR / f"{report['meta']['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nWrote {len(report['results'])} results to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
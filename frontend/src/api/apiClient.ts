@@ -6,15 +6,47 @@ const BASE_URL = import.meta.env.VITE_API_BASE_URL || "http://localhost:8000";
 // Later for deployment (HuggingFace Space):
 // const BASE_URL = "https://your-hf-space-url.hf.space";
 
+// The last /match run; reused when only location/experience change
+let lastMatch: { key: string; matchId: string } | null = null;
+
+function matchKey(formData: FormData) {
+  const file = formData.get("file");
+  const fileKey = file instanceof File ? `${file.name}:${file.size}:${file.lastModified}` : "";
+  return `${fileKey}|${formData.get("title") ?? ""}`;
+}
+
 // ----------------------
 // Fetch matched jobs
 // ----------------------
 export async function getMatchedJobs(formData: FormData) {
+  const key = matchKey(formData);
+  if (lastMatch && lastMatch.key === key) {
+    const results = await rescoreMatch(lastMatch.matchId, formData);
+    if (results) return results;
+  }
+
   const response = await fetch(`${BASE_URL}/match`, {
     method: "POST",
     body: formData,
   });
   const data = await response.json();
+  lastMatch = data.match_id ? { key, matchId: data.match_id } : null;
+  return data.results || [];
+}
+
+// ----------------------
+// Re-rank a stored match (same resume and title, new preferences)
+// ----------------------
+async function rescoreMatch(matchId: string, formData: FormData) {
+  const body = new FormData();
+  body.append("location", String(formData.get("location") ?? ""));
+  body.append("experience", String(formData.get("experience") ?? ""));
+  const response = await fetch(`${BASE_URL}/match/${matchId}/rescore`, {
+    method: "POST",
+    body,
+  });
+  if (!response.ok) return null;
+  const data = await response.json();
   return data.results || [];
 }
 
@@ -27,6 +59,15 @@ export async function getMoreJobs() {
   return data.results || [];
 }
 
+// ----------------------
+// Fetch the full posting (description, skills) for a result card
+// ----------------------
+export async function getJobDetail(jobId: string) {
+  const response = await fetch(`${BASE_URL}/jobs/${jobId}`);
+  if (!response.ok) return null;
+  return response.json();
+}
+
 // ----------------------
 // Fetch random jobs for homepage
 // ----------------------
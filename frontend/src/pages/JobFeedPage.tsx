@@ -9,10 +9,12 @@ import "../styles/jobfeed.css";
 
 // --- Job type ---
 interface JobItem {
+  id?: string;
   title: string;
   company: string;
   location: string;
-  description: string;
+  description?: string;
+  snippet?: string;
   apply_link: string;
   score?: number;
 }
@@ -152,12 +154,12 @@ function JobFeedPage() {
         <div className="job-list">
           {jobs.map((job, index) => (
             <JobCard
-              key={index}
+              key={job.id ?? index}
               title={job.title}
               company={job.company}
               location={job.location}
               score={job.score}
-              description={job.description}
+              description={job.description ?? job.snippet}
               applyLink={job.apply_link}
             />
           ))}
@@ -5,13 +5,15 @@ import { useLocation, useNavigate } from "react-router-dom";
 import { useState } from "react";
 import JobCard from "../components/JobCard";
 import JobDetailCard from "../components/JobDetailCard";
-import { getMoreJobs } from "../api/apiClient";
+import { getJobDetail, getMoreJobs } from "../api/apiClient";
 
 interface JobItem {
+  id?: string;
   title: string;
   company: string;
   location: string;
-  description: string;
+  description?: string;
+  snippet?: string;
   apply_link: string;
   score?: number;
   summary?: string;
@@ -29,6 +31,16 @@ function ResultPage() {
   const [loadingMore, setLoadingMore] = useState(false);
   const [selectedJob, setSelectedJob] = useState<JobItem | null>(null);
 
+  // Result cards are slim; load the full description when a card is opened
+  const handleSelect = async (job: JobItem) => {
+    if (job.description || !job.id) {
+      setSelectedJob(job);
+      return;
+    }
+    const detail = await getJobDetail(job.id);
+    setSelectedJob(detail ? { ...detail, ...job } : { ...job, description: job.snippet });
+  };
+
   const handleLoadMore = async () => {
     setLoadingMore(true);
     const moreJobs: JobItem[] = await getMoreJobs();
@@ -37,9 +49,10 @@ function ResultPage() {
       ...jobs,
       ...moreJobs.filter(
         (job: JobItem) =>
-          !jobs.some(
-            (j: JobItem) =>
-              j.title === job.title && j.company === job.company
+          !jobs.some((j: JobItem) =>
+            j.id && job.id
+              ? j.id === job.id
+              : j.title === job.title && j.company === job.company
           )
       ),
     ];
@@ -180,13 +193,13 @@ function ResultPage() {
         <div style={{ display: "flex", flexDirection: "column", gap: "18px" }}>
           {jobs.map((job, index) => (
             <JobCard
-              key={`${job.title}-${job.company}-${index}`}
+              key={job.id ?? `${job.title}-${job.company}-${index}`}
               title={job.title}
               company={job.company}
               location={job.location}
               score={job.score}
-              description={job.description}
-              onSelect={() => setSelectedJob(job)}
+              description={job.description ?? job.snippet}
+              onSelect={() => handleSelect(job)}
             />
           ))}
         </div>
@@ -228,7 +241,7 @@ function ResultPage() {
             zIndex: 1000,
           }}
         >
-          <JobDetailCard job={selectedJob} onClose={() => setSelectedJob(null)} />
+          <JobDetailCard job={{ ...selectedJob, description: selectedJob.description ?? "" }} onClose={() => setSelectedJob(null)} />
         </div>
       )}
     </div>
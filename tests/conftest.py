@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from backend import job_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_store(tmp_path, monkeypatch):
+    """Give each test its own job store database instead of backend/jobs.sqlite3."""
+    monkeypatch.setattr(job_store, "JOB_STORE_PATH", str(tmp_path / "jobs.sqlite3"))
+    job_store.set_job_store(None)
+    yield
+    if job_store._store is not None:
+        job_store._store.close()
+    job_store.set_job_store(None)
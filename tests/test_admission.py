@@ -0,0 +1,82 @@
+"""Tests for /match admission control."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import app as app_module
+from backend.admission import AdmissionController, AdmissionRejected
+
+
+def test_queue_is_fifo_and_bounded():
+    async def scenario():
+        controller = AdmissionController("test", max_concurrent=1, max_queue=1, queue_timeout=5)
+        order = []
+
+        async def request(name, hold):
+            async with controller.admit():
+                order.append(name)
+                await hold.wait()
+
+        first_done, second_done = asyncio.Event(), asyncio.Event()
+        first = asyncio.create_task(request("first", first_done))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(request("second", second_done))
+        await asyncio.sleep(0)
+        assert (controller.active, controller.queued) == (1, 1)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with controller.admit():
+                pass
+        assert rejected.value.status_code == 429 and rejected.value.retry_after >= 1
+
+        first_done.set()
+        second_done.set()
+        await asyncio.gather(first, second)
+        assert order == ["first", "second"]
+        assert (controller.active, controller.queued) == (0, 0)
+
+    asyncio.run(scenario())
+
+
+def test_wait_times_out_with_503():
+    async def scenario():
+        controller = AdmissionController("test", max_concurrent=1, max_queue=4, queue_timeout=5)
+        async with controller.admit():
+            with pytest.raises(AdmissionRejected) as rejected:
+                async with controller.admit(timeout=0.01):
+                    pass
+            assert rejected.value.status_code == 503
+            assert controller.queued == 0
+        assert controller.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_match_is_turned_away_with_retry_after(monkeypatch):
+    busy = AdmissionController("match", max_concurrent=1, max_queue=0)
+    busy._active = 1
+    monkeypatch.setattr(app_module, "match_admission", busy)
+    client = TestClient(app_module.app)
+
+    response = client.post("/match", files={"file": ("resume.txt", b"SKILLS\nSQL")},
+                           data={"title": "Analyst"})
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_held_slot_outlives_the_block_until_work_finishes():
+    async def scenario():
+        controller = AdmissionController("test", max_concurrent=1, max_queue=1, queue_timeout=5)
+        work = asyncio.get_running_loop().create_future()
+        async with controller.admit() as admission:
+            admission.hold_until(work)
+        assert controller.active == 1
+
+        work.set_exception(TimeoutError("abandoned"))
+        await asyncio.sleep(0)
+        assert controller.active == 0
+
+    asyncio.run(scenario())
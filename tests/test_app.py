@@ -0,0 +1,81 @@
+"""Tests for FastAPI request handling."""
+
+from fastapi.testclient import TestClient
+
+from backend import app as app_module, job_store as job_store_module
+from backend.job_sources import JobSource, set_job_source
+from backend.job_store import JobStore
+
+
+class StaticJobSource(JobSource):
+    def __init__(self, data):
+        self.data = data
+
+    def search(self, params, timeout=None):
+        return {"data": self.data}
+
+
+def test_match_rejects_oversized_upload(monkeypatch):
+    monkeypatch.setattr(app_module, "MAX_UPLOAD_BYTES", 16)
+    client = TestClient(app_module.app)
+
+    response = client.post(
+        "/match",
+        files={"file": ("resume.pdf", b"%PDF-" + b"0" * 64)},
+        data={"title": "Data Scientist"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["results"] == []
+
+
+def test_rescore_reranks_stored_match():
+    client = TestClient(app_module.app)
+    jobs = [
+        {
+            "title": "Data Analyst",
+            "company": "Acme",
+            "location": "Austin, TX",
+            "description": "SQL dashboards. 2 years of experience.",
+            "apply_link": "https://example.com/a",
+        }
+    ]
+    state = app_module.score_jobs("SKILLS\nSQL", jobs, "Analyst", "Ohio", "0")
+    match_id = app_module.match_store.put(state)
+
+    response = client.post(f"/match/{match_id}/rescore", data={"location": "Texas"})
+    missing = client.post("/match/unknown/rescore", data={"location": "Texas"})
+
+    assert response.json()["match_id"] == match_id
+    assert response.json()["results"][0]["score"] > state.results[0]["score"]
+    assert missing.status_code == 404
+
+
+def test_job_detail_and_field_projection(monkeypatch):
+    posting = {
+        "job_title": "Data Analyst",
+        "employer_name": "Acme",
+        "job_city": "Austin",
+        "job_description": "SQL dashboards. " * 100,
+        "job_apply_link": "https://example.com/a",
+    }
+    monkeypatch.setattr(job_store_module, "_store", JobStore())
+    set_job_source(StaticJobSource([posting]))
+    client = TestClient(app_module.app)
+    try:
+        card = client.get("/jobs/random").json()["results"][0]
+        projected = client.get("/jobs/random", params={"fields": "title,description"}).json()
+        detail = client.get(f"/jobs/{card['id']}", headers={"Accept-Encoding": "gzip"})
+        invalid = client.get("/jobs/random", params={"fields": "salary"})
+    finally:
+        set_job_source(None)
+
+    assert "description" not in card and card["snippet"]
+    assert projected["results"][0] == {
+        "title": "Data Analyst",
+        "description": posting["job_description"],
+    }
+    assert detail.json()["description"] == posting["job_description"]
+    assert detail.headers["content-encoding"] == "gzip"
+    assert invalid.status_code == 400
+    assert client.get("/jobs/unknown").status_code == 404
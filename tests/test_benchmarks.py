@@ -0,0 +1,27 @@
+"""Smoke tests for the benchmark harness."""
+
+from benchmarks.compare import compare
+from benchmarks.corpus import make_jobs, make_resume
+from benchmarks.run import measure
+
+
+def test_corpus_is_deterministic():
+    assert make_resume("short", "headed", seed=3) == make_resume("short", "headed", seed=3)
+    jobs = make_jobs(5, seed=1)
+    assert len(jobs) == 5
+    assert jobs == make_jobs(5, seed=1)
+    assert {"title", "company", "location", "description", "apply_link"} <= set(jobs[0])
+
+
+def test_measure_and_compare_flag_regressions():
+    stats = measure(lambda: sum(range(1000)), repeat=3, items=1000)
+    assert stats["repeat"] == 3
+    assert stats["median_s"] > 0
+    assert stats["peak_memory_bytes"] >= 0
+
+    row = {"benchmark": "tfidf", "params": {"n_jobs": 10}, "peak_memory_bytes": 100}
+    baseline = {"results": [{**row, "median_s": 1.0}]}
+    candidate = {"results": [{**row, "median_s": 1.5}]}
+    rows = compare(baseline, candidate, threshold=1.10)
+    assert rows[0]["regression"] is True
+    assert compare(baseline, baseline)[0]["regression"] is False
@@ -0,0 +1,73 @@
+"""Tests for the BM25 scorer and its ingestion-time inverted index."""
+
+import pytest
+
+from backend import job_fetcher, job_index, job_store as job_store_module
+from backend.job_sources import JobSource, set_job_source
+from backend.job_store import JobStore
+from backend.nlp_model.bm25 import BM25Index, compute_bm25_scores
+from backend.nlp_model_stub import score_jobs
+
+QUERY = {"python": 1.0, "sql": 1.0}
+
+
+def test_length_normalization_and_saturation():
+    index = BM25Index()
+    index.add("short", "python sql reporting")
+    index.add("long", "python sql reporting " + "benefits culture team " * 100)
+    index.add("spam", "python " * 50)
+    index.add("other", "nurse patient care")
+
+    short, long, spam, other = index.scores(QUERY, ["short", "long", "spam", "other"])
+
+    assert short > long > 0
+    assert short > spam  # fifty mentions of one term do not beat both terms
+    assert other == 0.0
+    assert all(0.0 <= score <= 1.0 for score in (short, long, spam))
+    assert index.scores(QUERY, ["short", "unknown", "short"]) == [short, 0.0, short]
+
+
+def test_compaction_matches_a_fresh_index_of_the_survivors():
+    texts = {f"job{i}": f"python sql {'data ' * i}" for i in range(6)}
+    bounded = BM25Index(max_docs=4)
+    bounded.add_many(texts.items())
+
+    survivors = [key for key in texts if key in bounded]
+    fresh = BM25Index()
+    fresh.add_many((key, texts[key]) for key in survivors)
+
+    assert survivors == ["job3", "job4", "job5"]
+    assert bounded.scores(QUERY, survivors) == pytest.approx(fresh.scores(QUERY, survivors))
+
+
+def test_ingested_jobs_are_indexed_and_scored(monkeypatch):
+    class OnePageSource(JobSource):
+        def search(self, params, timeout=None):
+            return {"data": [
+                {"job_title": "Data Analyst", "employer_name": "Acme",
+                 "job_description": "SQL and Python reporting"},
+                {"job_title": "Cashier", "employer_name": "Shop",
+                 "job_description": "Retail register"},
+            ]}
+
+    monkeypatch.setattr(job_store_module, "_store", JobStore())
+    monkeypatch.setattr(job_index, "SEMANTIC_SCORER", "bm25")
+    monkeypatch.setattr(job_index, "_bm25", None)
+    set_job_source(OnePageSource())
+    try:
+        jobs = job_fetcher.fetch_jobs_from_api("Analyst", "")
+    finally:
+        set_job_source(None)
+
+    index = job_index.get_bm25_index()
+    assert len(index) == 2 and all(job["id"] in index for job in jobs)
+
+    state = score_jobs("SKILLS\nSQL, Python", jobs, "Analyst", "", "")
+    assert state.tfidf_scores[0] > 0 and state.tfidf_scores[1] == 0.0
+    assert len(index) == 2  # scoring reused the ingested postings
+
+
+def test_compute_bm25_scores_without_a_shared_index():
+    jobs = [{"description": "python sql"}, {"description": "cooking"}]
+    scores = compute_bm25_scores("python sql", jobs)
+    assert scores[0] > 0 and scores[1] == 0.0
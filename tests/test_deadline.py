@@ -0,0 +1,145 @@
+"""Tests for the per-request deadline and its degradation modes."""
+
+import io
+import sys
+import time
+import types
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import app as app_module, job_fetcher, job_store as job_store_module
+from backend.admission import AdmissionController
+from backend.deadline import Deadline
+from backend.job_sources import JobSource, set_job_source
+from backend.job_store import JobStore
+from backend.nlp_model_stub import score_jobs
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowPagedSource(JobSource):
+    """Each page takes `page_seconds` of fake time."""
+
+    def __init__(self, clock, page_seconds):
+        self.clock = clock
+        self.page_seconds = page_seconds
+
+    def search(self, params, timeout=None):
+        self.clock.now += self.page_seconds
+        page = params["page"]
+        return {"data": [{"job_title": f"Analyst {page}", "employer_name": f"Co {page}",
+                          "job_description": f"Page {page} posting " * (page + 3)}]}
+
+
+def test_fetch_stops_paging_and_is_not_cached(monkeypatch):
+    monkeypatch.setattr(job_store_module, "_store", JobStore())
+    monkeypatch.setattr(job_fetcher, "DEADLINE_SCORING_RESERVE_SECONDS", 1.0)
+    job_fetcher.search_cache.clear()
+    clock = FakeClock()
+    set_job_source(SlowPagedSource(clock, page_seconds=2.0))
+    deadline = Deadline(4.5, clock=clock)
+    try:
+        jobs = job_fetcher.fetch_jobs_cached("Analyst", "Ohio", deadline)
+    finally:
+        set_job_source(None)
+
+    # After page 1 only 2.5s are left: less than another 2s page plus the 1s reserve
+    assert [job["title"] for job in jobs] == ["Analyst 1"]
+    assert deadline.degraded == {"fetch": "partial_pages"}
+    assert len(job_fetcher.search_cache) == 0
+
+
+def test_score_jobs_skips_tfidf_and_telemetry_when_out_of_time(monkeypatch):
+    logged = []
+    monkeypatch.setattr("backend.nlp_model_stub.log_recommendation_run",
+                        lambda *args, **kwargs: logged.append(args))
+    jobs = [
+        {"title": "Data Analyst", "description": "SQL and Tableau dashboards"},
+        {"title": "Cashier", "description": "Retail register"},
+    ]
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+    clock.now = 1.0
+
+    state = score_jobs("SKILLS\nSQL, Tableau", jobs, "Analyst", "", "", deadline=deadline)
+
+    assert state.tfidf_scores == [0.0, 0.0]
+    assert state.results[0]["title"] == "Data Analyst"
+    assert deadline.degraded == {"tfidf": "skipped", "telemetry": "skipped"}
+    assert logged == []
+
+
+def test_match_reports_parse_timeout(monkeypatch):
+    monkeypatch.setattr(app_module, "Deadline", lambda: Deadline(0.05))
+    monkeypatch.setattr(app_module.ResumeParser, "load_resume",
+                        lambda self, *args, **kwargs: time.sleep(0.5) or "")
+    client = TestClient(app_module.app)
+
+    response = client.post("/match", files={"file": ("resume.txt", b"SKILLS\nSQL")},
+                           data={"title": "Analyst"})
+
+    assert response.status_code == 504
+    assert response.json()["degraded"] == {"parse": "timeout"}
+
+
+def test_abandoned_parse_holds_the_admission_slot(monkeypatch):
+    controller = AdmissionController("match", max_concurrent=1, max_queue=0)
+    monkeypatch.setattr(app_module, "match_admission", controller)
+    monkeypatch.setattr(app_module, "Deadline", lambda: Deadline(0.05))
+    checks = []
+
+    def slow_parse(self, source, file_name=None, deadline=None):
+        # A paged parser checking the deadline between pages
+        for _ in range(20):
+            checks.append(controller.active)
+            if deadline.expired():
+                raise TimeoutError("deadline")
+            time.sleep(0.02)
+        return ""
+
+    monkeypatch.setattr(app_module.ResumeParser, "load_resume", slow_parse)
+    with TestClient(app_module.app) as client:
+        response = client.post("/match", files={"file": ("resume.txt", b"SKILLS\nSQL")},
+                               data={"title": "Analyst"})
+        assert response.status_code == 504
+        deadline = time.monotonic() + 2
+        while controller.active and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert controller.active == 0
+    assert 1 < len(checks) < 20 and set(checks) == {1}
+
+
+def test_pdf_loader_checks_the_deadline_between_pages(monkeypatch):
+    from backend.nlp_model import loaders
+
+    clock = FakeClock()
+    deadline = Deadline(1.0, clock=clock)
+
+    class Page:
+        def extract_text(self):
+            clock.now += 0.6
+            return "page"
+
+    class Pdf:
+        pages = [Page(), Page(), Page()]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(loaders, "PDF_AVAILABLE", True)
+    monkeypatch.setitem(sys.modules, "pdfplumber", types.SimpleNamespace(open=lambda s: Pdf()))
+
+    with pytest.raises(TimeoutError):
+        loaders.load_document(io.BytesIO(b"%PDF-1.4 fake"), "resume.pdf", deadline)
+    assert clock.now == pytest.approx(1.2)  # the third page was never read
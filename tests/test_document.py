@@ -0,0 +1,82 @@
+"""Tests for the shared Document preprocessing stage."""
+
+import re
+
+from backend.nlp_model.document import Document, PhraseMatcher, count_phrases
+from backend.nlp_model.extract_job_skills_from_list import extract_job_skills_from_description
+from backend.nlp_model.skills_dict import get_all_skills
+from backend.nlp_model.tfidf_matcher import compute_tfidf_scores
+
+
+def test_tokens_keep_language_suffixes_and_match_phrases():
+    doc = Document("Built CI/CD in C++ and C#; machine learning with Python.\nMachine Learning!")
+
+    assert "c++" in doc.tokens and "c#" in doc.tokens
+    assert doc.count("C") == 0
+    assert doc.count("machine learning") == 2
+    assert doc.contains("CI/CD")
+    start, end = doc.find("c++")[0]
+    assert doc.text[start:end] == "C++"
+    assert count_phrases(doc, ["Python", "Go", "C#"]) == {"Python": 1, "C#": 1}
+
+
+def test_punctuation_between_tokens_breaks_a_phrase():
+    doc = Document("We own product. Strategy follows; tracked weights, biases and "
+                   "Weights & Biases runs. CI / CD, A/B testing, net income.")
+    matcher = PhraseMatcher(["Product Strategy", "Weights & Biases", "CI/CD",
+                             "A/B Testing", ".NET"])
+
+    assert matcher.count(doc) == {"Weights & Biases": 1, "CI/CD": 1, "A/B Testing": 1}
+    assert Document("Shipped .NET services").count(".NET") == 1
+
+
+def _regex_skill_counts(text, skills):
+    """The per-skill regex path the Document matcher replaced."""
+    counts = {}
+    for skill in skills:
+        matches = re.findall(r"\b" + re.escape(skill) + r"\b", text, flags=re.IGNORECASE)
+        if matches:
+            counts[skill] = len(matches)
+    return counts
+
+
+def test_skill_counts_match_the_regex_path_except_language_suffixes():
+    text = (
+        "Senior engineer: Python, SQL and Go; machine learning with scikit-learn and "
+        "PyTorch. Built CI/CD on AWS, Docker and Kubernetes; Node.js and React front ends. "
+        "Own product. Strategy reviews with Tableau. Tracked weights, biases in Excel. "
+        "Also C++ and C# for game tooling, C for firmware."
+    )
+    skills = get_all_skills()
+
+    new = count_phrases(Document(text), PhraseMatcher(skills))
+    old = _regex_skill_counts(text, skills)
+
+    # Intended change: "C" no longer matches inside "C++"/"C#", and those two
+    # are found at all (`\bC\+\+\b` needs a word character after the "+")
+    assert old.get("C") == 3 and new.get("C") == 1
+    assert "C++" not in old and new["C++"] == 1
+    assert "C#" not in old and new["C#"] == 1
+    languages = {"C", "C++", "C#"}
+    assert {k: v for k, v in new.items() if k not in languages} == {
+        k: v for k, v in old.items() if k not in languages
+    }
+
+
+def test_job_skills_accept_text_or_document():
+    description = "Python and SQL for machine learning pipelines. Python daily."
+    from_text = extract_job_skills_from_description(description, ["Python", "SQL", "R"])
+    from_doc = extract_job_skills_from_description(Document(description), ["Python", "SQL", "R"])
+
+    assert from_text == from_doc
+    assert from_doc["skill_frequency"] == {"Python": 2, "SQL": 1}
+
+
+def test_tfidf_reuses_documents():
+    jobs = [{"description": "python data pipelines"}, {"description": "retail cashier"}]
+    documents = [Document(job["description"]) for job in jobs]
+
+    scores = compute_tfidf_scores(Document("python pipelines"), jobs, documents=documents)
+
+    assert scores == compute_tfidf_scores("python pipelines", jobs)
+    assert scores[0] > scores[1]
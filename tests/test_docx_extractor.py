@@ -0,0 +1,66 @@
+"""Tests for the streaming DOCX extractor."""
+
+import io
+
+from docx import Document
+
+from backend.nlp_model.docx_extractor import extract_docx_text
+
+
+def _legacy_docx_text(data: bytes) -> str:
+    """The python-docx based extraction ResumeParser used previously."""
+    doc = Document(io.BytesIO(data))
+    text = ""
+    for paragraph in doc.paragraphs:
+        text += paragraph.text + "\n"
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                text += cell.text + " "
+            text += "\n"
+    return text.strip()
+
+
+def _save(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _fixture_resume() -> bytes:
+    document = Document()
+    document.add_heading("Jane Doe", level=1)
+    document.add_paragraph("SKILLS")
+    paragraph = document.add_paragraph("Python,\tSQL")
+    run = paragraph.add_run(" and AWS")
+    run.add_break()
+    paragraph.add_run("Docker")
+    document.add_paragraph("")
+    document.add_paragraph("EXPERIENCE")
+    table = document.add_table(rows=2, cols=3)
+    for r, row in enumerate(table.rows):
+        for c, cell in enumerate(row.cells):
+            cell.text = f"r{r}c{c}"
+    table.cell(1, 2).add_paragraph("second line")
+    nested = table.cell(0, 0).add_table(rows=1, cols=1)
+    nested.cell(0, 0).text = "nested"
+    document.add_paragraph("EDUCATION")
+    return _save(document)
+
+
+def test_matches_python_docx_output_on_fixture():
+    data = _fixture_resume()
+    assert extract_docx_text(data) == _legacy_docx_text(data)
+    assert extract_docx_text(io.BytesIO(data)) == _legacy_docx_text(data)
+
+
+def test_merged_cells_are_emitted_once():
+    document = Document()
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).merge(table.cell(0, 1)).text = "Wide"
+    table.cell(1, 0).text = "Tall"
+    table.cell(1, 1).text = "Right"
+    data = _save(document)
+
+    assert _legacy_docx_text(data).count("Wide") == 2
+    assert extract_docx_text(data) == "Wide \nTall Right"
@@ -0,0 +1,50 @@
+"""Tests for structured experience extraction from postings and resumes."""
+
+from datetime import date
+
+from backend.nlp_model.experience_extractor import (
+    ExperienceRequirement,
+    estimate_resume_years,
+    extract_experience_requirement,
+)
+from backend.nlp_model_stub import _experience_score
+
+
+def test_parses_ranges_word_numerals_and_qualifiers():
+    assert extract_experience_requirement(
+        "3-5 years of experience with Python."
+    ) == ExperienceRequirement(3, 5, None)
+    assert extract_experience_requirement(
+        "Minimum of five (5) years experience required. 7+ years preferred."
+    ) == ExperienceRequirement(5, None, 7)
+    assert extract_experience_requirement(
+        "2 years of SQL experience is a plus."
+    ) == ExperienceRequirement(None, None, 2)
+
+
+def test_ignores_numbers_that_are_not_requirements():
+    assert extract_experience_requirement("401k match after 2 years.") is None
+    assert extract_experience_requirement("Join our 10 years old startup.") is None
+    assert extract_experience_requirement(
+        "401k in 2 years. 4+ years of professional experience."
+    ) == ExperienceRequirement(4, None, None)
+
+
+def test_resume_years_merge_overlapping_roles():
+    section = (
+        "Data Analyst, Acme    Jan 2019 - Present\n"
+        "Freelance Consultant  2019 - 2020\n"
+        "Analyst Intern        03/2016 to 06/2017\n"
+    )
+    # Jan 2019-Jan 2024 (61 months) + Mar 2016-Jun 2017 (16 months)
+    assert estimate_resume_years(section, today=date(2024, 1, 15)) == 6.4
+    assert estimate_resume_years("Built dashboards in Tableau.") == 0.0
+
+
+def test_experience_score_uses_minimum_and_preference():
+    requirement = ExperienceRequirement(3, 5, 5)
+    assert _experience_score(4, False, requirement) == 0.9
+    assert _experience_score(2, False, requirement) == 0.5
+    assert _experience_score(0, False, requirement) == 0.0
+    assert _experience_score(0, False, ExperienceRequirement(None, None, 4)) == 0.5
+    assert _experience_score(0, False, None) == 1.0
@@ -0,0 +1,58 @@
+"""Tests for the memory-mapped feature store and job index."""
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from backend.feature_store import FeatureStore
+from backend.job_index import JobIndex, build_job_index
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_publish_memory_maps_and_swaps_generations(tmp_path):
+    store = FeatureStore(str(tmp_path), keep=2)
+    matrix = sparse.csr_matrix(np.array([[0, 1.5], [2.0, 0]], dtype=np.float32))
+
+    first = store.publish({"m": matrix}, {"idf": [1, 2]}, {"version": 1})
+    generation = store.current()
+    assert generation.name == first
+    assert isinstance(generation.dense["idf"], np.memmap)
+    assert _is_memory_mapped(generation.sparse["m"].data)  # zero-copy view
+    assert (generation.sparse["m"] != matrix).nnz == 0
+
+    store.publish({"m": matrix * 2}, meta={"version": 2})
+    third = store.publish({"m": matrix * 3}, meta={"version": 3})
+    assert store.current().meta == {"version": 3}
+    assert store.current().name == third
+    assert sorted(p.name for p in tmp_path.glob("gen-*")) == ["gen-000002", "gen-000003"]
+
+
+def test_job_index_matches_sklearn_cosine(tmp_path):
+    jobs = [
+        {"id": "a", "description": "Python data pipelines with Spark and SQL"},
+        {"id": "b", "description": "Retail cashier handling customer payments"},
+        {"id": "c", "description": "Machine learning engineer, Python and PyTorch"},
+    ]
+    store = FeatureStore(str(tmp_path))
+    build_job_index(jobs, store)
+    index = JobIndex(store.current())
+    resume = "Python engineer building Spark pipelines and machine learning models"
+
+    scores = index.tfidf_scores(resume, ["c", "a", "b"])
+
+    vectorizer = TfidfVectorizer().fit([job["description"] for job in jobs])
+    expected = cosine_similarity(
+        vectorizer.transform([resume]),
+        vectorizer.transform([jobs[2]["description"], jobs[0]["description"],
+                              jobs[1]["description"]]),
+    )[0]
+    np.testing.assert_allclose(scores, expected, rtol=1e-5)
+    assert index.tfidf_scores(resume, ["a", "unknown"]) is None
@@ -0,0 +1,81 @@
+"""Tests for the popular-query harvester."""
+
+from backend import job_store as job_store_module
+from backend.harvester import Harvester, QueryStats, QuotaBudget
+from backend.job_fetcher import search_key
+from backend.job_store import JobStore, job_id
+from backend.swr_cache import SWRCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_jobs(title):
+    job = {"title": title, "company": "Acme", "location": "Ohio",
+           "description": "Build SQL reports and Python pipelines", "apply_link": None}
+    job["id"] = job_id(job)
+    return [job]
+
+
+def test_query_stats_rank_and_decay():
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("Data Analyst", "Ohio")
+    stats.record(" data  analyst", "ohio ")
+    stats.record("Nurse", "")
+
+    top = stats.top(5)
+    assert [(key, count) for key, _, _, count in top] == [
+        (("data analyst", "ohio"), 4.0), (("nurse", ""), 1.0)
+    ]
+    stats.decay(0.05)
+    assert len(stats) == 1
+
+
+def test_quota_budget_refills_over_the_hour():
+    clock = FakeClock()
+    budget = QuotaBudget(per_hour=6, clock=clock)
+    assert budget.take(6)
+    assert not budget.take(3)
+    clock.now = 1800
+    assert budget.take(3)
+
+
+def test_run_once_prefetches_popular_queries_within_quota(monkeypatch):
+    store = JobStore()
+    monkeypatch.setattr(job_store_module, "_store", store)
+    clock = FakeClock()
+    cache = SWRCache("test", ttl=600, grace=0, clock=clock)
+    fetched = []
+
+    def fetch(title, location):
+        fetched.append(title)
+        jobs = make_jobs(title)
+        store.add_many(jobs)
+        return jobs
+
+    stats = QueryStats()
+    for title, times in (("Data Analyst", 5), ("Data Engineer", 4), ("Nurse", 1)):
+        for _ in range(times):
+            stats.record(title, "Ohio")
+    # Enough quota for one query (three pages)
+    harvester = Harvester(stats, interval=300, top_n=5, cache=cache, fetch=fetch,
+                          budget=QuotaBudget(per_hour=3, clock=clock))
+
+    summary = harvester.run_once()
+
+    assert summary == {"ok": 1, "quota": 1}  # "Nurse" is below the minimum count
+    assert fetched == ["Data Analyst"]
+    jobs = cache.get(search_key("Data Analyst", "Ohio"), lambda: [])
+    assert store.get(jobs[0]["id"])["skills"]["all_skills"] == ["Python", "SQL"]
+
+    # Still fresh at the next cycle: no quota spent on it
+    clock.now = 200
+    harvester.budget = QuotaBudget(per_hour=30, clock=clock)
+    assert harvester.run_once() == {"fresh": 1, "ok": 1}
+    assert fetched == ["Data Analyst", "Data Engineer"]
@@ -0,0 +1,74 @@
+"""Tests for the pluggable job sources and replay backend."""
+
+import json
+
+import pytest
+
+from backend import job_store as job_store_module
+from backend.job_fetcher import fetch_jobs_from_api
+from backend.job_sources import (
+    JobSource,
+    JobSourceError,
+    ReplayJobSource,
+    recording_key,
+    set_job_source,
+)
+from backend.job_store import JobStore
+
+
+def _write_recording(directory, params, titles):
+    data = [
+        {
+            "job_title": title,
+            "employer_name": f"Employer {i}",
+            "job_city": "Richmond",
+            "job_description": f"{title} role using Python for team {i} in the Richmond office.",
+            "job_apply_link": f"https://example.com/{i}",
+        }
+        for i, title in enumerate(titles)
+    ]
+    path = directory / f"{recording_key(params)}.json"
+    path.write_text(json.dumps({"params": params, "response": {"data": data}}))
+
+
+def test_replay_serves_exact_match_then_round_robin(tmp_path):
+    exact = {"query": "Data Scientist", "page": 1}
+    _write_recording(tmp_path, exact, ["Data Scientist"])
+    _write_recording(tmp_path, {"query": "Other", "page": 1}, ["Other Role"])
+    source = ReplayJobSource(str(tmp_path))
+
+    assert source.search(exact)["data"][0]["job_title"] == "Data Scientist"
+    assert source.search({"query": "unknown"})["data"]
+
+    strict = ReplayJobSource(str(tmp_path), strict=True)
+    assert strict.search({"query": "unknown"}) == {"data": []}
+
+
+def test_replay_error_injection(tmp_path):
+    _write_recording(tmp_path, {"query": "x"}, ["X"])
+    source = ReplayJobSource(str(tmp_path), error_rate=1.0)
+    with pytest.raises(JobSourceError):
+        source.search({"query": "x"})
+
+
+def test_fetch_jobs_uses_configured_source(tmp_path, monkeypatch):
+    store = JobStore()
+    monkeypatch.setattr(job_store_module, "_store", store)
+    _write_recording(tmp_path, {"query": "seed"}, ["Data Scientist", "Data Scientist", "ML"])
+    set_job_source(ReplayJobSource(str(tmp_path), strict=False))
+    try:
+        jobs = fetch_jobs_from_api("Data Scientist", "Virginia")
+    finally:
+        set_job_source(None)
+
+    assert [job["title"] for job in jobs][:2] == ["Data Scientist", "Data Scientist"]
+    assert all(job["location"] == "Richmond" for job in jobs)
+    assert all(store.get(job["id"]) is job for job in jobs)  # stored once at ingestion
+
+
+def test_job_source_requires_search():
+    class Nameless(JobSource):
+        name = "nameless"
+
+    with pytest.raises(TypeError):
+        Nameless()
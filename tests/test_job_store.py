@@ -0,0 +1,42 @@
+"""Tests for stable job IDs and the two-tier job store."""
+
+from backend.job_store import JobStore, job_id
+
+
+def test_job_ids_are_content_derived():
+    job = {"title": "Data  Scientist", "company": "Acme", "location": "NY", "apply_link": "x"}
+    same = {"title": "data scientist", "company": "ACME", "location": "NY", "apply_link": "x"}
+    other = dict(job, location="Boston")
+
+    assert job_id(job) == job_id(same)
+    assert job_id(job) != job_id(other)
+
+
+def test_evicted_jobs_are_reloaded_from_disk(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    store = JobStore(max_entries=1, path=path)
+    first = store.add({"title": "A", "description": "first"})
+    store.add({"title": "B"})
+    store.attach(first, skills={"all_skills": ["sql"]})
+
+    assert len(store) == 1
+    assert store.get(first)["description"] == "first"
+    store.close()
+
+    reopened = JobStore(path=path)
+    assert reopened.get(first)["skills"] == {"all_skills": ["sql"]}
+    assert JobStore(max_entries=1).get(first) is None  # memory-only store
+
+
+def test_attach_many_writes_one_transaction(tmp_path):
+    store = JobStore(path=str(tmp_path / "jobs.sqlite3"))
+    ids = [store.add({"title": f"Job {n}"}) for n in range(5)]
+    statements = []
+    store._db.set_trace_callback(statements.append)
+
+    store.attach_many([(identifier, {"skills": ["sql"]}) for identifier in ids]
+                      + [("unknown", {"skills": ["go"]})])
+
+    assert statements.count("BEGIN") == 1 and statements.count("COMMIT") == 1
+    store._jobs.clear()
+    assert all(store.get(identifier)["skills"] == ["sql"] for identifier in ids)
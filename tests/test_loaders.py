@@ -0,0 +1,149 @@
+"""Tests for format detection and the non-DOCX resume extractors."""
+
+import io
+import struct
+import zipfile
+
+import pytest
+
+from backend.nlp_model.loaders import detect_loader, load_document
+from backend.nlp_model.resume_parser import ResumeParser
+
+ENDOFCHAIN = 0xFFFFFFFE
+FREESECT = 0xFFFFFFFF
+
+
+def _doc_bytes(text):
+    """Build a minimal Word 97 file: one compressed piece in a 512-byte-sector CFB."""
+    encoded = text.encode("cp1252")
+    text_offset = 1024
+
+    word_doc = bytearray(4096)
+    struct.pack_into("<HHHHHH", word_doc, 0, 0xA5EC, 0x00C1, 0, 0, 0, 0x0200)  # 1Table
+    struct.pack_into("<H", word_doc, 32, 14)  # csw
+    struct.pack_into("<H", word_doc, 62, 22)  # cslw
+    struct.pack_into("<i", word_doc, 64 + 3 * 4, len(encoded))  # ccpText
+    struct.pack_into("<H", word_doc, 152, 93)  # cbRgFcLcb
+    word_doc[text_offset:text_offset + len(encoded)] = encoded
+
+    table = bytearray(4096)
+    plc = struct.pack("<ii", 0, len(encoded)) + struct.pack(
+        "<HIH", 0, (text_offset * 2) | 0x40000000, 0
+    )
+    clx = b"\x02" + struct.pack("<I", len(plc)) + plc
+    table[:len(clx)] = clx
+    struct.pack_into("<II", word_doc, 154 + 33 * 8, 0, len(clx))  # fcClx, lcbClx
+
+    header = bytearray(512)
+    header[:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into("<HHHHH", header, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into("<IIIIIIII", header, 0x2C, 1, 1, 0, 4096, ENDOFCHAIN, 0, ENDOFCHAIN, 0)
+    struct.pack_into("<109I", header, 0x4C, 0, *([FREESECT] * 108))
+
+    # Sector 0: FAT, 1: directory, 2-9: WordDocument, 10-17: 1Table
+    fat = [0xFFFFFFFD, ENDOFCHAIN]
+    fat += list(range(3, 10)) + [ENDOFCHAIN] + list(range(11, 18)) + [ENDOFCHAIN]
+    fat += [FREESECT] * (128 - len(fat))
+
+    def entry(name, obj_type, start, size):
+        raw = bytearray(128)
+        encoded_name = (name + "\x00").encode("utf-16-le")
+        raw[:len(encoded_name)] = encoded_name
+        struct.pack_into("<HB", raw, 64, len(encoded_name), obj_type)
+        struct.pack_into("<II", raw, 116, start, size)
+        return bytes(raw)
+
+    directory = (
+        entry("Root Entry", 5, ENDOFCHAIN, 0)
+        + entry("WordDocument", 2, 2, 4096)
+        + entry("1Table", 2, 10, 4096)
+        + bytes(128)
+    )
+    return bytes(header) + struct.pack("<128I", *fat) + directory + word_doc + table
+
+
+def test_extracts_legacy_word_document():
+    data = _doc_bytes(
+        "Jane Doe\rSKILLS\rPython, SQL\x07Docker\r"
+        "See \x13 HYPERLINK \"https://example.com\" \x14portfolio\x15\r"
+    )
+    text = ResumeParser().load_resume(data, file_name="resume.doc")
+    assert text == "Jane Doe\nSKILLS\nPython, SQL Docker\nSee portfolio"
+
+
+def test_extracts_rtf_html_and_plain_text():
+    parser = ResumeParser()
+    rtf = (
+        rb"{\rtf1\ansi\ansicpg1252{\fonttbl{\f0 Arial;}}{\*\generator Word;}"
+        rb"\f0 SKILLS\par Python, Caf\'e9 \u8211? SQL\par}"
+    )
+    html = (
+        b"<!DOCTYPE html><html><head><title>CV</title><style>p{}</style></head>"
+        b"<body><h1>SKILLS</h1><ul><li>Python</li><li>SQL &amp; AWS</li></ul>"
+        b"<script>var x = 1;</script></body></html>"
+    )
+    assert parser.load_resume(rtf) == "SKILLS\nPython, Café – SQL"
+    assert parser.load_resume(html) == "SKILLS\nPython\nSQL & AWS"
+    assert parser.load_resume("SKILLS\r\nPython, Café".encode("cp1252")) == (
+        "SKILLS\nPython, Café"
+    )
+
+
+def test_rtf_unicode_escapes_out_of_range_are_skipped():
+    rtf = (
+        rb"{\rtf1\ansi\uc1 A\u9999999999?B\u-10179?\u-8704?C"
+        rb"\u56832?D\u8211?\uc-3 E}"
+    )
+    # Overflowing and unpaired units are dropped; a surrogate pair is joined
+    assert load_document(io.BytesIO(rtf)) == "AB\U0001F600CD\u2013E"
+
+
+def test_corrupt_word_document_raises_value_error():
+    data = bytearray(_doc_bytes("Jane Doe\r"))
+    # The 1Table stream starts at sector 10; inflate the piece table's length
+    struct.pack_into("<I", data, 512 + 10 * 512 + 1, 0x00FFFFFF)
+
+    with pytest.raises(ValueError, match="Corrupt Word document"):
+        load_document(io.BytesIO(bytes(data)), "resume.doc")
+
+
+def test_corrupt_docx_and_pdf_raise_value_error():
+    malformed = io.BytesIO()
+    with zipfile.ZipFile(malformed, "w") as archive:
+        archive.writestr("[Content_Types].xml", "<Types/>")
+        # "w:" is never declared: an unbound prefix
+        archive.writestr("word/document.xml", "<w:document><w:body/></w:document>")
+    malformed.seek(0)
+    with pytest.raises(ValueError, match="Corrupt or unsupported DOCX"):
+        load_document(malformed, "resume.docx")
+
+    pytest.importorskip("pdfplumber")
+    with pytest.raises(ValueError, match="Corrupt or unsupported PDF"):
+        load_document(io.BytesIO(b"%PDF-1.4\n1 0 obj <<\n"), "resume.pdf")
+
+
+def test_dispatches_on_content_not_extension():
+    assert detect_loader(b"%PDF-1.7\n").name == "pdf"
+    assert detect_loader(b"PK\x03\x04rest").name == "docx"
+    assert detect_loader(b"{\\rtf1\\ansi").name == "rtf"
+    assert detect_loader(b"\xef\xbb\xbf<html><body>").name == "html"
+    assert detect_loader(b"plain resume text").name == "txt"
+
+    # A plain-text resume uploaded with a .docx name is still read as text
+    text = ResumeParser().load_resume(b"SKILLS\nPython", file_name="resume.docx")
+    assert text == "SKILLS\nPython"
+
+
+def test_rejects_unknown_corrupt_and_oversized_files():
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        load_document(io.BytesIO(b"\x00\x01\x02\x03binary"))
+
+    not_word = io.BytesIO()
+    with zipfile.ZipFile(not_word, "w") as archive:
+        archive.writestr("data.csv", "a,b\n")
+    not_word.seek(0)
+    with pytest.raises(ValueError, match="DOCX"):
+        load_document(not_word)
+
+    with pytest.raises(ValueError, match="too large"):
+        load_document(io.BytesIO(b"a" * (3 * 1024 * 1024)))
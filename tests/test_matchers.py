@@ -0,0 +1,41 @@
+"""Tests for the prebuilt skill/role matchers and startup readiness."""
+
+from fastapi.testclient import TestClient
+
+from backend import app as app_module, warmup
+from backend.nlp_model import matchers as matchers_module
+from backend.nlp_model.document import Document, PhraseMatcher, count_phrases
+from backend.nlp_model.skills_dict import get_all_skills
+
+
+def test_phrase_matcher_agrees_with_count_phrases():
+    doc = Document("Python, SQL and C++ for machine learning; Python and CI/CD on AWS. C# too")
+    skills = get_all_skills()
+
+    assert PhraseMatcher(skills).count(doc) == count_phrases(doc, skills)
+    assert count_phrases(doc, PhraseMatcher(["SQL", "Python", "Go"])) == {"SQL": 1, "Python": 2}
+
+
+def test_artifact_round_trip_and_stale_fallback(tmp_path, monkeypatch):
+    path = str(tmp_path / "matchers.pkl")
+    matchers_module.build_artifact(path)
+
+    loaded = matchers_module.load_matchers(path)
+    assert loaded.source == path
+    assert loaded.roles.scores("built a data pipeline with spark") == {"Data Engineer": 2}
+
+    monkeypatch.setattr(matchers_module, "get_all_skills", lambda: ["Python"])
+    assert matchers_module.load_matchers(path).source == "compiled"
+
+
+def test_ready_reports_warm_up(monkeypatch):
+    monkeypatch.setattr(warmup, "_state",
+                        {"ready": False, "started": False, "steps": {}, "errors": {}})
+    client = TestClient(app_module.app)
+
+    assert client.get("/ready").status_code == 503
+    warmup.warm_up()
+    response = client.get("/ready")
+
+    assert response.status_code == 200
+    assert set(response.json()["steps"]) == {name for name, _ in warmup.STEPS}
@@ -0,0 +1,36 @@
+"""Tests for the metrics registry and /metrics exposition."""
+
+from fastapi.testclient import TestClient
+
+from backend.app import app
+from backend.metrics import STAGE_SECONDS, record_cache_lookup, render_prometheus, span, timed
+
+
+def test_span_and_timed_record_stage_histograms():
+    before = STAGE_SECONDS.count(stage="unit_test_stage")
+
+    with span("unit_test_stage"):
+        pass
+
+    @timed("unit_test_stage")
+    def work():
+        return 42
+
+    assert work() == 42
+    assert STAGE_SECONDS.count(stage="unit_test_stage") == before + 2
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    record_cache_lookup("unit_test_cache", hit=True)
+    record_cache_lookup("unit_test_cache", hit=False)
+    client = TestClient(app)
+
+    client.get("/jobs/random/nonexistent")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE resume_recommender_stage_duration_seconds histogram" in body
+    assert 'resume_recommender_cache_hit_ratio{cache="unit_test_cache"} 0.5' in body
+    assert "resume_recommender_http_requests_total" in render_prometheus()
@@ -0,0 +1,55 @@
+"""Tests for the background MLflow exporter."""
+
+from backend.mlflow_exporter import MLflowExporter, RunRecord
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(url)
+        return _FakeResponse({"experiment": {"experiment_id": "7"}})
+
+    def post(self, url, json=None, timeout=None):
+        self.calls.append(url)
+        return _FakeResponse({"run": {"info": {"run_id": "abc"}}})
+
+
+def test_submit_drops_runs_when_queue_is_full():
+    exporter = MLflowExporter("http://mlflow.invalid", max_queue=2)
+    exporter._ensure_started = lambda: None  # keep the worker from draining
+
+    accepted = [exporter.submit(RunRecord(params={}, metrics={})) for _ in range(5)]
+
+    assert accepted == [True, True, False, False, False]
+    stats = exporter.stats()
+    assert stats["enqueued"] == 2
+    assert stats["dropped"] == 3
+    assert stats["queued"] == 2
+
+
+def test_export_batches_run_and_caches_experiment():
+    exporter = MLflowExporter("http://mlflow.invalid")
+    exporter._session = _FakeSession()
+
+    exporter.submit(RunRecord(params={"query_title": "x"}, metrics={"jobs_fetched": 3}))
+    exporter.submit(RunRecord(params={"query_title": "y"}, metrics={"jobs_fetched": 4}))
+    exporter.shutdown(timeout=2.0)
+
+    calls = exporter._session.calls
+    assert sum(url.endswith("get-by-name") for url in calls) == 1
+    assert sum(url.endswith("runs/log-batch") for url in calls) == 2
+    assert exporter.stats()["exported"] == 2
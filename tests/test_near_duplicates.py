@@ -0,0 +1,28 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+from backend.near_duplicates import NearDuplicateIndex
+
+POSTING = (
+    "We are looking for a Senior Data Scientist to join our analytics team. You will build "
+    "predictive models in Python and SQL, design experiments, partner with product managers "
+    "to define metrics, and communicate results to executives. Requirements: 5+ years of "
+    "experience with machine learning, statistics, and cloud data warehouses such as "
+    "Snowflake or BigQuery. Experience with Spark and Airflow is a plus. We offer competitive "
+    "pay, remote flexibility, and a generous learning budget."
+)
+
+
+def test_detects_reposted_description_but_not_distinct_jobs():
+    index = NearDuplicateIndex()
+    repost = "Staffing partner listing. " + POSTING.replace("generous", "annual")
+    unrelated = (
+        "Warehouse associate needed for night shifts. Duties include picking, packing and "
+        "loading trucks, operating forklifts safely, and keeping inventory records accurate. "
+        "Must be able to lift 50 pounds and stand for long periods."
+    )
+
+    assert index.check_and_add("original", POSTING) is None
+    assert index.check_and_add("repost", repost) == "original"
+    assert index.check_and_add("unrelated", unrelated) is None
+    assert index.check_and_add("empty", "") is None
+    assert len(index) == 2  # duplicates and empty texts are not indexed
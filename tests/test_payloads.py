@@ -0,0 +1,40 @@
+"""Tests for result field projection and the job detail store."""
+
+import pytest
+
+from backend.payloads import CARD_FIELDS, compact, hydrate, parse_fields, project
+
+
+def test_parse_fields_defaults_to_cards_and_validates_names():
+    assert parse_fields(None) == CARD_FIELDS
+    assert parse_fields("title, score,title") == ("title", "score")
+    assert parse_fields("full") is None
+    with pytest.raises(ValueError, match="Unknown fields: salary"):
+        parse_fields("title,salary")
+
+
+def test_card_projection_replaces_description_with_snippet():
+    result = {
+        "id": "abc",
+        "title": "Data Scientist",
+        "description": "Build models. " * 50,
+        "skills": {"all_skills": ["python"]},
+        "score": 0.8,
+    }
+
+    card = project(result, CARD_FIELDS)
+
+    assert set(card) == {"id", "title", "score", "snippet"}
+    assert card["snippet"].endswith("...") and len(card["snippet"]) <= 203
+    assert project(result, None) is result
+
+
+def test_compacted_results_hydrate_from_the_job_store():
+    jobs = {"abc": {"id": "abc", "title": "Data Scientist", "description": "Long text"}}
+    results = [{**jobs["abc"], "score": 0.9, "summary": "Good", "keywords": ["python"]}]
+
+    entries = compact(results)
+    restored = hydrate(entries + [{"id": "gone", "score": 0.1}], jobs.get)
+
+    assert "description" not in entries[0]
+    assert restored == [{**results[0], "location": None, "evidence_image": None}]
@@ -1,6 +1,25 @@
 """Tests for high-level recommend_jobs scoring."""
 
-from backend.nlp_model_stub import recommend_jobs
+from backend.nlp_model_stub import recommend_jobs, rescore, score_jobs
+
+# The second posting differs in location and experience so rescoring moves it
+RESCORE_RESUME_TEXT = "Experienced Python engineer working with AWS and data pipelines."
+RESCORE_JOB_LIST = [
+    {
+        "title": "Python Engineer",
+        "company": "Acme",
+        "location": "California",
+        "description": "Looking for Python developers with AWS experience.",
+        "apply_link": "https://example.com/python",
+    },
+    {
+        "title": "Support Specialist",
+        "company": "Other",
+        "location": "Austin, TX",
+        "description": "Provide phone support and scheduling. 5+ years required.",
+        "apply_link": "https://example.com/support",
+    },
+]
 
 
 def test_recommend_jobs_prioritizes_strong_skill_match():
@@ -34,3 +53,26 @@ def test_recommend_jobs_prioritizes_strong_skill_match():
     assert results[0]["title"] == "Python Engineer"
     assert results[0]["score"] >= results[1]["score"]
     assert "keywords" in results[0]
+
+
+def test_rescore_matches_a_full_rerun_with_new_preferences():
+    state = score_jobs(RESCORE_RESUME_TEXT, RESCORE_JOB_LIST, "Engineer", "California", "3")
+
+    updated = rescore(state, location="Texas", experience="5+")
+
+    assert updated.results == recommend_jobs(
+        RESCORE_RESUME_TEXT, RESCORE_JOB_LIST, "Engineer", "Texas", "5+"
+    )
+    assert state.location == "California"  # the stored state is left untouched
+
+
+def test_rescore_switches_scoring_profile_without_reextracting():
+    state = score_jobs(RESCORE_RESUME_TEXT, RESCORE_JOB_LIST, "Engineer", "California", "3")
+
+    updated = rescore(state, profile="semantic_heavy")
+
+    assert updated.profile.name == "semantic_heavy"
+    assert updated.results == recommend_jobs(
+        RESCORE_RESUME_TEXT, RESCORE_JOB_LIST, "Engineer", "California", "3",
+        profile="semantic_heavy",
+    )
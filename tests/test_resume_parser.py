@@ -21,3 +21,29 @@ def test_parse_sections_and_extract_skills():
     skills = extract_resume_skills(sections)
     assert "Python" in skills["all_skills"]
     assert skills["total_count"] >= 2
+
+
+def _docx_bytes(lines):
+    import io
+
+    from docx import Document
+
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_load_resume_accepts_in_memory_sources():
+    import io
+
+    parser = ResumeParser()
+    data = _docx_bytes(["SKILLS", "Python, SQL"])
+
+    from_bytes = parser.load_resume(data, file_name="resume.docx")
+    from_view = parser.load_resume(memoryview(data), file_name="resume.docx")
+    from_stream = parser.load_resume(io.BytesIO(data))  # no name: sniffed from magic bytes
+
+    assert from_bytes == from_view == from_stream == "SKILLS\nPython, SQL"
@@ -0,0 +1,94 @@
+"""Tests for the reusable resume profile."""
+
+import json
+
+import pytest
+
+from backend.nlp_model.resume_profile import (
+    ResumeProfile,
+    build_resume_profile,
+    parse_section_weights,
+)
+from backend.nlp_model.tfidf_matcher import compute_tfidf_scores
+from backend.nlp_model_stub import score_jobs
+
+RESUME_TEXT = """SUMMARY
+Data analyst building dashboards.
+
+SKILLS
+Python, SQL, Tableau
+
+EXPERIENCE
+Data Analyst, Acme (Jan 2020 - Dec 2022)
+Built SQL reports in Python.
+"""
+ANALYST_JOBS = [
+    {"title": "Data Analyst", "company": "A", "location": "Ohio",
+     "description": "SQL and Tableau dashboards", "apply_link": None},
+    {"title": "Cashier", "company": "B", "location": "Ohio",
+     "description": "Retail register", "apply_link": None},
+]
+ENGINEER_JOBS = [
+    {"title": "Data Engineer", "company": "C", "location": "Remote",
+     "description": "Python pipelines with SQL and AWS", "apply_link": None},
+]
+
+
+def test_profile_features_and_json_round_trip():
+    profile = build_resume_profile(RESUME_TEXT)
+
+    assert {"Python", "SQL", "Tableau"} <= set(profile.skills)
+    assert profile.section_term_counts["skills"]["sql"] == 1
+    assert profile.section_term_counts["experience"]["sql"] == 1
+    assert profile.resume_years == 3.0
+    assert profile.target_roles("Data Analyst")[0] == "Data Analyst"
+
+    restored = ResumeProfile.from_dict(json.loads(json.dumps(profile.to_dict())))
+    assert restored == profile
+    with pytest.raises(ValueError):
+        ResumeProfile.from_dict({**profile.to_dict(), "version": 0})
+
+
+def test_one_profile_scores_several_job_lists_like_raw_text():
+    profile = build_resume_profile(RESUME_TEXT)
+
+    for jobs in (ANALYST_JOBS, ENGINEER_JOBS):
+        from_profile = score_jobs(profile, jobs, "Data Analyst", "Ohio", "")
+        from_text = score_jobs(RESUME_TEXT, jobs, "Data Analyst", "Ohio", "")
+        assert from_profile.results == from_text.results
+
+
+def test_sparse_tfidf_matches_scikit_learn():
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    jobs = ANALYST_JOBS + ENGINEER_JOBS
+    corpus = [RESUME_TEXT] + [job["description"] for job in jobs]
+    matrix = TfidfVectorizer(token_pattern=r"[^\W_]+[+#]*").fit_transform(corpus)
+    expected = cosine_similarity(matrix[0:1], matrix[1:])[0]
+
+    assert compute_tfidf_scores(RESUME_TEXT, jobs) == pytest.approx(expected)
+
+
+def test_section_weights_favour_the_skills_section():
+    resume = "CONTACT cooking baking\n\nSKILLS\nSQL Tableau\n"
+    jobs = [{"description": "SQL Tableau reporting"}, {"description": "cooking baking chef"}]
+    profile = build_resume_profile(resume)
+
+    uniform = compute_tfidf_scores(profile, jobs, section_weights={"skills": 1.0, "other": 1.0})
+    weighted = compute_tfidf_scores(profile, jobs)
+
+    assert weighted[0] > uniform[0] and weighted[1] < uniform[1]
+    # Cosine ignores scale: one non-empty section scores the same at any weight
+    skills_only = build_resume_profile("SKILLS\nSQL Tableau")
+    assert compute_tfidf_scores(skills_only, jobs) == pytest.approx(
+        compute_tfidf_scores(skills_only, jobs, section_weights={"skills": 1.0})
+    )
+
+
+def test_parse_section_weights_overrides_defaults():
+    weights = parse_section_weights("skills=3, education=0")
+    assert weights["skills"] == 3.0 and weights["education"] == 0.0
+    assert weights["experience"] == 1.5
+    with pytest.raises(ValueError):
+        parse_section_weights("hobbies=1")
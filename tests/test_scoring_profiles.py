@@ -0,0 +1,34 @@
+"""Tests for scoring profile loading and hot reload."""
+
+import json
+import os
+
+import pytest
+
+from backend.scoring_profiles import ProfileRegistry
+
+
+def _write(path, config, mtime):
+    path.write_text(json.dumps(config), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+def test_profiles_load_and_hot_reload(tmp_path):
+    path = tmp_path / "profiles.json"
+    _write(path, {"default": "a", "profiles": {"a": {"skills": 0.5}}}, mtime=1_000)
+    registry = ProfileRegistry(str(path), reload_interval=0)
+
+    assert registry.get().name == "a"
+    assert registry.get("a").skills == 0.5
+    assert registry.get("a").semantic == 0.25  # omitted fields keep the defaults
+    assert registry.get("baseline").tfidf_multiplier == 3.0
+    with pytest.raises(ValueError, match="Unknown scoring profile"):
+        registry.get("missing")
+
+    _write(path, {"default": "b", "profiles": {"b": {"tfidf_multiplier": 2}}}, mtime=2_000)
+    assert registry.get().name == "b"
+    assert registry.names() == ["b", "baseline"]
+
+    # A broken edit is ignored and the last good profiles stay active
+    _write(path, {"profiles": {"c": {"skills": -1}}}, mtime=3_000)
+    assert registry.get().name == "b"
@@ -0,0 +1,73 @@
+"""Tests for the pluggable cross-request state store."""
+
+import pytest
+
+from backend.match_store import MatchStore
+from backend.nlp_model_stub import rescore, score_jobs
+from backend.state_store import (
+    MemoryStateStore,
+    SQLiteStateStore,
+    StateStore,
+    build_state_store,
+)
+
+
+def test_memory_store_evicts_lru_and_expires():
+    store = MemoryStateStore(max_entries=2)
+    store.set("ns", "a", 1)
+    store.set("ns", "b", 2)
+    store.get("ns", "a")
+    store.set("ns", "c", 3)
+    store.set("other", "a", "kept apart")
+    store.set("ttl", "gone", 4, ttl=-1)
+
+    assert store.get("ns", "b") is None
+    assert store.get("ns", "a") == 1
+    assert store.get("ttl", "gone") is None
+    assert store.get("other", "a") == "kept apart"
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "state.sqlite3")
+    writer, reader = SQLiteStateStore(path), SQLiteStateStore(path)
+
+    writer.set("ns", "k", {"ids": ["a", "b"]})
+    writer.set("ns", "stale", 1, ttl=-1)
+
+    assert reader.get("ns", "k") == {"ids": ["a", "b"]}
+    assert reader.get("ns", "stale") is None
+    reader.delete("ns", "k")
+    assert writer.get("ns", "k") is None
+    writer.close()
+    reader.close()
+
+
+def test_match_state_survives_another_worker(tmp_path):
+    path = str(tmp_path / "state.sqlite3")
+    jobs = [{"title": "Data Analyst", "company": "Acme", "location": "Austin, TX",
+             "description": "SQL dashboards. 2 years of experience."}]
+    state = score_jobs("SKILLS\nSQL", jobs, "Analyst", "Ohio", "0")
+
+    match_id = MatchStore(store=SQLiteStateStore(path)).put(state)
+    restored = MatchStore(store=SQLiteStateStore(path)).get(match_id)
+
+    assert restored.results == state.results
+    assert rescore(restored, location="Texas").results[0]["score"] > state.results[0]["score"]
+
+
+def test_build_state_store_parses_specs(tmp_path):
+    assert isinstance(build_state_store("memory"), MemoryStateStore)
+    store = build_state_store(f"sqlite:///{tmp_path / 'state.sqlite3'}")
+    assert isinstance(store, SQLiteStateStore)
+    assert store.path == str(tmp_path / "state.sqlite3")
+    with pytest.raises(ValueError):
+        build_state_store("postgres://db")
+
+
+def test_state_store_backends_must_implement_the_interface():
+    class Partial(StateStore):
+        def get(self, namespace, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
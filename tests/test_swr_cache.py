@@ -0,0 +1,76 @@
+"""Tests for the stale-while-revalidate cache."""
+
+import threading
+
+from backend.swr_cache import SWRCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_fresh_then_stale_served_while_single_refresh_runs():
+    clock = FakeClock()
+    cache = SWRCache("test", ttl=10, grace=100, clock=clock)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        return f"v{len(calls)}"
+
+    assert cache.get("k", loader) == "v1"
+    assert cache.get("k", loader) == "v1"  # fresh: no reload
+
+    clock.now = 50  # expired but within grace
+    assert cache.get("k", loader) == "v1"
+    assert cache.get("k", loader) == "v1"  # refresh already in flight
+    release.set()
+    cache.wait_idle(5)
+
+    assert len(calls) == 2
+    assert cache.get("k", loader) == "v2"
+
+
+def test_beyond_grace_loads_synchronously_and_skips_uncacheable():
+    clock = FakeClock()
+    cache = SWRCache("test", ttl=10, grace=5, should_cache=bool, clock=clock)
+    values = iter([["job"], [], ["new job"]])
+
+    assert cache.get("k", lambda: next(values)) == ["job"]
+    clock.now = 20
+    assert cache.get("k", lambda: next(values)) == []  # empty result not stored
+    assert len(cache) == 1
+    assert cache.get("k", lambda: next(values)) == ["new job"]
+
+
+def test_concurrent_misses_share_one_load():
+    cache = SWRCache("test", ttl=10, grace=0)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    results = []
+    first = threading.Thread(target=lambda: results.append(cache.get("k", loader)))
+    first.start()
+    started.wait(5)
+    second = threading.Thread(target=lambda: results.append(cache.get("k", loader)))
+    second.start()
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert results == ["value", "value"]
+    assert len(calls) == 1
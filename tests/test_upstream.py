@@ -0,0 +1,197 @@
+"""Tests for the rate-limited, retrying upstream client."""
+
+import pytest
+import requests
+
+from backend import job_fetcher
+from backend.deadline import Deadline
+from backend.job_sources import JobSourceError, RapidAPIJobSource, set_job_source
+from backend.upstream import (
+    BudgetExceededError,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitedError,
+    TokenBucket,
+    UpstreamClient,
+    UpstreamError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload if payload is not None else {"data": []}
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Returns queued responses (or raises queued exceptions) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        assert timeout is not None
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class SlowSession:
+    """An upstream that never answers: every call runs into its read timeout."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.timeouts = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        self.timeouts.append(timeout)
+        self.clock.now += timeout[1]
+        raise requests.ReadTimeout("read timed out")
+
+
+def _client(session, clock, **kwargs):
+    options = dict(rate_per_sec=1, burst=2, max_wait=5, max_retries=3,
+                   backoff_base=0.5, backoff_max=8)
+    options.update(kwargs)
+    return UpstreamClient("test", session=session, sleep=clock.sleep, clock=clock, **options)
+
+
+def test_token_bucket_paces_bursts():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    bucket.block_for(10)
+    assert bucket.reserve() >= 10
+
+
+def test_retries_transient_failures_and_honours_retry_after():
+    clock = FakeClock()
+    session = FakeSession(
+        requests.ConnectionError("reset"),
+        FakeResponse(429, headers={"Retry-After": "3"}),
+        FakeResponse(200, {"data": [1]}, {"X-RateLimit-Requests-Remaining": "41"}),
+    )
+    client = _client(session, clock)
+
+    assert client.get_json("http://upstream") == {"data": [1]}
+    assert session.calls == 3
+    assert clock.now >= 3  # waited out Retry-After
+    assert client.quota == {"remaining": 41}
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_client_errors_are_not_retried():
+    clock = FakeClock()
+    session = FakeSession(FakeResponse(403), FakeResponse(200))
+    with pytest.raises(UpstreamError):
+        _client(session, clock).get_json("http://upstream")
+    assert session.calls == 1
+
+
+def test_breaker_opens_then_probes_after_reset():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    session = FakeSession(FakeResponse(503), FakeResponse(503), FakeResponse(200))
+    client = _client(session, clock, breaker=breaker)
+
+    with pytest.raises(CircuitOpenError):
+        client.get_json("http://upstream")
+    assert session.calls == 2 and breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        client.get_json("http://upstream")
+    assert session.calls == 2  # failed fast
+
+    clock.now += 30
+    assert client.get_json("http://upstream") == {"data": []}
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_recovers_after_a_client_error_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    session = FakeSession(FakeResponse(503), FakeResponse(503), FakeResponse(401),
+                          FakeResponse(200))
+    client = _client(session, clock, breaker=breaker)
+
+    with pytest.raises(CircuitOpenError):
+        client.get_json("http://upstream")
+    clock.now += 30
+    with pytest.raises(UpstreamError):
+        client.get_json("http://upstream")  # the half-open probe gets a 401
+    assert breaker.state == CircuitBreaker.OPEN
+
+    assert client.get_json("http://upstream") == {"data": []}  # probed again, not stuck
+    assert session.calls == 4 and breaker.state == CircuitBreaker.CLOSED
+
+
+def test_rate_limited_when_wait_exceeds_budget():
+    clock = FakeClock()
+    client = _client(FakeSession(), clock, max_wait=1)
+    client.bucket.block_for(60)
+    with pytest.raises(RateLimitedError):
+        client.get_json("http://upstream")
+
+
+def test_rapidapi_source_serves_last_good_response_on_failure():
+    clock = FakeClock()
+    session = FakeSession(
+        FakeResponse(200, {"data": ["fresh"]}), FakeResponse(500), FakeResponse(500)
+    )
+    source = RapidAPIJobSource("key", "host", client=_client(session, clock, max_retries=0))
+    params = {"query": "Data Scientist", "page": 1}
+
+    assert source.search(params) == {"data": ["fresh"]}
+    assert source.search(params) == {"data": ["fresh"]}  # stale fallback
+    with pytest.raises(JobSourceError):
+        source.search({"query": "never fetched"})
+
+
+def test_budget_caps_attempt_timeouts_and_stops_retries():
+    clock = FakeClock()
+    session = SlowSession(clock)
+    client = _client(session, clock, timeout=(3.05, 10))
+
+    with pytest.raises(BudgetExceededError):
+        client.get_json("http://upstream", budget=12)
+
+    # One full 10 s attempt, then a retry capped to what was left
+    assert clock.now <= 12
+    assert session.timeouts[0] == (3.05, 10) and len(session.timeouts) == 2
+    assert session.timeouts[1][1] < 2
+    assert client.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_slow_page_degrades_fetch_with_timeout():
+    clock = FakeClock()
+    client = _client(SlowSession(clock), clock, timeout=(3.05, 10))
+    set_job_source(RapidAPIJobSource("key", "host", client=client))
+    deadline = Deadline(20, clock=clock)
+    try:
+        jobs = job_fetcher.fetch_jobs_from_api("Analyst", "Ohio", deadline)
+    finally:
+        set_job_source(None)
+
+    assert jobs == [] and isinstance(jobs, job_fetcher.PartialJobList)
+    assert deadline.degraded == {"fetch": "timeout"}
+    assert clock.now <= 20